@@ -0,0 +1,26 @@
+# ============================================
+# PAGE REGISTRY
+# Each page is a module with render(data); only the page being shown is imported
+# ============================================
+
+import importlib
+import time
+
+PAGES = {
+    '🏠 Home': 'app_pages.home',
+    '📅 Workout Calendar': 'app_pages.workout_calendar',
+    '💪 Workout Programs': 'app_pages.programs',
+    '📚 Exercise Library': 'app_pages.library',
+    '🎬 My Collection': 'app_pages.collection',
+}
+
+def render_page(page, data):
+    """Import the page module on first use and render it; returns import/render timings in ms"""
+    start = time.perf_counter()
+    module = importlib.import_module(PAGES.get(page, PAGES['🏠 Home']))
+    loaded = time.perf_counter()
+    module.render(data)
+    return {
+        'import_ms': (loaded - start) * 1000,
+        'render_ms': (time.perf_counter() - loaded) * 1000,
+    }
@@ -0,0 +1,225 @@
+# ============================================
+# MY COLLECTION PAGE
+# Saved workout videos, single and bulk import
+# ============================================
+
+import streamlit as st
+
+import utils
+import media
+
+def render(data):
+    """Render the page from this rerun's data snapshot"""
+    st.markdown('<h1 class="main-header">🎬 MY COLLECTION</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">YOUR SAVED WORKOUT VIDEOS</p>', unsafe_allow_html=True)
+    
+    # Add Workout Section
+    st.markdown("## ➕ Add New Video")
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        url_input = st.text_input("🔗 YouTube URL", placeholder="Paste video link here...")
+    with col2:
+        category_input = st.selectbox(
+            "📂 Category", 
+            ["💪 Strength", "❤️ Cardio", "🧘 Yoga", "🩰 Pilates", "💃 Dance", "🏃 HIIT", "🧘‍♀️ Stretching"]
+        )
+    
+    clean_category = category_input.split(" ", 1)[1] if " " in category_input else category_input
+    
+    if st.button("✨ Add to Collection", use_container_width=True):
+        if url_input and utils.has_video(url_input):
+            st.warning("💡 This video is already in your collection!")
+        elif url_input:
+            with st.spinner("🔮 Fetching video magic..."):
+                success = utils.add_workout(url_input, clean_category)
+                if success:
+                    st.success("🎉 Workout added successfully!")
+                    st.balloons()
+                    st.rerun()
+                else:
+                    st.error("❌ Couldn't find the video. Please check the URL.")
+        else:
+            st.warning("⚠️ Please paste a YouTube URL first!")
+    
+    with st.expander("📥 Import Several Videos at Once"):
+        bulk_input = st.text_area("🔗 YouTube URLs", placeholder="One link per line...", key="bulk_urls")
+        if st.button("🚀 Import All", use_container_width=True, key="bulk_import_btn"):
+            bulk_urls = [line for line in bulk_input.splitlines() if line.strip()]
+            if bulk_urls:
+                status_icons = {'added': '✅', 'duplicate': '💡', 'failed': '❌'}
+                progress = st.progress(0.0, text="🔮 Fetching video magic...")
+                added = 0
+                # Results stream in as each video's details arrive
+                for done, result in enumerate(utils.add_workouts_batch(bulk_urls, clean_category), start=1):
+                    added += result['status'] == 'added'
+                    st.markdown(f"{status_icons[result['status']]} {result['title'] or result['url']}")
+                    progress.progress(done / len(bulk_urls), text=f"{done}/{len(bulk_urls)} videos processed")
+                st.success(f"🎉 {added} new workout{'s' if added != 1 else ''} added to your collection!")
+                data.forget('workouts')
+            else:
+                st.warning("⚠️ Please paste at least one YouTube URL first!")
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Load Data
+    category_counts = data.video_counts
+    total = sum(category_counts.values())
+    
+    # Stats Section
+    if total:
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class="stat-card">
+                <div class="stat-number">{total}</div>
+                <div class="stat-label">Total Videos</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            strength_count = category_counts.get('Strength', 0)
+            st.markdown(f"""
+            <div class="stat-card">
+                <div class="stat-number">{strength_count}</div>
+                <div class="stat-label">💪 Strength</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            cardio_count = category_counts.get('Cardio', 0)
+            st.markdown(f"""
+            <div class="stat-card">
+                <div class="stat-number">{cardio_count}</div>
+                <div class="stat-label">❤️ Cardio</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            yoga_count = category_counts.get('Yoga', 0) + category_counts.get('Pilates', 0)
+            st.markdown(f"""
+            <div class="stat-card">
+                <div class="stat-number">{yoga_count}</div>
+                <div class="stat-label">🧘 Mind & Body</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Section Title
+    st.markdown("## 🎬 Your Workout Videos")
+    
+    # Category Filter - applied in the query, together with the page size
+    category = None
+    matching = total
+    if total:
+        filter_col, size_col = st.columns([3, 1])
+        with filter_col:
+            selected_category = st.selectbox("🔍 Filter by Category", ["All"] + list(category_counts), key="filter")
+        with size_col:
+            page_size = st.selectbox("📄 Per Page", utils.COLLECTION_PAGE_SIZES, key="collection_page_size")
+        
+        if selected_category != "All":
+            category = selected_category
+            matching = category_counts.get(category, 0)
+    
+    # If empty, show instructions and starter videos option
+    if not matching:
+        st.markdown("""
+        <div style="text-align: center; padding: 40px 20px; background: linear-gradient(135deg, rgba(0, 180, 216, 0.05), rgba(0, 119, 182, 0.1)); border-radius: 20px; border: 1px dashed rgba(0, 212, 255, 0.3);">
+            <div style="font-size: 4rem; margin-bottom: 20px;">🏋️‍♀️</div>
+            <h3 style="color: #caf0f8; font-family: 'Orbitron', sans-serif;">No Workouts Yet!</h3>
+            <p style="color: #90e0ef; font-family: 'Rajdhani', sans-serif; font-size: 1.1rem;">
+                Start building your collection by adding your favorite workout videos above!
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Option to load starter videos
+        st.markdown("### ✨ Or Get Started with Our Curated Collection!")
+        st.markdown("*We've handpicked 12 amazing workout videos from top fitness creators to help you start your journey!*")
+        
+        if st.button("🚀 Load Starter Workout Collection", use_container_width=True):
+            with st.spinner("✨ Loading your starter collection..."):
+                utils.seed_starter_videos()
+                st.success("🎉 12 curated workout videos have been added to your collection!")
+                st.balloons()
+                st.rerun()
+        
+        # Show preview of starter videos
+        st.markdown("### 🎬 Preview of Starter Collection")
+        starter_videos = utils.get_starter_videos()
+        
+        cols = st.columns(4)
+        for idx, video in enumerate(starter_videos[:4]):
+            with cols[idx]:
+                st.markdown(f"""
+                <div class="workout-card" style="padding: 10px;">
+                    <img src="{media.media_url(video['thumbnail'], media.THUMBNAIL_WIDTH)}" loading="lazy" style="width: 100%; border-radius: 10px; opacity: 0.8;">
+                    <p style="color: #90e0ef; font-size: 0.8rem; margin-top: 8px; text-align: center;">{video['title'][:30]}...</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # DISPLAY AS GRID (3 Cards per row), one page at a time
+    else:
+        page_count = -(-matching // page_size)
+        # Start from the first page whenever the filter or page size changes
+        if st.session_state.get('collection_view') != (category, page_size):
+            st.session_state.collection_view = (category, page_size)
+            st.session_state.collection_page = 0
+        page = min(st.session_state.collection_page, page_count - 1)
+        
+        def turn_page(step):
+            st.session_state.collection_page = page + step
+        
+        videos = data.workouts_page(page, page_size, category).to_dict('records')
+        
+        category_emojis = {
+            'Strength': '💪', 'Cardio': '❤️', 'Yoga': '🧘',
+            'Pilates': '🩰', 'Dance': '💃', 'HIIT': '🏃', 'Stretching': '🧘‍♀️'
+        }
+        
+        for i in range(0, len(videos), 3):
+            cols = st.columns(3, gap="medium")
+            for j, row in enumerate(videos[i:i + 3]):
+                with cols[j]:
+                    st.markdown('<div class="workout-card">', unsafe_allow_html=True)
+                    # Small thumbnail, fetched by the browser only when the card scrolls into view
+                    thumbnail = media.media_url(utils.get_thumbnail_url(row.get('video_id'), row['thumbnail']),
+                                                media.THUMBNAIL_WIDTH)
+                    st.markdown(f"""
+                    <img src="{thumbnail}" loading="lazy" decoding="async" alt="" style="width: 100%; aspect-ratio: 16 / 9; object-fit: cover; border-radius: 10px;">
+                    """, unsafe_allow_html=True)
+                    
+                    title = row['title']
+                    if len(title) > 50:
+                        title = title[:47] + "..."
+                    st.markdown(f"### {title}")
+                    
+                    emoji = category_emojis.get(row['category'], '🎯')
+                    
+                    st.markdown(f"""
+                    <span class="category-badge">{emoji} {row['category']}</span>
+                    <p class="channel-name">📺 {row['channel']}</p>
+                    """, unsafe_allow_html=True)
+                    
+                    if st.button(f"▶️ Watch Now", key=f"btn_{row.get('id', i + j)}", use_container_width=True):
+                        st.video(row['url'])
+                    
+                    st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Pager
+        if page_count > 1:
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("◀️ Previous", key="collection_prev", on_click=turn_page, args=(-1,),
+                          disabled=page == 0, use_container_width=True)
+            with info_col:
+                st.markdown(f"<p style='text-align: center; color: #90e0ef;'>Page {page + 1} of {page_count} · {matching} videos</p>",
+                            unsafe_allow_html=True)
+            with next_col:
+                st.button("Next ▶️", key="collection_next", on_click=turn_page, args=(1,),
+                          disabled=page >= page_count - 1, use_container_width=True)
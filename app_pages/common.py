@@ -0,0 +1,55 @@
+# ============================================
+# SHARED PAGE HELPERS
+# Navigation and widgets used by app.py and more than one page
+# ============================================
+
+import streamlit as st
+
+import media
+import utils
+
+# --- NAVIGATION WITH QUERY PARAMS (for native back gesture support) ---
+PAGE_MAPPING = {
+    'home': '🏠 Home',
+    'calendar': '📅 Workout Calendar',
+    'programs': '💪 Workout Programs',
+    'library': '📚 Exercise Library',
+    'collection': '🎬 My Collection'
+}
+
+PAGE_REVERSE_MAPPING = {v: k for k, v in PAGE_MAPPING.items()}
+
+def get_current_page_from_url():
+    """Read page from URL query params - home is default"""
+    params = st.query_params
+    page_key = params.get('page', 'home')
+    return PAGE_MAPPING.get(page_key, '🏠 Home')
+
+def navigate_to(page_name):
+    """Navigate to a new page using query params (creates browser history)"""
+    page_key = PAGE_REVERSE_MAPPING.get(page_name, 'home')
+    st.query_params.clear()
+    st.query_params['page'] = page_key
+    st.rerun()
+
+def go_back():
+    """Go back to home page"""
+    st.query_params.clear()
+    st.query_params['page'] = 'home'
+    st.rerun()
+
+# --- EXERCISE GIF VIEWER COMPONENT ---
+def render_exercise_demo(exercise_name="Exercise", exercise_type="general"):
+    """Render an animated GIF demonstration of the exercise"""
+    
+    # Resolved through the shared exercise media index, then served from the local media cache
+    gif_url = media.media_url(utils.get_exercise_media(exercise_name, exercise_type)['gif_url'], media.DEMO_WIDTH)
+    
+    # Render the exercise demo card
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, rgba(0, 30, 60, 0.9) 0%, rgba(0, 60, 90, 0.8) 100%); border-radius: 15px; border: 2px solid rgba(0, 212, 255, 0.3); padding: 15px; box-shadow: 0 0 30px rgba(0, 212, 255, 0.2);">
+        <div style="text-align: center; font-family: 'Orbitron', sans-serif; color: #00d4ff; margin-bottom: 10px; font-size: 1.1rem;">🏃‍♀️ {exercise_name}</div>
+        <img src="{gif_url}" alt="{exercise_name} demonstration" style="width: 100%; max-height: 300px; object-fit: contain; border-radius: 10px; background: rgba(0,0,0,0.3);">
+        <div style="text-align: center; color: #90e0ef; font-size: 0.85rem; margin-top: 10px; font-family: 'Rajdhani', sans-serif;">Watch the form carefully and match the movement</div>
+    </div>
+    """, unsafe_allow_html=True)
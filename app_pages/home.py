@@ -0,0 +1,204 @@
+# ============================================
+# HOME PAGE
+# Today at a glance: streak, weekly strip and today's workouts
+# ============================================
+
+import random
+from datetime import datetime
+
+import streamlit as st
+
+import utils
+from app_pages.common import navigate_to
+
+# --- MOTIVATIONAL QUOTES ---
+quotes = [
+    ("The only bad workout is the one that didn't happen.", "Unknown"),
+    ("Strong is the new beautiful.", "Unknown"),
+    ("Your body can stand almost anything. It's your mind you have to convince.", "Unknown"),
+    ("Sweat is just fat crying.", "Unknown"),
+    ("The pain you feel today will be the strength you feel tomorrow.", "Unknown"),
+    ("Fitness is not about being better than someone else. It's about being better than you used to be.", "Unknown"),
+    ("She believed she could, so she did.", "R.S. Grey"),
+    ("The future belongs to those who believe in the beauty of their dreams.", "Eleanor Roosevelt"),
+    ("A year from now, you'll wish you had started today.", "Karen Lamb"),
+    ("Strong women lift each other up.", "Unknown"),
+]
+
+def render(data):
+    """Render the page from this rerun's data snapshot"""
+    # Header
+    st.markdown('<h1 class="main-header">💎 JADE FITNESS HUB 💎</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">YOUR PERSONAL WORKOUT SANCTUARY</p>', unsafe_allow_html=True)
+    
+    # Welcome Banner with Quote
+    quote, author = random.choice(quotes)
+    st.markdown(f"""
+    <div class="welcome-banner">
+        <p class="welcome-text">Welcome back, <span class="jade-name">Jade</span>! Ready to crush your goals today? 💪</p>
+        <div class="quote-box">
+            <p class="quote-text">"{quote}"</p>
+            <p class="quote-author">— {author}</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # 🔥 STREAK DISPLAY
+    streak_data = data.streak
+    current_streak = streak_data['current_streak']
+    best_streak = streak_data['best_streak']
+    streak_status = streak_data['streak_status']
+    
+    # Determine streak message and flame animation
+    if current_streak >= 7:
+        flame_emoji = "🔥🔥🔥"
+        streak_badge = "UNSTOPPABLE!"
+    elif current_streak >= 3:
+        flame_emoji = "🔥🔥"
+        streak_badge = "ON FIRE!"
+    elif current_streak >= 1:
+        flame_emoji = "🔥"
+        streak_badge = "KEEP GOING!"
+    else:
+        flame_emoji = "💪"
+        streak_badge = "START TODAY!"
+    
+    # Streak status message
+    if streak_status == 'completed_today':
+        status_msg = "✅ Today's workout complete!"
+    elif streak_status == 'pending_today':
+        status_msg = "⏳ Complete today's workout to keep your streak!"
+    elif streak_status == 'at_risk':
+        status_msg = "⚠️ Don't break your streak - workout today!"
+    else:
+        status_msg = "Start a new streak today!"
+    
+    col_streak1, col_streak2 = st.columns([2, 1])
+    
+    with col_streak1:
+        st.markdown(f"""
+        <div class="streak-container">
+            <div class="streak-flames">{flame_emoji}</div>
+            <div class="streak-number">{current_streak}</div>
+            <div class="streak-label">DAY STREAK</div>
+            <div class="streak-badge">{streak_badge}</div>
+            <p style="color: #ffcc80; font-size: 0.85rem; margin-top: 10px; position: relative; z-index: 1;">{status_msg}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_streak2:
+        st.markdown(f"""
+        <div style="background: rgba(0, 119, 182, 0.1); border: 1px solid rgba(0, 212, 255, 0.2); border-radius: 15px; padding: 15px; text-align: center; height: 100%;">
+            <div style="margin-bottom: 15px;">
+                <div style="font-family: 'Orbitron', sans-serif; font-size: 1.8rem; color: #00d4ff;">🏆 {best_streak}</div>
+                <div style="font-family: 'Rajdhani', sans-serif; color: #90e0ef; font-size: 0.75rem; text-transform: uppercase;">Best Streak</div>
+            </div>
+            <div>
+                <div style="font-family: 'Orbitron', sans-serif; font-size: 1.8rem; color: #00ff88;">{streak_data['total_completed']}</div>
+                <div style="font-family: 'Rajdhani', sans-serif; color: #90e0ef; font-size: 0.75rem; text-transform: uppercase;">Total Completed</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Today's Workout Section (today's plan and the weekly overview share one query)
+    today_workouts = data.today_workouts
+    
+    st.markdown("## 📅 Today's Workout Plan")
+    st.markdown(f"*{datetime.now().strftime('%A, %B %d, %Y')}*")
+    
+    if today_workouts:
+        for idx, workout in enumerate(today_workouts):
+            completed = workout.get('completed', False)
+            status_icon = "✅" if completed else "⏳"
+            st.markdown(f"""
+            <div class="exercise-row" style="{'opacity: 0.6;' if completed else ''}">
+                <span class="exercise-name">{status_icon} {workout.get('name', 'Workout')}</span>
+                <span class="exercise-details">{workout.get('type', 'General')} • {workout.get('duration', '30 min')}</span>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            col1, col2 = st.columns([3, 1])
+            with col2:
+                if st.button("✓ Complete" if not completed else "↩ Undo", key=f"complete_{idx}"):
+                    utils.mark_workout_complete_by_id(workout['id'], not completed)
+                    st.rerun()
+    else:
+        st.info("💡 No workouts scheduled for today. Head to the Calendar to plan your workout!")
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Quick Actions
+    st.markdown("## ⚡ Quick Actions")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="action-card">
+            <div style="font-size: 3rem; margin-bottom: 10px;">📅</div>
+            <h4 style="color: #00d4ff; margin: 10px 0;">Plan</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.button("Plan", key="nav_calendar", use_container_width=True):
+            navigate_to("📅 Workout Calendar")
+    
+    with col2:
+        st.markdown("""
+        <div class="action-card">
+            <div style="font-size: 3rem; margin-bottom: 10px;">💪</div>
+            <h4 style="color: #00d4ff; margin: 10px 0;">Progs</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.button("Progs", key="nav_programs", use_container_width=True):
+            navigate_to("💪 Workout Programs")
+    
+    with col3:
+        st.markdown("""
+        <div class="action-card">
+            <div style="font-size: 3rem; margin-bottom: 10px;">🎬</div>
+            <h4 style="color: #00d4ff; margin: 10px 0;">Vids</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.button("Vids", key="nav_collection", use_container_width=True):
+            navigate_to("🎬 My Collection")
+    
+    with col4:
+        st.markdown("""
+        <div class="action-card">
+            <div style="font-size: 3rem; margin-bottom: 10px;">📚</div>
+            <h4 style="color: #00d4ff; margin: 10px 0;">Lib</h4>
+        </div>
+        """, unsafe_allow_html=True)
+        if st.button("Lib", key="nav_library", use_container_width=True):
+            navigate_to("📚 Exercise Library")
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Weekly Overview
+    st.markdown("## 📊 This Week's Progress")
+    
+    week_cols = st.columns(7)
+    days_of_week = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    
+    for i, (day_col, day_summary) in enumerate(zip(week_cols, data.weekly_summary)):
+        day_date = day_summary['date']
+        is_today = day_date == data.today
+        
+        completed_count = day_summary['completed']
+        total_count = day_summary['total']
+        
+        with day_col:
+            bg_color = "rgba(0, 212, 255, 0.2)" if is_today else "rgba(0, 119, 182, 0.1)"
+            border_color = "#00d4ff" if is_today else "rgba(0, 212, 255, 0.2)"
+            
+            status_emoji = "✅" if completed_count == total_count and total_count > 0 else ("🏃" if total_count > 0 else "")
+            
+            st.markdown(f"""
+            <div style="text-align: center; padding: 15px; background: {bg_color}; border-radius: 15px; border: 1px solid {border_color};">
+                <div style="font-family: 'Rajdhani', sans-serif; color: #90e0ef; font-size: 0.8rem;">{days_of_week[i]}</div>
+                <div style="font-family: 'Orbitron', sans-serif; color: {'#00d4ff' if is_today else '#caf0f8'}; font-size: 1.3rem; font-weight: bold;">{day_date.day}</div>
+                <div style="font-size: 1.2rem; margin-top: 5px;">{status_emoji}</div>
+                <div style="color: #48cae4; font-size: 0.7rem;">{f'{completed_count}/{total_count}' if total_count > 0 else '-'}</div>
+            </div>
+            """, unsafe_allow_html=True)
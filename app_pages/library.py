@@ -0,0 +1,212 @@
+# ============================================
+# EXERCISE LIBRARY PAGE
+# Searchable exercise catalogue with animated demos
+# ============================================
+
+import streamlit as st
+
+import media
+import utils
+
+from exercise_library import (
+    EXERCISE_LIBRARY, EXERCISE_CATEGORIES, DIFFICULTY_LEVELS,
+    filter_exercises, get_all_muscle_groups, get_all_equipment
+)
+from app_pages.common import render_exercise_demo
+
+def render(data):
+    """Render the page from this rerun's data snapshot"""
+    st.markdown('<h1 class="main-header">📚 EXERCISE LIBRARY</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">LEARN PROPER FORM WITH GIF DEMONSTRATIONS</p>', unsafe_allow_html=True)
+    
+    # Search and Filter Section
+    # Results and facet counts come from one call, using the widget values of this rerun
+    state = st.session_state
+    exercises, facet_counts = filter_exercises(
+        state.get('exercise_search', ''), state.get('exercise_category', 'All'),
+        state.get('exercise_difficulty', 'All'), state.get('exercise_muscle', 'All'),
+        state.get('exercise_equipment', 'All')
+    )
+    
+    def facet_caption(field, options, shown=5):
+        # Counts stay out of the option labels, which older Streamlit releases
+        # hash into the widget id (a changing label would reset the selection)
+        counts = sorted(((facet_counts[field].get(value, 0), value) for value in options if value != "All"),
+                        key=lambda item: -item[0])
+        matching = [f"{value} {count}" for count, value in counts if count]
+        more = f" · +{len(matching) - shown} more" if len(matching) > shown else ""
+        st.caption(" · ".join(matching[:shown]) + more if matching else "No matches")
+    
+    muscle_groups = ["All"] + get_all_muscle_groups()
+    equipment = ["All"] + get_all_equipment()
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        st.text_input("🔍 Search exercises", placeholder="Search by name, muscle or equipment...", key="exercise_search")
+    with col2:
+        st.selectbox("📂 Category", EXERCISE_CATEGORIES, key="exercise_category")
+        facet_caption("category", EXERCISE_CATEGORIES)
+    with col3:
+        st.selectbox("📊 Difficulty", DIFFICULTY_LEVELS, key="exercise_difficulty")
+        facet_caption("difficulty", DIFFICULTY_LEVELS)
+    
+    col4, col5 = st.columns(2)
+    with col4:
+        st.selectbox("🎯 Muscle Group", muscle_groups, key="exercise_muscle")
+        facet_caption("muscle_groups", muscle_groups)
+    with col5:
+        st.selectbox("🏋️ Equipment", equipment, key="exercise_equipment")
+        facet_caption("equipment", equipment)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Display exercise count
+    st.markdown(f"### 💪 {len(exercises)} Exercises Found")
+    
+    # Initialize selected exercise in session state
+    if 'selected_exercise' not in st.session_state:
+        st.session_state.selected_exercise = None
+    
+    # Display exercise list or selected exercise
+    if st.session_state.selected_exercise is None:
+        # Display exercise cards in grid
+        exercise_list = list(exercises.items())
+        
+        for i in range(0, len(exercise_list), 3):
+            cols = st.columns(3)
+            for j in range(3):
+                if i + j < len(exercise_list):
+                    key, exercise = exercise_list[i + j]
+                    with cols[j]:
+                        # Exercise card
+                        st.markdown(f"""
+                        <div class="program-card" style="text-align: center; min-height: 320px;">
+                            <div style="font-size: 2rem; margin-bottom: 10px;">
+                                {'🦵' if exercise['category'] == 'Lower Body' else '💪' if exercise['category'] == 'Upper Body' else '🎯' if exercise['category'] == 'Core' else '❤️' if exercise['category'] == 'Cardio' else '🧘'}
+                            </div>
+                            <div class="program-title" style="font-size: 1.1rem;">{exercise['name']}</div>
+                            <div class="program-meta" style="justify-content: center; margin: 10px 0;">
+                                <span class="program-tag">{exercise['category']}</span>
+                                <span class="program-tag">{exercise['difficulty']}</span>
+                            </div>
+                            <p style="color: #90e0ef; font-size: 0.85rem; margin: 10px 0;">
+                                {', '.join(exercise['muscle_groups'][:3])}
+                            </p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                        
+                        if st.button(f"📖 View Exercise", key=f"view_ex_{key}", use_container_width=True):
+                            st.session_state.selected_exercise = key
+                            st.rerun()
+    
+    else:
+        # Display selected exercise details
+        exercise = EXERCISE_LIBRARY[st.session_state.selected_exercise]
+        
+        # Back button - more prominent
+        col_back, col_title = st.columns([1, 4])
+        with col_back:
+            if st.button("⬅️ Back", key="back_exercises", use_container_width=True, type="secondary"):
+                st.session_state.selected_exercise = None
+                st.rerun()
+        with col_title:
+            st.markdown(f"## {exercise['name']}")
+        
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # Exercise header
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.markdown(f"""
+            <div class="program-meta">
+                <span class="program-tag">{exercise['category']}</span>
+                <span class="program-tag">{exercise['difficulty']}</span>
+                <span class="program-tag">{exercise['equipment']}</span>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown(f"**Muscle Groups:** {', '.join(exercise['muscle_groups'])}")
+            st.markdown(f"**Recommended:** {exercise['sets_range']} sets × {exercise['reps_range']}")
+        
+        with col2:
+            # Display GIF
+            st.markdown("### 🎬 Demo")
+            gif_url = media.media_url(utils.get_exercise_media(exercise['name'])['gif_url'], media.DEMO_WIDTH)
+            st.markdown(f'<img src="{gif_url}" alt="{exercise["name"]} demonstration" '
+                        f'style="width: 100%; border-radius: 10px;">', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # Instructions tabs - now with 3D View
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["📋 Instructions", "🎮 3D View", "⚠️ Common Mistakes", "💡 Tips", "🎬 Video"])
+        
+        with tab1:
+            st.markdown("### Setup")
+            st.markdown(f"*{exercise['instructions']['setup']}*")
+            
+            st.markdown("### Step-by-Step Execution")
+            for i, step in enumerate(exercise['instructions']['execution'], 1):
+                st.markdown(f"""
+                <div class="exercise-row">
+                    <span class="exercise-name">Step {i}</span>
+                    <span class="exercise-details">{step}</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown("### Breathing")
+            st.info(f"🫁 {exercise['instructions']['breathing']}")
+        
+        with tab2:
+            st.markdown("### 🎬 Exercise Demonstration")
+            st.markdown("*Watch the animated GIF to learn proper form!*")
+            
+            # Render the exercise GIF demo
+            render_exercise_demo(
+                exercise_name=exercise['name'],
+                exercise_type=exercise.get('category', 'general')
+            )
+            
+            st.markdown("""
+            <div style="background: rgba(0, 119, 182, 0.1); border: 1px solid rgba(0, 212, 255, 0.2); border-radius: 10px; padding: 15px; margin-top: 15px;">
+                <h4 style="color: #00d4ff; margin-top: 0;">💡 Tips</h4>
+                <ul style="color: #90e0ef; margin-bottom: 0;">
+                    <li><strong>Focus:</strong> Watch the movement pattern carefully</li>
+                    <li><strong>Form:</strong> Match your body position to the demo</li>
+                    <li><strong>Pace:</strong> Start slow, then match the rhythm</li>
+                    <li><strong>Mirror:</strong> Practice in front of a mirror</li>
+                </ul>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with tab3:
+            st.markdown("### Common Mistakes & Fixes")
+            for mistake in exercise['instructions']['common_mistakes']:
+                parts = mistake.split(" - ")
+                if len(parts) == 2:
+                    st.markdown(f"""
+                    <div style="background: rgba(255, 107, 107, 0.1); border-left: 3px solid #ff6b6b; padding: 10px 15px; margin: 10px 0; border-radius: 0 10px 10px 0;">
+                        <strong style="color: #ff6b6b;">❌ {parts[0]}</strong><br>
+                        <span style="color: #90e0ef;">✅ Fix: {parts[1]}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.warning(f"⚠️ {mistake}")
+        
+        with tab4:
+            st.markdown("### Pro Tips")
+            st.success(f"💡 {exercise['instructions']['tips']}")
+            
+            # Muscle target visualization
+            st.markdown("### Muscles Targeted")
+            for muscle in exercise['muscle_groups']:
+                st.progress(0.8, text=f"💪 {muscle}")
+        
+        with tab5:
+            st.markdown("### Video Demonstration")
+            if exercise.get('video_url'):
+                if st.button("▶️ Watch Tutorial Video", use_container_width=True):
+                    st.video(exercise['video_url'])
+            else:
+                st.info("Video coming soon!")
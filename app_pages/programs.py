@@ -0,0 +1,237 @@
+# ============================================
+# WORKOUT PROGRAMS PAGE
+# Curated multi-week programs and their schedules
+# ============================================
+
+import streamlit as st
+
+import utils
+
+def exercise_rows_html(exercises):
+    """One day's exercises as a single block of exercise rows"""
+    rows = []
+    for exercise in exercises.itertuples():
+        if exercise.sets == 0:
+            # Sub-item (like circuit details)
+            rows.append(f"<div style='color: #90e0ef; margin-left: 20px;'>{exercise.name}</div>")
+        else:
+            rest_info = f" | Rest: {exercise.rest}" if exercise.rest else ""
+            rows.append(f"""
+            <div class="exercise-row">
+                <span class="exercise-name">{exercise.name}</span>
+                <span class="exercise-details">{exercise.sets} sets × {exercise.reps}{rest_info}</span>
+            </div>""")
+    return "".join(rows)
+
+def render_schedule(program_id, program, profile):
+    """Render the schedule block picked with the phase/week selectors"""
+    sessions = profile['sessions']
+    blocks = list(dict.fromkeys(zip(sessions['phase'], sessions['week'])))
+    phases = list(dict.fromkeys(phase for phase, _ in blocks))
+    
+    phase = phases[0]
+    if len(phases) > 1:
+        phase = st.selectbox("🚀 Phase", phases, key=f"schedule_phase_{program_id}")
+        phase_data = program['phases'][phase]
+        st.markdown(f"**Focus:** {phase_data['focus']}  \n**Intensity:** {phase_data['intensity']}")
+    
+    weeks = [week for block_phase, week in blocks if block_phase == phase]
+    week = weeks[0]
+    if len(weeks) > 1:
+        week = st.radio("📅 Weeks", weeks, key=f"schedule_week_{program_id}_{phase}", horizontal=True)
+    
+    shown = sessions[(sessions['phase'] == phase) & (sessions['week'] == week)]
+    exercises = profile['exercises']
+    by_session = exercises[exercises['session'].isin(shown['session'])].groupby('session')
+    for session in shown.itertuples():
+        title = session.day if session.focus in session.day else f"{session.day} - {session.focus}"
+        with st.expander(f"**{title}** · ~{session.minutes} min", expanded=False):
+            if session.session in by_session.groups:
+                st.markdown(exercise_rows_html(by_session.get_group(session.session)), unsafe_allow_html=True)
+
+def render(data):
+    """Render the page from this rerun's data snapshot"""
+    st.markdown('<h1 class="main-header">💪 WORKOUT PROGRAMS</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">CURATED PROGRAMS FOR WOMEN</p>', unsafe_allow_html=True)
+    
+    programs = utils.get_workout_programs()
+    
+    # Program Selection
+    if 'selected_program' not in st.session_state:
+        st.session_state.selected_program = None
+    
+    # Show program list if no program selected
+    if st.session_state.selected_program is None:
+        st.markdown("## 🎯 Choose Your Program")
+        
+        # Display program cards in a cleaner layout
+        for program_id, program in programs.items():
+            with st.container():
+                st.markdown(f"""
+                <div class="program-card" style="margin-bottom: 15px;">
+                    <div class="program-title">{program['name']}</div>
+                    <p style="color: #caf0f8; font-family: 'Rajdhani', sans-serif; margin: 10px 0;">{program['description']}</p>
+                    <div class="program-meta">
+                        <span class="program-tag">📅 {program['duration']}</span>
+                        <span class="program-tag">📊 {program['level']}</span>
+                        <span class="program-tag">🎯 {program['goal']}</span>
+                        <span class="program-tag">🗓️ {program['days_per_week']} days/week</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if st.button(f"📖 View Details & Schedule", key=f"view_{program_id}", use_container_width=True):
+                    st.session_state.selected_program = program_id
+                    st.rerun()
+                
+                st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Show selected program details
+    else:
+        selected = programs[st.session_state.selected_program]
+        profile = utils.get_program_profile(st.session_state.selected_program)
+        
+        # Back button at top - more prominent
+        col_back, col_title = st.columns([1, 4])
+        with col_back:
+            if st.button("⬅️ Back", key="back_programs", use_container_width=True, type="secondary"):
+                st.session_state.selected_program = None
+                st.rerun()
+        with col_title:
+            st.markdown(f"## 📋 {selected['name']}")
+        
+        st.markdown(f"*{selected['description']}*")
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # ===== VISUAL PROGRAM OVERVIEW =====
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Program Stats Grid
+            st.markdown(f"""
+            <div class="stats-grid">
+                <div class="mini-stat">
+                    <div class="mini-stat-icon">📅</div>
+                    <div class="mini-stat-value">{selected['duration'].split()[0]}</div>
+                    <div class="mini-stat-label">Weeks</div>
+                </div>
+                <div class="mini-stat">
+                    <div class="mini-stat-icon">🗓️</div>
+                    <div class="mini-stat-value">{selected['days_per_week']}</div>
+                    <div class="mini-stat-label">Days/Week</div>
+                </div>
+                <div class="mini-stat">
+                    <div class="mini-stat-icon">📊</div>
+                    <div class="mini-stat-value">{selected['level'][:3]}</div>
+                    <div class="mini-stat-label">Level</div>
+                </div>
+                <div class="mini-stat">
+                    <div class="mini-stat-icon">🔥</div>
+                    <div class="mini-stat-value">{profile['session_minutes']}</div>
+                    <div class="mini-stat-label">Min/Day</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            # Weekly Schedule Visual
+            days_active = selected['days_per_week']
+            day_labels = ['M', 'T', 'W', 'T', 'F', 'S', 'S']
+            active_days = [i < days_active for i in range(7)]
+            
+            days_html = ""
+            for i, (label, active) in enumerate(zip(day_labels, active_days)):
+                class_name = "active" if active else "rest"
+                days_html += f'<div class="day-circle {class_name}">{label}</div>'
+            
+            st.markdown(f"""
+            <div style="padding: 15px;">
+                <p style="color: #90e0ef; font-family: 'Rajdhani', sans-serif; margin-bottom: 10px; font-size: 0.9rem;">📅 WEEKLY SCHEDULE</p>
+                <div class="week-visual">
+                    {days_html}
+                </div>
+                <p style="color: #48cae4; font-size: 0.8rem; text-align: center;">
+                    <span style="color: #00d4ff;">●</span> Workout Days &nbsp;&nbsp;
+                    <span style="color: #48cae4;">●</span> Rest Days
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # ===== MUSCLE GROUP TARGETING =====
+        st.markdown("### 💪 Muscle Groups Targeted")
+        
+        # Share of the program's working sets that train each area
+        muscles = profile['muscles'] or {'Full Body': 100}
+        
+        # Display muscle chart using Streamlit progress bars
+        for muscle, percent in sorted(muscles.items(), key=lambda x: x[1], reverse=True):
+            col1, col2, col3 = st.columns([1, 4, 1])
+            with col1:
+                st.markdown(f"<span style='color: #90e0ef; font-family: Rajdhani, sans-serif; font-size: 0.95rem;'>{muscle}</span>", unsafe_allow_html=True)
+            with col2:
+                st.progress(percent / 100)
+            with col3:
+                st.markdown(f"<span style='color: #00d4ff; font-family: Orbitron, sans-serif; font-size: 0.9rem;'>{percent}%</span>", unsafe_allow_html=True)
+        st.caption(f"Share of about {profile['weekly_sets']} working sets a week that train each area")
+        
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # ===== INTENSITY LEVEL =====
+        st.markdown("### ⚡ Workout Intensity")
+        
+        intensity = profile['intensity']
+        intensity_labels = {1: 'Light', 2: 'Easy', 3: 'Moderate', 4: 'Intense', 5: 'Extreme'}
+        intensity_colors = {1: '🟢', 2: '🟢', 3: '🟡', 4: '🟠', 5: '🔴'}
+        
+        # Display intensity using columns with emojis
+        int_col1, int_col2 = st.columns([2, 3])
+        with int_col1:
+            intensity_display = ""
+            for i in range(5):
+                if i < intensity:
+                    intensity_display += "🔥"
+                else:
+                    intensity_display += "⬜"
+            st.markdown(f"<div style='font-size: 1.8rem; letter-spacing: 5px;'>{intensity_display}</div>", unsafe_allow_html=True)
+        with int_col2:
+            st.markdown(f"""
+            <div style="padding: 15px; background: rgba(0, 119, 182, 0.1); border-radius: 15px; border-left: 4px solid #00d4ff;">
+                <span style="font-family: 'Orbitron', sans-serif; color: #00d4ff; font-size: 1.3rem;">
+                    {intensity_colors[intensity]} {intensity_labels[intensity]}
+                </span>
+                <p style="color: #90e0ef; font-size: 0.85rem; margin-top: 5px;">
+                    {['', 'Perfect for recovery days', 'Great for beginners', 'Balanced workout', 'Push your limits!', 'Maximum effort required!'][intensity]}
+                </p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        
+        # ===== DETAILED SCHEDULE =====
+        st.markdown("### 📋 Detailed Schedule")
+        
+        # Only the picked phase/week block is built, not every week of the program
+        render_schedule(st.session_state.selected_program, selected, profile)
+        
+        # Show milestone rewards for one-year program
+        if 'milestone_rewards' in selected:
+            st.markdown("### 🏆 Milestone Rewards")
+            st.markdown("\n".join(f"- **{milestone}:** {reward}" for milestone, reward in selected['milestone_rewards'].items()))
+        
+        # Recommended Videos Section
+        st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+        st.markdown("### 🎬 Recommended Workout Videos")
+        st.markdown("*Watch these videos to learn proper form and technique!*")
+        
+        videos = selected.get('videos', [])
+        
+        if videos:
+            cols = st.columns(len(videos))
+            for idx, (title, url) in enumerate(videos):
+                with cols[idx]:
+                    if st.button(f"▶️ {title}", key=f"rec_vid_{idx}", use_container_width=True):
+                        st.video(url)
+        else:
+            st.info("📺 Video recommendations coming soon!")
@@ -0,0 +1,233 @@
+# ============================================
+# CALENDAR PAGE
+# Monthly calendar, day planner and year plan generator
+# ============================================
+
+from datetime import datetime
+
+import streamlit as st
+from streamlit_calendar import calendar as st_calendar
+
+import utils
+import assets
+
+def render(data):
+    """Render the page from this rerun's data snapshot"""
+    st.markdown('<h1 class="main-header">📅 WORKOUT CALENDAR</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">YOUR ONE-YEAR FITNESS JOURNEY</p>', unsafe_allow_html=True)
+    
+    # 🔥 STREAK DISPLAY AT TOP OF CALENDAR
+    streak_data = data.streak
+    current_streak = streak_data['current_streak']
+    streak_status = streak_data['streak_status']
+    
+    # Mini streak display for calendar page
+    col_s1, col_s2, col_s3 = st.columns([1, 2, 1])
+    with col_s2:
+        flame_emoji = "🔥🔥🔥" if current_streak >= 7 else ("🔥🔥" if current_streak >= 3 else ("🔥" if current_streak >= 1 else "💪"))
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, rgba(255, 107, 0, 0.15), rgba(255, 165, 0, 0.1)); border: 2px solid rgba(255, 165, 0, 0.4); border-radius: 15px; padding: 15px; text-align: center; margin-bottom: 20px;">
+            <span style="font-size: 1.5rem;">{flame_emoji}</span>
+            <span style="font-family: 'Orbitron', sans-serif; font-size: 1.8rem; color: #ffa500; margin: 0 10px;">{current_streak}</span>
+            <span style="font-family: 'Rajdhani', sans-serif; color: #ffcc80; font-size: 0.9rem; text-transform: uppercase;">Day Streak</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # One Year Program Info & Reset Button
+    today = datetime.now()
+    workout_days = data.scheduled_days
+    
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, rgba(0, 212, 255, 0.1), rgba(0, 180, 216, 0.05)); border: 2px solid rgba(0, 212, 255, 0.3); border-radius: 15px; padding: 15px; margin-bottom: 20px;">
+        <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
+            <div>
+                <span style="font-family: 'Orbitron', sans-serif; color: #00d4ff; font-size: 1.1rem;">📆 ONE-YEAR PROGRAM</span>
+                <span style="color: #90e0ef; font-size: 0.9rem; margin-left: 15px;">{workout_days} workout days planned</span>
+            </div>
+        </div>
+        <div style="color: #48cae4; font-size: 0.8rem; margin-top: 10px;">
+            🗓️ Progressive training: Foundation → Beginner → Intermediate → Advanced → Peak Performance
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Reset button with confirmation
+    col_reset1, col_reset2, col_reset3 = st.columns([2, 1, 2])
+    with col_reset2:
+        if st.button("🔄 Generate New Year", use_container_width=True, help="Clear and regenerate a full year of workouts"):
+            utils.clear_calendar()
+            utils.populate_sample_workouts()
+            st.success("🎉 New one-year workout plan generated!")
+            st.rerun()
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Month navigation - events are only built for the shown month plus a buffer
+    # month either side, so the payload is the same however many years are planned
+    this_month = today.date().replace(day=1)
+    if 'calendar_month' not in st.session_state:
+        st.session_state.calendar_month = this_month
+    
+    def shift_calendar_month(months):
+        st.session_state.calendar_month = utils.shift_month(st.session_state.calendar_month, months) if months else this_month
+    
+    nav_prev, nav_today, nav_next = st.columns(3)
+    with nav_prev:
+        st.button("◀️ Previous", key="cal_prev_month", on_click=shift_calendar_month, args=(-1,), use_container_width=True)
+    with nav_today:
+        st.button("📍 Today", key="cal_this_month", on_click=shift_calendar_month, args=(0,), use_container_width=True)
+    with nav_next:
+        st.button("Next ▶️", key="cal_next_month", on_click=shift_calendar_month, args=(1,), use_container_width=True)
+    
+    shown_month = st.session_state.calendar_month
+    events_start, events_end = utils.month_window(shown_month)
+    calendar_events = data.events(events_start, events_end)
+    
+    # Streamlit Calendar Options - Dark futuristic theme
+    calendar_options = {
+        "initialView": "dayGridMonth",
+        # Paging is done by the buttons above so each month gets its own events
+        # window. They step whole months, so the week and list views (which
+        # FullCalendar would page by week on its own) are not offered
+        "headerToolbar": {
+            "left": "",
+            "center": "title",
+            "right": ""
+        },
+        "initialDate": (today.date() if shown_month == this_month else shown_month).strftime("%Y-%m-%d"),
+        "editable": False,
+        "selectable": True,
+        "selectMirror": True,
+        "dayMaxEvents": 3,
+        "weekends": True,
+        "nowIndicator": True,
+        "height": 650,
+        "eventDisplay": "block",
+        "displayEventTime": False,
+    }
+    
+    # Calendar theme, minified from styles/calendar.css (see assets.py)
+    custom_css = assets.inline_css('calendar')
+    
+    # Render the calendar
+    calendar_result = st_calendar(
+        events=calendar_events,
+        options=calendar_options,
+        custom_css=custom_css,
+        # A new key per month remounts the calendar on the new initialDate
+        key=f"fitness_calendar_{shown_month:%Y_%m}"
+    )
+    st.caption(f"{len(calendar_events)} workouts loaded for {events_start:%b %d} – {events_end:%b %d, %Y}")
+    
+    # Handle calendar interactions
+    if calendar_result:
+        if "dateClick" in calendar_result:
+            clicked_date = calendar_result["dateClick"]["date"]
+            st.session_state.selected_calendar_date = clicked_date
+        
+        if "eventClick" in calendar_result:
+            event_data = calendar_result["eventClick"]["event"]
+            st.info(f"📋 **{event_data.get('title', 'Workout')}**\n\n"
+                   f"Type: {event_data.get('extendedProps', {}).get('type', 'N/A')}\n\n"
+                   f"Duration: {event_data.get('extendedProps', {}).get('duration', 'N/A')}\n\n"
+                   f"Notes: {event_data.get('extendedProps', {}).get('notes', 'No notes')}")
+    
+    # Legend
+    st.markdown("""
+    <div style="display: flex; flex-wrap: wrap; justify-content: center; gap: 10px; margin: 20px 0; padding: 15px; background: rgba(0, 30, 60, 0.4); border-radius: 12px; border: 1px solid rgba(0, 212, 255, 0.2);">
+        <span style="color: #00ff88; font-size: 0.85rem; padding: 5px 10px; background: rgba(0, 255, 136, 0.1); border-radius: 20px;">✅ Completed</span>
+        <span style="color: #ff6b6b; font-size: 0.85rem; padding: 5px 10px; background: rgba(255, 107, 107, 0.1); border-radius: 20px;">🦵 Lower Body</span>
+        <span style="color: #4ecdc4; font-size: 0.85rem; padding: 5px 10px; background: rgba(78, 205, 196, 0.1); border-radius: 20px;">💪 Upper Body</span>
+        <span style="color: #ff9f43; font-size: 0.85rem; padding: 5px 10px; background: rgba(255, 159, 67, 0.1); border-radius: 20px;">⚡ HIIT</span>
+        <span style="color: #a29bfe; font-size: 0.85rem; padding: 5px 10px; background: rgba(162, 155, 254, 0.1); border-radius: 20px;">🧘 Yoga</span>
+        <span style="color: #00d4ff; font-size: 0.85rem; padding: 5px 10px; background: rgba(0, 212, 255, 0.1); border-radius: 20px;">🏋️ Full Body</span>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # Add/Edit Workout for a Date
+    st.markdown("## ➕ Schedule a Workout")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_date = st.date_input("📅 Select Date", datetime.now())
+        workout_name = st.text_input("💪 Workout Name", placeholder="e.g., Morning HIIT Session")
+        workout_type = st.selectbox("🏋️ Workout Type", 
+            ["Strength", "Cardio", "HIIT", "Yoga", "Pilates", "Dance", "Stretching", "Full Body", "Upper Body", "Lower Body", "Core"])
+    
+    with col2:
+        workout_duration = st.selectbox("⏱️ Duration", 
+            ["15 min", "20 min", "30 min", "45 min", "60 min", "90 min"])
+        workout_notes = st.text_area("📝 Notes (optional)", placeholder="Any notes for this workout...")
+    
+    if st.button("✨ Add to Calendar", use_container_width=True):
+        if workout_name:
+            date_str = selected_date.strftime("%Y-%m-%d")
+            workout_data = {
+                "name": workout_name,
+                "type": workout_type,
+                "duration": workout_duration,
+                "notes": workout_notes,
+                "completed": False
+            }
+            utils.add_workout_to_calendar(date_str, workout_data)
+            st.success(f"🎉 Workout added for {selected_date.strftime('%B %d, %Y')}!")
+            st.balloons()
+            st.rerun()
+        else:
+            st.warning("⚠️ Please enter a workout name!")
+    
+    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    
+    # View/Edit Workouts for Selected Date
+    st.markdown("## 📋 Workouts for Selected Date")
+    view_date = st.date_input("View workouts for:", selected_date, key="view_date")
+    view_date_str = view_date.strftime("%Y-%m-%d")
+    date_workouts = data.workouts_on(view_date_str)
+    
+    if date_workouts:
+        # Check if any workouts are incomplete
+        has_incomplete = any(not w.get('completed', False) for w in date_workouts)
+        all_complete = all(w.get('completed', False) for w in date_workouts)
+        
+        # Show "Confirm All Complete" button if there are incomplete workouts
+        if has_incomplete:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, rgba(0, 255, 136, 0.1), rgba(0, 200, 100, 0.05)); border: 2px solid rgba(0, 255, 136, 0.3); border-radius: 12px; padding: 15px; text-align: center; margin-bottom: 15px;">
+                <p style="color: #90e0ef; margin-bottom: 10px;">Complete all workouts to maintain your streak! 🔥</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("✅ Mark All as Complete", key=f"complete_all_{view_date_str}", use_container_width=True, type="primary"):
+                utils.confirm_workout_completed(view_date_str)
+                st.success("🎉 All workouts marked complete! Your streak continues!")
+                st.balloons()
+                st.rerun()
+        elif all_complete:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, rgba(0, 255, 136, 0.15), rgba(0, 200, 100, 0.1)); border: 2px solid rgba(0, 255, 136, 0.4); border-radius: 12px; padding: 15px; text-align: center; margin-bottom: 15px;">
+                <span style="font-size: 1.5rem;">🏆</span>
+                <span style="font-family: 'Rajdhani', sans-serif; color: #00ff88; font-size: 1.1rem; margin-left: 10px;">All workouts complete for this day!</span>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        for idx, workout in enumerate(date_workouts):
+            with st.expander(f"{'✅' if workout.get('completed') else '⏳'} {workout.get('name', 'Workout')} - {workout.get('type', '')}"):
+                st.write(f"**Duration:** {workout.get('duration', 'Not specified')}")
+                st.write(f"**Notes:** {workout.get('notes', 'No notes')}")
+                st.write(f"**Status:** {'Completed ✅' if workout.get('completed') else 'Pending ⏳'}")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if st.button("✅ Toggle Complete", key=f"toggle_{view_date_str}_{idx}"):
+                        utils.mark_workout_complete_by_id(workout['id'], not workout.get('completed', False))
+                        st.rerun()
+                with col3:
+                    if st.button("🗑️ Delete", key=f"delete_{view_date_str}_{idx}"):
+                        utils.remove_workout_by_id(workout['id'])
+                        st.success("Workout removed!")
+                        st.rerun()
+    else:
+        st.info(f"💡 No workouts scheduled for {view_date.strftime('%B %d, %Y')}")
@@ -0,0 +1,209 @@
+# ============================================
+# STYLESHEET PIPELINE
+# styles/*.css -> minified, content-hashed bundles in static/css/
+# Served once through Streamlit static serving (server.enableStaticServing)
+# Run `python assets.py` to rebuild and print the bytes saved per rerun,
+# or `python assets.py --fetch-fonts` to self-host Orbitron/Rajdhani
+# ============================================
+
+import os
+import re
+import sys
+import json
+import gzip
+import hashlib
+import functools
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+STYLES_DIR = os.path.join(ROOT_DIR, 'styles')
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+CSS_DIR = os.path.join(STATIC_DIR, 'css')
+FONTS_DIR = os.path.join(STATIC_DIR, 'fonts')
+MANIFEST_FILE = os.path.join(CSS_DIR, 'manifest.json')
+STATIC_URL = 'app/static'
+
+# Bundle name -> source files, concatenated in order
+STYLE_BUNDLES = {
+    'app': ['fonts.css', 'theme.css', 'navbar.css'],
+    'calendar': ['calendar.css'],
+}
+
+GOOGLE_FONTS_URL = ('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700'
+                    '&family=Rajdhani:wght@300;400;500;600;700&display=swap')
+# Google serves woff2 split by unicode-range only to browsers that support it
+FONT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36'
+FONT_SUBSETS = ('latin',)
+
+# ============================================
+# MINIFY + BUILD
+# ============================================
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    return css.strip()
+
+def _read_bundle(name):
+    """Concatenate a bundle's source files; fonts.css is skipped until the fonts are fetched"""
+    parts = []
+    for filename in STYLE_BUNDLES[name]:
+        if filename == 'fonts.css' and not _fonts_available():
+            # Linked from Google Fonts next to the bundle instead (see font_tags)
+            continue
+        with open(os.path.join(STYLES_DIR, filename), encoding='utf-8') as f:
+            parts.append(f.read())
+    return '\n'.join(parts)
+
+def _fonts_available():
+    """True once fetch_fonts() has written styles/fonts.css and its font files"""
+    fonts_css = os.path.join(STYLES_DIR, 'fonts.css')
+    if not os.path.exists(fonts_css):
+        return False
+    with open(fonts_css, encoding='utf-8') as f:
+        files = re.findall(r'url\("\.\./fonts/([^"]+)"\)', f.read())
+    return bool(files) and all(os.path.exists(os.path.join(FONTS_DIR, name)) for name in files)
+
+def build_styles():
+    """Write every bundle as static/css/<name>.<hash>.css and return the manifest"""
+    os.makedirs(CSS_DIR, exist_ok=True)
+    manifest = {}
+    for name in STYLE_BUNDLES:
+        source = _read_bundle(name)
+        css = minify_css(source)
+        digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]
+        filename = f"{name}.{digest}.css"
+        path = os.path.join(CSS_DIR, filename)
+        if not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(css)
+        # Old hashes are never requested again once the manifest moves on
+        for old in os.listdir(CSS_DIR):
+            if old.startswith(f"{name}.") and old.endswith('.css') and old != filename:
+                os.remove(os.path.join(CSS_DIR, old))
+        manifest[name] = {
+            'file': filename,
+            'source_bytes': len(source.encode('utf-8')),
+            'bytes': len(css.encode('utf-8')),
+            'gzip_bytes': len(gzip.compress(css.encode('utf-8'))),
+            'sources': _source_stamp(name),
+        }
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def _source_stamp(name):
+    """Modification times of a bundle's inputs (and this build script), to spot a stale build"""
+    paths = [os.path.join(STYLES_DIR, filename) for filename in STYLE_BUNDLES[name]] + [os.path.abspath(__file__)]
+    if os.path.isdir(FONTS_DIR):
+        paths.append(FONTS_DIR)
+    return [os.stat(path).st_mtime_ns if os.path.exists(path) else 0 for path in paths]
+
+@functools.lru_cache(maxsize=None)
+def get_manifest():
+    """Load the build manifest once per process, rebuilding if a source changed"""
+    try:
+        with open(MANIFEST_FILE, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if all(name in manifest and manifest[name]['sources'] == _source_stamp(name)
+               and os.path.exists(os.path.join(CSS_DIR, manifest[name]['file']))
+               for name in STYLE_BUNDLES):
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+    try:
+        return build_styles()
+    except OSError as e:
+        # Read-only checkout: fall back to inlining the minified CSS
+        print(f"Stylesheet build error: {e}")
+        return {}
+
+# ============================================
+# RUNTIME HELPERS
+# ============================================
+
+def font_tags(name):
+    """Google Fonts links for a bundle whose fonts are not self-hosted yet
+    
+    They sit next to the bundle tag rather than as an @import inside it, so
+    the browser requests the font CSS in parallel with the bundle.
+    """
+    if 'fonts.css' not in STYLE_BUNDLES[name] or _fonts_available():
+        return ""
+    return ('<link rel="preconnect" href="https://fonts.googleapis.com">'
+            '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+            f'<link rel="stylesheet" href="{GOOGLE_FONTS_URL}">')
+
+def stylesheet_tag(name):
+    """Markdown that loads a bundle from static serving (a few dozen bytes per rerun)"""
+    entry = get_manifest().get(name)
+    if entry is None:
+        return f"{font_tags(name)}<style>{inline_css(name)}</style>"
+    return f'{font_tags(name)}<style>@import url("{STATIC_URL}/css/{entry["file"]}");</style>'
+
+@functools.lru_cache(maxsize=None)
+def inline_css(name):
+    """Minified bundle text, for places that need the CSS itself (component iframes)"""
+    entry = get_manifest().get(name)
+    if entry is not None:
+        with open(os.path.join(CSS_DIR, entry['file']), encoding='utf-8') as f:
+            return f.read()
+    return minify_css(_read_bundle(name))
+
+# ============================================
+# SELF-HOSTED FONTS
+# ============================================
+
+def fetch_fonts():
+    """Download the latin woff2 subsets of the theme fonts and write styles/fonts.css"""
+    request = urllib.request.Request(GOOGLE_FONTS_URL, headers={'User-Agent': FONT_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        google_css = response.read().decode('utf-8')
+    
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    rules = []
+    # Each block looks like: /* latin */ @font-face { font-family: 'Orbitron'; ... src: url(...) format('woff2'); unicode-range: ...; }
+    for subset, block in re.findall(r'/\*\s*([\w-]+)\s*\*/\s*(@font-face\s*\{.*?\})', google_css, flags=re.S):
+        if subset not in FONT_SUBSETS:
+            continue
+        family = re.search(r"font-family:\s*'([^']+)'", block).group(1)
+        weight = re.search(r'font-weight:\s*(\d+)', block).group(1)
+        url = re.search(r'url\(([^)]+)\)', block).group(1)
+        # Variable fonts return the same file for every weight; name by URL to download it once
+        filename = f"{family.lower()}-{subset}-{hashlib.sha256(url.encode('utf-8')).hexdigest()[:8]}.woff2"
+        if not os.path.exists(os.path.join(FONTS_DIR, filename)):
+            with urllib.request.urlopen(url, timeout=30) as response:
+                with open(os.path.join(FONTS_DIR, filename), 'wb') as f:
+                    f.write(response.read())
+        local = block.replace(f"url({url})", f'url("../fonts/{filename}")')
+        rules.append(f"/* {family} {weight} ({subset}) */\n{local}")
+    
+    if not rules:
+        raise RuntimeError("No font-face rules found in the Google Fonts response")
+    with open(os.path.join(STYLES_DIR, 'fonts.css'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(rules) + '\n')
+    return len(rules)
+
+def report(manifest, reruns=100):
+    """Print how many stylesheet bytes each rerun sends before and after the pipeline"""
+    print(f"{'bundle':<10} {'inline':>9} {'minified':>9} {'gzip':>7} {'per rerun':>10}")
+    before = after = 0
+    for name, entry in manifest.items():
+        tag = len(stylesheet_tag(name).encode('utf-8'))
+        # The calendar bundle still travels as component args, just minified
+        per_rerun = entry['bytes'] if name == 'calendar' else tag
+        before += entry['source_bytes']
+        after += per_rerun
+        print(f"{name:<10} {entry['source_bytes']:>9} {entry['bytes']:>9} {entry['gzip_bytes']:>7} {per_rerun:>10}")
+    print(f"Per rerun: {before} -> {after} bytes ({1 - after / before:.1%} less); "
+          f"over {reruns} reruns: {before * reruns / 1024:.0f} KB -> {after * reruns / 1024:.0f} KB "
+          f"plus one cached download")
+
+if __name__ == "__main__":
+    if '--fetch-fonts' in sys.argv:
+        print(f"Fetched {fetch_fonts()} font faces into {FONTS_DIR}")
+    report(build_styles())
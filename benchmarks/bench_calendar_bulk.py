@@ -0,0 +1,68 @@
+# ============================================
+# BENCHMARK: ONE-YEAR CALENDAR GENERATION (local backend)
+# ============================================
+# Compares the old per-workout write path against add_workouts_to_calendar_bulk().
+# Run from the project root:  python benchmarks/bench_calendar_bulk.py
+
+import os
+import sys
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(tempfile.mkdtemp(prefix="jade_bench_"))
+
+import utils
+
+ROUNDS = 3
+
+def year_of_entries(days=365):
+    """Build roughly one workout per day, like populate_sample_workouts()"""
+    today = datetime.now().date()
+    entries = []
+    for i in range(days):
+        if i % 7 == 6:
+            continue
+        date_str = (today + timedelta(days=i)).strftime("%Y-%m-%d")
+        entries.append((date_str, {
+            "name": "Full Body Strength", "type": "Full Body", "duration": "45 min",
+            "notes": "Compound movements: squat, press, row, lunge", "completed": False
+        }))
+    return entries
+
+def legacy_add(date_str, workout_data):
+    """The original file backend: full JSON parse + full rewrite per workout"""
+    try:
+        with open(utils.CALENDAR_FILE) as f:
+            calendar = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        calendar = {}
+    calendar.setdefault(date_str, []).append(workout_data)
+    with open(utils.CALENDAR_FILE, 'w') as f:
+        json.dump(calendar, f, indent=2)
+
+def legacy_count():
+    with open(utils.CALENDAR_FILE) as f:
+        return sum(len(w) for w in json.load(f).values())
+
+def run(label, fn, count=lambda: sum(len(w) for w in utils.load_calendar().values())):
+    timings = []
+    for _ in range(ROUNDS):
+        utils.clear_calendar()
+        if os.path.exists(utils.CALENDAR_FILE):
+            os.remove(utils.CALENDAR_FILE)
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    stored = count()
+    print(f"{label:<32} best {min(timings) * 1000:8.1f} ms   ({stored} workouts)")
+
+if __name__ == "__main__":
+    entries = year_of_entries()
+    print(f"Backend: {'Supabase' if utils.SUPABASE_ENABLED else 'local SQLite'}")
+    if not utils.SUPABASE_ENABLED:
+        run("legacy JSON per-workout rewrite", lambda: [legacy_add(d, dict(w)) for d, w in entries], legacy_count)
+    run("add_workout_to_calendar loop", lambda: [utils.add_workout_to_calendar(d, dict(w)) for d, w in entries])
+    run("add_workouts_to_calendar_bulk", lambda: utils.add_workouts_to_calendar_bulk([(d, dict(w)) for d, w in entries]))
@@ -0,0 +1,72 @@
+# ============================================
+# BENCHMARK: EXERCISE SEARCH
+# ============================================
+# Compares the old linear substring scan with the token/trigram index, and
+# the old dict-comprehension filters with the facet bitsets, on the real
+# library and on a synthetic library of a few thousand exercises.
+# Run from the project root:  python benchmarks/bench_exercise_search.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import exercise_library
+from exercise_library import EXERCISE_LIBRARY, _SearchIndex, _FacetIndex
+
+QUERIES = ["squat", "sqaut", "glute", "lower body", "ceps", "plnk", "push up", "xyz"]
+ROUNDS = 200
+VARIANTS = ["Pulse", "Tempo", "Paused", "Banded", "Single Leg", "Wide", "Narrow", "Elevated",
+            "Isometric", "Jumping", "Slow", "Alternating", "Weighted", "Deficit", "Reverse"]
+
+def linear_search(library, query):
+    """The original scan over every entry"""
+    query = query.lower()
+    return {key: exercise for key, exercise in library.items()
+            if query in exercise["name"].lower() or query in exercise["category"].lower()
+            or any(query in muscle.lower() for muscle in exercise["muscle_groups"])}
+
+def synthetic_library(size):
+    library = {}
+    base = list(EXERCISE_LIBRARY.items())
+    for i in range(size):
+        key, exercise = base[i % len(base)]
+        variant = f"{VARIANTS[i // len(base) % len(VARIANTS)]} {i // (len(base) * len(VARIANTS))}"
+        library[f"{key}_{i}"] = dict(exercise, name=f"{variant} {exercise['name']}")
+    return library
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for query in QUERIES:
+            fn(query)
+    return (time.perf_counter() - start) / (ROUNDS * len(QUERIES)) * 1e6
+
+if __name__ == "__main__":
+    for label, library in [("real", EXERCISE_LIBRARY), ("synthetic", synthetic_library(5000))]:
+        start = time.perf_counter()
+        index = _SearchIndex(library)
+        build = (time.perf_counter() - start) * 1000
+        linear = timed(lambda query: linear_search(library, query))
+        indexed = timed(index.search)
+        print(f"{label:<10} {len(library):>5} exercises  build {build:6.1f} ms  "
+              f"linear {linear:8.1f} us/query  index {indexed:8.1f} us/query")
+        filters = {"category": "Lower Body", "difficulty": "Beginner", "muscle_groups": "Glutes", "equipment": "All"}
+        facets = _FacetIndex(library)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            {k: v for k, v in {k: v for k, v in library.items() if v["category"] == "Lower Body"}.items()
+             if v["difficulty"] == "Beginner" and "Glutes" in v["muscle_groups"]}
+        comprehension = (time.perf_counter() - start) / ROUNDS * 1e6
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            facets.mask(filters)
+            facets.counts(filters)
+        bitsets = (time.perf_counter() - start) / ROUNDS * 1e6
+        print(f"{'':<10} {'':>5}             filters: comprehensions {comprehension:8.1f} us  "
+              f"bitsets + all facet counts {bitsets:8.1f} us")
+    cached = timed(exercise_library._search_keys)
+    print(f"{'cached':<10} {len(EXERCISE_LIBRARY):>5} exercises  repeat queries {cached:.2f} us/query")
+    for query in QUERIES:
+        print(f"  {query!r:<13} -> {[exercise['name'] for exercise in exercise_library.search_exercises(query).values()][:4]}")
@@ -0,0 +1,77 @@
+# ============================================
+# BENCHMARK: LOCAL MEDIA CACHE (offline)
+# ============================================
+# Runs generated fixture images through media.prepare() with a fake fetcher,
+# so no network is needed, and reports the bytes saved per variant.
+# Run from the project root:  python benchmarks/bench_media_cache.py
+
+import io
+import os
+import sys
+import math
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+import media
+
+media.MEDIA_DIR = tempfile.mkdtemp(prefix="jade_media_")
+media.INDEX_FILE = os.path.join(media.MEDIA_DIR, "index.json")
+
+def demo_gif(size=480, frames=24):
+    """An exercise-demo-like GIF: a figure moving over a detailed background"""
+    background = Image.effect_noise((size, size), 40).convert("RGB")
+    images = []
+    for i in range(frames):
+        frame = background.copy()
+        draw = ImageDraw.Draw(frame)
+        y = size // 2 + int(math.sin(i / frames * 2 * math.pi) * size / 6)
+        draw.ellipse((size // 2 - 30, y - 120, size // 2 + 30, y - 60), fill=(255, 200, 160))
+        draw.rectangle((size // 2 - 40, y - 60, size // 2 + 40, y + 60), fill=(0, 120, 200))
+        images.append(frame.convert("P", palette=Image.ADAPTIVE))
+    output = io.BytesIO()
+    images[0].save(output, format="GIF", save_all=True, append_images=images[1:], duration=80, loop=0)
+    return output.getvalue()
+
+def thumbnail_jpeg(width=1280, height=720):
+    """A maxresdefault-sized JPEG"""
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    image = Image.blend(image, Image.effect_noise((width, height), 60).convert("RGB"), 0.4)
+    output = io.BytesIO()
+    image.save(output, format="JPEG", quality=90)
+    return output.getvalue()
+
+FIXTURES = {
+    "https://example.test/SQUAT.gif": demo_gif(),
+    "https://example.test/Lunge.gif": demo_gif(frames=16),
+    # Same content under another URL is stored once
+    "https://example.test/squats-alias.gif": None,
+    "https://example.test/maxresdefault.jpg": thumbnail_jpeg(),
+}
+FIXTURES["https://example.test/squats-alias.gif"] = FIXTURES["https://example.test/SQUAT.gif"]
+
+fetches = []
+
+def fixture_fetcher(url):
+    fetches.append(url)
+    return FIXTURES[url]
+
+if __name__ == "__main__":
+    widths = {url: media.THUMBNAIL_WIDTH if url.endswith(".jpg") else media.DEMO_WIDTH for url in FIXTURES}
+    for url, width in widths.items():
+        start = time.perf_counter()
+        filename = media.prepare(url, width, fetcher=fixture_fetcher)
+        elapsed = time.perf_counter() - start
+        variant = os.path.getsize(os.path.join(media.MEDIA_DIR, filename))
+        print(f"{url.rsplit('/', 1)[-1]:<20} {len(FIXTURES[url]) / 1024:7.0f} KB -> {variant / 1024:5.0f} KB "
+              f"{filename.rsplit('.', 1)[-1]:<5} {elapsed * 1000:6.0f} ms")
+    
+    # A second pass is served entirely from the cache
+    for url, width in widths.items():
+        media.prepare(url, width, fetcher=fixture_fetcher)
+    sources = [name for name in os.listdir(media.MEDIA_DIR) if name.endswith(".src")]
+    print(f"{len(fetches)} fetches for {len(FIXTURES)} URLs over two passes, {len(sources)} distinct sources stored")
+    media.report(media.get_media_stats())
@@ -0,0 +1,82 @@
+# ============================================
+# BENCHMARK: GENERATED PLAN STORAGE (local backend)
+# ============================================
+# Compares storing "Generate New Year" as a row per workout with storing the
+# plan spec and expanding it on read: rows written, generation time, and the
+# reads the calendar and home pages make.
+# Run from the project root:  python benchmarks/bench_plan_storage.py
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(tempfile.mkdtemp(prefix="jade_bench_"))
+
+import utils
+import workout_plan
+
+ROUNDS = 10
+
+def store_rows():
+    """The previous populate_sample_workouts(): one calendar row per workout"""
+    today = datetime.now().date()
+    plan = workout_plan.generate_plan(today, days=workout_plan.DEFAULT_PLAN_DAYS)
+    utils.add_workouts_to_calendar_bulk(workout_plan.plan_entries(plan, completed_before=today.strftime("%Y-%m-%d")))
+
+def median_ms(fn, setup=lambda: None):
+    """Median milliseconds of fn() over ROUNDS runs, setup() before each"""
+    timings = []
+    for _ in range(ROUNDS):
+        setup()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def cold(expanded=True):
+    """Drop the cached reads and streak index (and the expanded plan unless `expanded`)"""
+    utils.invalidate_cache()
+    utils._reset_streak_index()
+    if not expanded:
+        utils._expand_plan.cache_clear()
+
+def run(label, populate):
+    utils.clear_calendar()
+    generate_ms = median_ms(populate, setup=utils.clear_calendar)
+    conn = utils._get_db()
+    rows = sum(conn.execute(f"SELECT COUNT(*) AS n FROM {table}").fetchone()['n']
+               for table in ('workout_calendar', 'calendar_days', 'workout_plans', 'workout_plan_overrides'))
+    
+    today = datetime.now().date()
+    month_start, month_end = utils.month_window(today.replace(day=1))
+    first_planned = next(iter(utils.load_calendar()))
+    workout_id = utils.get_workouts_for_date(first_planned)[0]['id']
+    
+    first_ms = median_ms(utils.load_calendar, setup=lambda: cold(expanded=False))
+    full_ms = median_ms(utils.load_calendar, setup=cold)
+    range_ms = median_ms(lambda: utils.get_workouts_for_range(month_start, month_end), setup=cold)
+    streak_ms = median_ms(utils.get_streak_data, setup=cold)
+    toggle_ms = median_ms(lambda: utils.mark_workout_complete_by_id(workout_id, True),
+                          setup=lambda: utils.mark_workout_complete_by_id(workout_id, False))
+    print(f"{label:<16} {rows:>6} {generate_ms:>12.2f} {first_ms:>10.2f} {full_ms:>10.2f} {range_ms:>10.2f} "
+          f"{streak_ms:>10.2f} {toggle_ms:>10.2f}")
+
+if __name__ == "__main__":
+    print(f"{'storage':<16} {'rows':>6} {'generate ms':>12} {'first ms':>10} {'year ms':>10} {'3 months':>10} "
+          f"{'streak ms':>10} {'toggle ms':>10}")
+    run("row per workout", store_rows)
+    run("plan spec", utils.populate_sample_workouts)
+    print("(rows across calendar, per-day count and plan tables; 'first' is the process's first year read, "
+          "which expands the plan; the other reads run without cached results or streak index)")
+    # Sanity check: both storages show the same workouts
+    utils.clear_calendar()
+    store_rows()
+    stored = {d: [w['name'] for w in ws] for d, ws in utils.load_calendar().items()}
+    utils.clear_calendar()
+    utils.populate_sample_workouts()
+    planned = {d: [w['name'] for w in ws] for d, ws in utils.load_calendar().items()}
+    print("same workouts:", stored == planned, f"({sum(map(len, planned.values()))} over {len(planned)} days)")
@@ -0,0 +1,48 @@
+# ============================================
+# BENCHMARK: PROGRAM DETAIL PAGE SIZE
+# ============================================
+# Renders each program's detail view with Streamlit's AppTest and reports how
+# many elements the page sends and how long a (warm) rerun takes.
+# Run from the project root:  python benchmarks/bench_program_schedule.py
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.chdir(tempfile.mkdtemp(prefix="jade_bench_"))
+
+from streamlit.testing.v1 import AppTest
+
+import utils
+
+RERUNS = 5
+
+PAGE_SCRIPT = f"""
+import sys
+sys.path.insert(0, {ROOT_DIR!r})
+import utils
+from app_pages import programs
+programs.render(utils.DataSnapshot())
+"""
+
+def count_elements(node):
+    """Elements in a rendered AppTest tree, containers included"""
+    return 1 + sum(count_elements(child) for child in getattr(node, 'children', {}).values())
+
+if __name__ == "__main__":
+    print(f"{'program':<26} {'elements':>9} {'expanders':>10} {'rerun ms':>9}")
+    for program_id in utils.GIRLS_WORKOUT_PROGRAMS:
+        at = AppTest.from_string(PAGE_SCRIPT, default_timeout=60)
+        at.session_state['selected_program'] = program_id
+        at.run()
+        timings = []
+        for _ in range(RERUNS):
+            start = time.perf_counter()
+            at.run()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{program_id:<26} {count_elements(at._tree):>9} {len(at.expander):>10} "
+              f"{statistics.median(timings):>9.0f}")
@@ -0,0 +1,44 @@
+# ============================================
+# BENCHMARK: PLAN GENERATION
+# ============================================
+# Times workout_plan.generate_plan() for one to ten years and checks that
+# the plan is reproducible and leaves the global `random` state alone.
+# Run from the project root:  python benchmarks/bench_year_plan.py
+
+import os
+import sys
+import random
+import statistics
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import workout_plan
+
+ROUNDS = 20
+START = date(2025, 1, 6)
+
+def timed(years):
+    """Median ms to generate `years` of plan, and to turn it into calendar entries"""
+    generate, convert = [], []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        plan = workout_plan.generate_plan(START, days=365 * years)
+        generated = time.perf_counter()
+        entries = workout_plan.plan_entries(plan)
+        generate.append((generated - start) * 1000)
+        convert.append((time.perf_counter() - generated) * 1000)
+    return statistics.median(generate), statistics.median(convert), len(entries)
+
+if __name__ == "__main__":
+    random.seed(42)
+    expected = random.random()
+    random.seed(42)
+    for years in (1, 5, 10):
+        generate_ms, convert_ms, workouts = timed(years)
+        print(f"{years:>2} year(s): {workouts:>5} workouts generated in {generate_ms:5.2f} ms, "
+              f"{convert_ms:5.2f} ms more as calendar entries")
+    print("global random untouched:", random.random() == expected)
+    print("same seed, same plan:", workout_plan.generate_plan(START).equals(workout_plan.generate_plan(START)))
+    print("other seed, other plan:", not workout_plan.generate_plan(START, seed=1).equals(workout_plan.generate_plan(START)))
@@ -17,3 +17,5 @@ SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")
 # Table names
 WORKOUTS_TABLE = "workouts"
 CALENDAR_TABLE = "workout_calendar"
+PLANS_TABLE = "workout_plans"
+PLAN_OVERRIDES_TABLE = "workout_plan_overrides"
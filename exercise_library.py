@@ -3,6 +3,11 @@
 # Sources: Wger API, ExerciseDB (via public endpoints)
 # ============================================
 
+import re
+import bisect
+import functools
+import collections
+
 # Exercise database with GIF demonstrations from free sources
 # GIFs are from public exercise databases and fitness resources
 
@@ -619,6 +624,65 @@ EXERCISE_CATEGORIES = ["All", "Lower Body", "Upper Body", "Core", "Cardio", "Str
 # Difficulty levels
 DIFFICULTY_LEVELS = ["All", "Beginner", "Intermediate", "Advanced"]
 
+# Extra demo GIFs for exercises that appear in programs but not in the library,
+# keyed by name (resolved through utils.get_exercise_media)
+EXERCISE_DEMO_GIFS = {
+    "deadlift": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Barbell-Deadlift.gif",
+    "hip_thrust": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Barbell-Hip-Thrust.gif",
+    "calf_raise": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Dumbbell-Calf-Raise.gif",
+    "leg_press": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Leg-Press.gif",
+    "leg_curl": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Leg-Curl.gif",
+    "bench_press": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Barbell-Bench-Press.gif",
+    "shoulder_press": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Dumbbell-Shoulder-Press.gif",
+    "bicep_curl": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Dumbbell-Curl.gif",
+    "lateral_raise": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Dumbbell-Lateral-Raise.gif",
+    "row": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Bent-Over-Barbell-Row.gif",
+    "pull_up": "https://fitnessprogramer.com/wp-content/uploads/2021/06/Pull-up.gif",
+    "crunch": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Crunch.gif",
+    "sit_up": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Sit-up.gif",
+    "leg_raise": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Lying-Leg-Raise.gif",
+    "jump_squat": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Jump-Squat.gif",
+    "box_jump": "https://fitnessprogramer.com/wp-content/uploads/2021/06/Box-Jump.gif",
+    "kettlebell_swing": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Kettlebell-Swing.gif",
+    "clean_and_press": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Barbell-Clean-and-Press.gif",
+}
+
+# Muscle groups for the extra demos, in EXERCISE_LIBRARY's vocabulary
+EXERCISE_DEMO_MUSCLES = {
+    "deadlift": ["Hamstrings", "Glutes", "Lower Back", "Core"],
+    "hip_thrust": ["Glutes", "Hamstrings", "Core"],
+    "calf_raise": ["Calves"],
+    "leg_press": ["Quadriceps", "Glutes", "Hamstrings"],
+    "leg_curl": ["Hamstrings"],
+    "bench_press": ["Chest", "Triceps", "Shoulders"],
+    "shoulder_press": ["Shoulders", "Triceps"],
+    "bicep_curl": ["Biceps"],
+    "lateral_raise": ["Shoulders"],
+    "row": ["Back", "Biceps", "Shoulders"],
+    "pull_up": ["Back", "Biceps", "Shoulders"],
+    "crunch": ["Abs"],
+    "sit_up": ["Abs", "Hip Flexors"],
+    "leg_raise": ["Abs", "Hip Flexors"],
+    "jump_squat": ["Quadriceps", "Glutes", "Cardio"],
+    "box_jump": ["Quadriceps", "Glutes", "Calves", "Cardio"],
+    "kettlebell_swing": ["Glutes", "Hamstrings", "Core", "Cardio"],
+    "clean_and_press": ["Full Body", "Shoulders", "Cardio"],
+}
+
+# Fallback demo GIFs by workout type / focus
+WORKOUT_TYPE_GIFS = {
+    "lower_body": "https://fitnessprogramer.com/wp-content/uploads/2021/02/SQUAT.gif",
+    "upper_body": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Push-up.gif",
+    "core": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Front-Plank.gif",
+    "hiit": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Burpee.gif",
+    "cardio": "https://fitnessprogramer.com/wp-content/uploads/2021/02/High-Knee-Run.gif",
+    "full_body": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Burpee.gif",
+    "yoga": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Cobra-Stretch.gif",
+    "stretching": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Standing-Hamstring-Stretch.gif",
+    "pilates": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Crunch.gif",
+    "default": "https://fitnessprogramer.com/wp-content/uploads/2021/02/Jumping-jack.gif",
+}
+
 # Mixamo 3D Character Resources
 MIXAMO_RESOURCES = {
     "about": "Mixamo is Adobe's free service for 3D character animations. You can download rigged characters and animations for free!",
@@ -663,36 +727,239 @@ def get_exercise_by_name(name):
     name_lower = name.lower().replace(" ", "_").replace("-", "_")
     return EXERCISE_LIBRARY.get(name_lower)
 
+# The library is static, so filtered views are computed once and shared
+# (treat the returned dicts as read-only)
+
+@functools.lru_cache(maxsize=None)
 def get_exercises_by_category(category):
     """Get all exercises in a category"""
     if category == "All":
         return EXERCISE_LIBRARY
-    return {k: v for k, v in EXERCISE_LIBRARY.items() if v["category"] == category}
+    return _facet_index.exercises(_facet_index.bitsets["category"].get(category, 0))
 
+@functools.lru_cache(maxsize=None)
 def get_exercises_by_difficulty(difficulty):
     """Get all exercises by difficulty level"""
     if difficulty == "All":
         return EXERCISE_LIBRARY
-    return {k: v for k, v in EXERCISE_LIBRARY.items() if v["difficulty"] == difficulty}
+    return _facet_index.exercises(_facet_index.bitsets["difficulty"].get(difficulty, 0))
 
+@functools.lru_cache(maxsize=None)
 def get_exercises_by_muscle(muscle_group):
     """Get exercises targeting a specific muscle group"""
-    return {k: v for k, v in EXERCISE_LIBRARY.items() if muscle_group in v["muscle_groups"]}
+    return _facet_index.exercises(_facet_index.bitsets["muscle_groups"].get(muscle_group, 0))
+
+@functools.lru_cache(maxsize=256)
+def filter_exercises(query="", category="All", difficulty="All", muscle="All", equipment="All"):
+    """Exercises matching a search and any facet filters, plus live facet counts
+    
+    Returns (exercises, counts): exercises in relevance order when searching,
+    and counts[facet][value] = matches if that facet were set to value instead.
+    """
+    query = query.strip().lower()
+    candidates = _facet_index.mask_of(_search_keys(query)) if query else _facet_index.all
+    filters = {"category": category, "difficulty": difficulty, "muscle_groups": muscle, "equipment": equipment}
+    mask = candidates & _facet_index.mask(filters)
+    keys = [key for key in _search_keys(query) if mask >> _facet_index.positions[key] & 1] if query else None
+    exercises = {key: EXERCISE_LIBRARY[key] for key in keys} if query else _facet_index.exercises(mask)
+    return exercises, _facet_index.counts(filters, candidates)
 
 def search_exercises(query):
-    """Search exercises by name or muscle group"""
-    query = query.lower()
-    results = {}
-    for key, exercise in EXERCISE_LIBRARY.items():
-        if (query in exercise["name"].lower() or 
-            query in exercise["category"].lower() or
-            any(query in muscle.lower() for muscle in exercise["muscle_groups"])):
-            results[key] = exercise
-    return results
+    """Search exercises by name, muscle group, category or equipment, best match first"""
+    return {key: EXERCISE_LIBRARY[key] for key in _search_keys(query.strip().lower())}
+
+@functools.lru_cache(maxsize=256)
+def _search_keys(query):
+    return tuple(key for key, _ in _search_index.search(query))
 
 def get_all_muscle_groups():
     """Get list of all unique muscle groups"""
-    muscles = set()
-    for exercise in EXERCISE_LIBRARY.values():
-        muscles.update(exercise["muscle_groups"])
-    return sorted(list(muscles))
+    return sorted(_facet_index.bitsets["muscle_groups"])
+
+def get_all_equipment():
+    """Get list of all equipment used by the library"""
+    return sorted(_facet_index.bitsets["equipment"])
+
+# ============================================
+# SEARCH INDEX
+# ============================================
+# Built once at import: every token of an exercise's searchable fields is
+# posted with its field weight, the sorted vocabulary answers prefixes with
+# two bisects, and trigram postings find substrings and typo candidates
+# ("sqaut" -> "squat") without scanning the vocabulary.
+
+# Field weights for relevance ranking
+SEARCH_FIELD_WEIGHTS = {"name": 3.0, "muscle_groups": 2.0, "category": 1.5, "equipment": 1.0}
+
+# Score multipliers by how a query term matched a token
+_MATCH_EXACT, _MATCH_PREFIX, _MATCH_SUBSTRING, _MATCH_FUZZY = 1.0, 0.75, 0.5, 0.4
+
+# Typo candidates checked per term (most shared trigrams first)
+_FUZZY_CANDIDATES = 50
+
+def _tokenize(text):
+    """Lowercase word tokens with a plural 's' dropped ("Squats" -> "squat")"""
+    tokens = []
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+def _trigrams(token, padded=True):
+    """Character trigrams; padding makes the start and end of a word count"""
+    if padded:
+        token = f"$${token}$"
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent swaps cost 1), or limit + 1 if larger"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+class _SearchIndex:
+    """Token, prefix and trigram index over an exercise library"""
+    
+    def __init__(self, library):
+        self.postings = collections.defaultdict(dict)  # token -> {key: weight}
+        self.trigrams = collections.defaultdict(set)   # trigram -> tokens
+        # Ties go to shorter names ("Plank" before "Plank Shoulder Taps"), then library order
+        self.order = {key: (len(_tokenize(exercise.get("name", ""))), position)
+                      for position, (key, exercise) in enumerate(library.items())}
+        for key, exercise in library.items():
+            for field, weight in SEARCH_FIELD_WEIGHTS.items():
+                value = exercise.get(field, "")
+                for token in _tokenize(" ".join(value) if isinstance(value, list) else value):
+                    if weight > self.postings[token].get(key, 0):
+                        self.postings[token][key] = weight
+        self.vocabulary = sorted(self.postings)
+        for token in self.vocabulary:
+            for trigram in _trigrams(token) | _trigrams(token, padded=False):
+                self.trigrams[trigram].add(token)
+    
+    def _term_matches(self, term):
+        """{token: match quality} for one query term"""
+        matches = {term: _MATCH_EXACT} if term in self.postings else {}
+        # Prefix: the vocabulary slice between term and term + highest character
+        start = bisect.bisect_left(self.vocabulary, term)
+        end = bisect.bisect_left(self.vocabulary, term + "\uffff")
+        for token in self.vocabulary[start:end]:
+            matches.setdefault(token, _MATCH_PREFIX)
+        if len(term) >= 3:
+            # Substring: tokens holding every trigram of the term
+            grams = [self.trigrams.get(gram, set()) for gram in _trigrams(term, padded=False)]
+            for token in set.intersection(*grams) if grams else ():
+                if term in token:
+                    matches.setdefault(token, _MATCH_SUBSTRING)
+        if not matches and len(term) >= 3:
+            # Typos: rank tokens by shared trigrams, then confirm by edit distance
+            shared = collections.Counter()
+            for gram in _trigrams(term):
+                shared.update(self.trigrams.get(gram, ()))
+            limit = 1 if len(term) <= 5 else 2
+            for token, _ in shared.most_common(_FUZZY_CANDIDATES):
+                distance = _edit_distance(term, token, limit)
+                if distance <= limit:
+                    matches[token] = _MATCH_FUZZY / distance
+        return matches
+    
+    def search(self, query):
+        """[(key, score)] for exercises matching every query term, best first"""
+        terms = _tokenize(query)
+        if not terms:
+            return []
+        scores = None
+        for term in terms:
+            term_scores = {}
+            for token, quality in self._term_matches(term).items():
+                for key, weight in self.postings[token].items():
+                    term_scores[key] = max(term_scores.get(key, 0), weight * quality)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+            if not scores:
+                return []
+        return sorted(scores.items(), key=lambda item: (-item[1], self.order[item[0]]))
+
+_search_index = _SearchIndex(EXERCISE_LIBRARY)
+
+# ============================================
+# FACET INDEX
+# ============================================
+# One bitset (a Python int, bit i = i-th exercise) per value of each facet.
+# A filter combination is an AND of masks, and the count for a facet value is
+# the popcount of that value's bitset ANDed with the other facets' filters.
+
+FACET_FIELDS = ("category", "difficulty", "muscle_groups", "equipment")
+
+_popcount = getattr(int, "bit_count", None) or (lambda mask: bin(mask).count("1"))
+
+class _FacetIndex:
+    """Bitsets per facet value over an exercise library"""
+    
+    def __init__(self, library):
+        self.library = library
+        self.keys = list(library)
+        self.positions = {key: position for position, key in enumerate(self.keys)}
+        self.all = (1 << len(self.keys)) - 1
+        self.bitsets = {field: {} for field in FACET_FIELDS}
+        for position, exercise in enumerate(library.values()):
+            for field in FACET_FIELDS:
+                values = exercise.get(field)
+                for value in values if isinstance(values, list) else [values]:
+                    self.bitsets[field][value] = self.bitsets[field].get(value, 0) | 1 << position
+    
+    def mask_of(self, keys):
+        """Bitset of the given exercise keys"""
+        mask = 0
+        for key in keys:
+            mask |= 1 << self.positions[key]
+        return mask
+    
+    def mask(self, filters, skip=None):
+        """AND of the filters' bitsets ("All"/None is no filter, a list or tuple is any-of)"""
+        mask = self.all
+        for field, value in filters.items():
+            if field == skip or value in (None, "All"):
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            any_of = 0
+            for item in values:
+                any_of |= self.bitsets[field].get(item, 0)
+            mask &= any_of
+        return mask
+    
+    def counts(self, filters, candidates=None):
+        """{facet: {value: matches}} with each facet's own filter left out"""
+        candidates = self.all if candidates is None else candidates
+        counts = {}
+        for field in FACET_FIELDS:
+            base = candidates & self.mask(filters, skip=field)
+            counts[field] = {value: _popcount(base & bits) for value, bits in self.bitsets[field].items()}
+            counts[field]["All"] = _popcount(base)
+        return counts
+    
+    def exercises(self, mask):
+        """{key: exercise} for the set bits, in library order"""
+        result = {}
+        while mask:
+            low = mask & -mask
+            key = self.keys[low.bit_length() - 1]
+            result[key] = self.library[key]
+            mask ^= low
+        return result
+
+_facet_index = _FacetIndex(EXERCISE_LIBRARY)
@@ -0,0 +1,207 @@
+# ============================================
+# LOCAL MEDIA CACHE
+# Remote images (exercise GIFs, video thumbnails) fetched once, stored by
+# content hash under static/media/ and served as resized variants:
+# stills -> WebP, animated GIFs -> animated WebP
+# Run `python media.py` to warm the exercise demos and print the bytes saved
+# ============================================
+
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageSequence
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+MEDIA_DIR = os.path.join(ROOT_DIR, 'static', 'media')
+INDEX_FILE = os.path.join(MEDIA_DIR, 'index.json')
+MEDIA_URL = 'app/static/media'
+
+# Variant widths used by the pages
+DEMO_WIDTH = 360
+THUMBNAIL_WIDTH = 320
+
+MEDIA_FETCH_TIMEOUT = 20
+MEDIA_FETCH_WORKERS = 2
+# Seconds before a failed URL is tried again
+MEDIA_RETRY_AFTER = 600
+WEBP_QUALITY = 75
+USER_AGENT = 'Mozilla/5.0 (compatible; JadeFitnessHub/1.0)'
+
+_index = None
+_index_lock = threading.RLock()
+_pending = set()
+_failed = {}
+_pool = None
+
+# ============================================
+# FETCH + STORE
+# ============================================
+
+def fetch_url(url):
+    """Download a URL and return its bytes"""
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(request, timeout=MEDIA_FETCH_TIMEOUT) as response:
+        return response.read()
+
+def _load_index():
+    """url -> {'sha', 'bytes', 'animated', 'variants': {width: {'file', 'bytes'}}}"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            try:
+                with open(INDEX_FILE, encoding='utf-8') as f:
+                    _index = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                _index = {}
+        return _index
+
+def _save_index():
+    with _index_lock:
+        os.makedirs(MEDIA_DIR, exist_ok=True)
+        tmp_path = f"{INDEX_FILE}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_index, f, indent=2)
+        os.replace(tmp_path, INDEX_FILE)
+
+def _store_source(url, fetcher):
+    """Fetch url once; identical content from different URLs shares one stored file"""
+    entry = _load_index().get(url)
+    if entry and os.path.exists(os.path.join(MEDIA_DIR, f"{entry['sha']}.src")):
+        with open(os.path.join(MEDIA_DIR, f"{entry['sha']}.src"), 'rb') as f:
+            return entry, f.read()
+    
+    content = fetcher(url)
+    sha = hashlib.sha256(content).hexdigest()[:20]
+    os.makedirs(MEDIA_DIR, exist_ok=True)
+    source_path = os.path.join(MEDIA_DIR, f"{sha}.src")
+    if not os.path.exists(source_path):
+        with open(source_path, 'wb') as f:
+            f.write(content)
+    with Image.open(io.BytesIO(content)) as image:
+        animated = getattr(image, 'n_frames', 1) > 1
+    with _index_lock:
+        entry = _load_index().setdefault(url, {})
+        # New content at the same URL makes the old variants stale
+        variants = entry.get('variants', {}) if entry.get('sha') == sha else {}
+        entry.update(sha=sha, bytes=len(content), animated=animated, variants=variants)
+    return entry, content
+
+# ============================================
+# VARIANTS
+# ============================================
+
+def make_variant(content, width):
+    """Resize an image to at most `width` px wide; returns (bytes, extension)"""
+    with Image.open(io.BytesIO(content)) as image:
+        scale = min(1.0, width / image.width)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        
+        if getattr(image, 'n_frames', 1) > 1:
+            frames, durations = [], []
+            for frame in ImageSequence.Iterator(image):
+                durations.append(frame.info.get('duration', image.info.get('duration', 100)))
+                frames.append(frame.convert('RGBA').resize(size, Image.LANCZOS))
+            output = io.BytesIO()
+            frames[0].save(output, format='WEBP', save_all=True, append_images=frames[1:],
+                           duration=durations, loop=image.info.get('loop', 0),
+                           quality=WEBP_QUALITY, method=4)
+            return output.getvalue(), 'webp'
+        
+        still = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        if still.size != size:
+            still = still.resize(size, Image.LANCZOS)
+        output = io.BytesIO()
+        still.save(output, format='WEBP', quality=WEBP_QUALITY, method=4)
+        return output.getvalue(), 'webp'
+
+def prepare(url, width, fetcher=None):
+    """Fetch url (once) and build its `width` variant; returns the variant's file name"""
+    entry, content = _store_source(url, fetcher or fetch_url)
+    variant = entry['variants'].get(str(width))
+    if variant is None:
+        # Another URL with the same content may already have this variant
+        variant = next((other['variants'][str(width)] for other in list(_load_index().values())
+                        if other.get('sha') == entry['sha'] and str(width) in other.get('variants', {})), None)
+    if variant and os.path.exists(os.path.join(MEDIA_DIR, variant['file'])):
+        if entry['variants'].get(str(width)) != variant:
+            with _index_lock:
+                entry['variants'][str(width)] = variant
+                _save_index()
+        return variant['file']
+    
+    data, extension = make_variant(content, width)
+    # Keep the original if re-encoding would not make it smaller
+    if len(data) >= len(content):
+        with Image.open(io.BytesIO(content)) as image:
+            data, extension = content, (image.format or 'img').lower()
+    filename = f"{entry['sha']}-{width}.{extension}"
+    with open(os.path.join(MEDIA_DIR, filename), 'wb') as f:
+        f.write(data)
+    with _index_lock:
+        entry['variants'][str(width)] = {'file': filename, 'bytes': len(data)}
+        _save_index()
+    return filename
+
+def _prepare_in_background(url, width):
+    try:
+        prepare(url, width)
+    except Exception as e:
+        print(f"Media cache error for {url}: {e}")
+        _failed[(url, width)] = time.time()
+    finally:
+        _pending.discard((url, width))
+
+def media_url(url, width):
+    """Local URL of the `width` variant of url, or url itself while it is being prepared"""
+    if not url or not str(url).startswith(('http://', 'https://')):
+        return url
+    entry = _load_index().get(url)
+    variant = entry and entry['variants'].get(str(width))
+    if variant:
+        return f"{MEDIA_URL}/{variant['file']}"
+    
+    key = (url, width)
+    if key not in _pending and time.time() - _failed.get(key, 0) > MEDIA_RETRY_AFTER:
+        global _pool
+        with _index_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=MEDIA_FETCH_WORKERS, thread_name_prefix='media')
+            _pending.add(key)
+        _pool.submit(_prepare_in_background, url, width)
+    return url
+
+# ============================================
+# REPORTING
+# ============================================
+
+def get_media_stats():
+    """Bytes of the cached originals versus the variants served in their place"""
+    stats = {'assets': 0, 'source_bytes': 0, 'variant_bytes': 0}
+    for entry in _load_index().values():
+        for variant in entry.get('variants', {}).values():
+            stats['assets'] += 1
+            stats['source_bytes'] += entry['bytes']
+            stats['variant_bytes'] += variant['bytes']
+    stats['saved'] = 1 - stats['variant_bytes'] / stats['source_bytes'] if stats['source_bytes'] else 0.0
+    return stats
+
+def report(stats):
+    print(f"{stats['assets']} variants: {stats['source_bytes'] / 1024:.0f} KB of originals -> "
+          f"{stats['variant_bytes'] / 1024:.0f} KB served ({stats['saved']:.0%} less)")
+
+if __name__ == "__main__":
+    from exercise_library import EXERCISE_LIBRARY
+    urls = sorted({exercise['gif_url'] for exercise in EXERCISE_LIBRARY.values() if exercise.get('gif_url')})
+    for url in urls:
+        try:
+            prepare(url, DEMO_WIDTH)
+        except Exception as e:
+            print(f"Media cache error for {url}: {e}", file=sys.stderr)
+    report(get_media_stats())
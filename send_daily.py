@@ -1,10 +1,10 @@
-import pandas as pd
 import smtplib
 import random
 import datetime
+import utils
 
 # LOAD YOUR DB
-df = pd.read_csv('workouts.csv')
+df = utils.get_workouts()
 
 # PICK RANDOM
 if not df.empty:
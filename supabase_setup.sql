@@ -12,7 +12,8 @@ CREATE TABLE IF NOT EXISTS workouts (
     url TEXT NOT NULL,
     thumbnail TEXT,
     category TEXT,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    video_id TEXT
 );
 
 -- 2. Create the workout_calendar table (for scheduled workouts)
@@ -27,12 +28,55 @@ CREATE TABLE IF NOT EXISTS workout_calendar (
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- 2b. Generated plans ("Generate New Year") are stored as a spec; the app
+-- expands their workouts for the dates it shows (workout_plan.generate_plan)
+CREATE TABLE IF NOT EXISTS workout_plans (
+    id BIGSERIAL PRIMARY KEY,
+    start_date DATE NOT NULL,
+    days INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Changes to one planned workout: completion, edited fields (NULL keeps the
+-- planned value) or removal
+CREATE TABLE IF NOT EXISTS workout_plan_overrides (
+    plan_id BIGINT NOT NULL REFERENCES workout_plans(id) ON DELETE CASCADE,
+    date DATE NOT NULL,
+    slot INTEGER NOT NULL,
+    name TEXT,
+    type TEXT,
+    duration TEXT,
+    notes TEXT,
+    completed BOOLEAN,
+    removed BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (plan_id, date, slot)
+);
+
 -- 3. Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_workouts_category ON workouts(category);
 CREATE INDEX IF NOT EXISTS idx_workouts_created_at ON workouts(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_calendar_date ON workout_calendar(date);
 CREATE INDEX IF NOT EXISTS idx_calendar_completed ON workout_calendar(completed);
 
+-- Canonical YouTube video id (utils.get_video_id), unique so duplicate checks
+-- are a single index lookup. Tables created before the column existed are
+-- backfilled; later copies of an already saved video keep a NULL id.
+ALTER TABLE workouts ADD COLUMN IF NOT EXISTS video_id TEXT;
+UPDATE workouts w SET video_id = ids.video_id
+FROM (
+    SELECT id, video_id, ROW_NUMBER() OVER (PARTITION BY video_id ORDER BY id) AS copy
+    FROM (
+        SELECT id, (regexp_match(url, '(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/|live/|v/)|youtu\.be/)([A-Za-z0-9_-]{11})'))[1] AS video_id
+        FROM workouts
+        WHERE video_id IS NULL
+    ) parsed
+    WHERE video_id IS NOT NULL
+) ids
+WHERE w.id = ids.id AND ids.copy = 1
+  AND NOT EXISTS (SELECT 1 FROM workouts other WHERE other.video_id = ids.video_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_workouts_video_id ON workouts(video_id);
+
 -- 4. Enable Row Level Security (RLS) - Optional but recommended
 -- Uncomment these if you want to add user authentication later
 
@@ -48,6 +92,103 @@ GRANT ALL ON workouts TO anon;
 GRANT ALL ON workout_calendar TO anon;
 GRANT USAGE, SELECT ON SEQUENCE workouts_id_seq TO anon;
 GRANT USAGE, SELECT ON SEQUENCE workout_calendar_id_seq TO anon;
+GRANT ALL ON workout_plans TO anon;
+GRANT ALL ON workout_plan_overrides TO anon;
+GRANT USAGE, SELECT ON SEQUENCE workout_plans_id_seq TO anon;
+
+-- 6. Streak and progress aggregation
+-- Called by utils.get_progress_stats() through RPC, so the app fetches one row
+-- instead of the whole calendar. A day counts towards a streak when all its
+-- workouts are completed. The current streak counts calendar-consecutive
+-- complete days ending today (or yesterday if nothing is done yet today). The
+-- best streak counts complete days between two days with pending workouts.
+-- p_plan_days carries a generated plan's per-day counts
+-- ([{"date", "total", "completed"}, ...]), which have no rows to aggregate.
+DROP FUNCTION IF EXISTS get_progress_stats(DATE, INTEGER);
+DROP FUNCTION IF EXISTS get_progress_stats(DATE, INTEGER, JSONB);
+CREATE OR REPLACE FUNCTION get_progress_stats(p_today DATE DEFAULT CURRENT_DATE, p_weeks INTEGER DEFAULT 8,
+                                              p_plan_days JSONB DEFAULT '[]'::JSONB)
+RETURNS TABLE (
+    current_streak INTEGER,
+    best_streak INTEGER,
+    total_completed INTEGER,
+    last_completed DATE,
+    today_total INTEGER,
+    today_completed INTEGER,
+    scheduled_days INTEGER,
+    weekly JSONB
+)
+LANGUAGE sql STABLE AS $$
+    WITH days AS (
+        SELECT date, SUM(total) AS total, SUM(done) AS done
+        FROM (
+            SELECT date, COUNT(*) AS total, COUNT(*) FILTER (WHERE completed) AS done
+            FROM workout_calendar
+            GROUP BY date
+            UNION ALL
+            SELECT (day->>'date')::DATE, (day->>'total')::INTEGER, (day->>'completed')::INTEGER
+            FROM jsonb_array_elements(p_plan_days) AS day
+        ) counts
+        GROUP BY date
+    ),
+    flagged AS (
+        SELECT date, total, done, done >= total AS complete,
+               -- complete days between two pending days share a run_id
+               SUM(CASE WHEN done < total THEN 1 ELSE 0 END) OVER (ORDER BY date) AS run_id,
+               -- calendar-consecutive complete days share an island
+               date - (ROW_NUMBER() OVER (PARTITION BY done >= total ORDER BY date))::INTEGER AS island
+        FROM days
+    ),
+    anchor AS (
+        SELECT CASE WHEN EXISTS (SELECT 1 FROM days WHERE date = p_today AND done > 0)
+                    THEN p_today ELSE p_today - 1 END AS day
+    ),
+    runs AS (
+        SELECT run_id, COUNT(*) FILTER (WHERE complete) AS length
+        FROM flagged
+        GROUP BY run_id
+    ),
+    weeks AS (
+        SELECT (date_trunc('week', p_today) - w * INTERVAL '1 week')::DATE AS week_start
+        FROM generate_series(0, p_weeks - 1) AS w
+    ),
+    weekly AS (
+        SELECT wk.week_start, COALESCE(SUM(d.done), 0) AS completed, COALESCE(SUM(d.total), 0) AS total
+        FROM weeks wk
+        LEFT JOIN days d ON d.date >= wk.week_start AND d.date < wk.week_start + 7
+        GROUP BY wk.week_start
+    )
+    SELECT
+        (SELECT COUNT(*) FROM flagged f, anchor a
+         WHERE f.complete AND f.date <= a.day
+           AND f.island = (SELECT island FROM flagged WHERE complete AND date = a.day))::INTEGER,
+        (SELECT COALESCE(MAX(length), 0) FROM runs)::INTEGER,
+        (SELECT COALESCE(SUM(done), 0) FROM days)::INTEGER,
+        (SELECT MAX(date) FROM days WHERE done > 0),
+        (SELECT COALESCE(SUM(total), 0) FROM days WHERE date = p_today)::INTEGER,
+        (SELECT COALESCE(SUM(done), 0) FROM days WHERE date = p_today)::INTEGER,
+        (SELECT COUNT(*) FROM days)::INTEGER,
+        (SELECT jsonb_agg(jsonb_build_object('week_start', week_start, 'completed', completed, 'total', total)
+                          ORDER BY week_start)
+         FROM weekly);
+$$;
+
+GRANT EXECUTE ON FUNCTION get_progress_stats(DATE, INTEGER, JSONB) TO anon;
+
+-- 7. Saved videos per category
+-- Called by utils.get_category_counts() through RPC, so the collection page
+-- fetches one row per category instead of the category of every video
+DROP FUNCTION IF EXISTS get_category_counts();
+CREATE OR REPLACE FUNCTION get_category_counts()
+RETURNS TABLE (category TEXT, videos INTEGER)
+LANGUAGE sql STABLE AS $$
+    SELECT category, COUNT(*)::INTEGER AS videos
+    FROM workouts
+    GROUP BY category
+    ORDER BY videos DESC, category;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_category_counts() TO anon;
 
 -- ============================================
 -- DONE! Your tables are ready to use.
@@ -0,0 +1,28 @@
+# ============================================
+# SHARED FIXTURES
+# Tests run against the local SQLite backend in a temporary directory
+# ============================================
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+
+@pytest.fixture
+def local_db(tmp_path, monkeypatch):
+    """A fresh SQLite database in tmp_path, with utils' caches and indexes reset"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(utils, 'SUPABASE_ENABLED', False)
+    utils._db_local.conn = None
+    utils.invalidate_cache()
+    utils._reset_streak_index()
+    utils._expand_plan.cache_clear()
+    yield utils._get_db()
+    utils._db_local.conn.close()
+    utils._db_local.conn = None
+    utils.invalidate_cache()
+    utils._reset_streak_index()
@@ -0,0 +1,96 @@
+# ============================================
+# LOCAL MEDIA CACHE
+# media.prepare(): WebP variants, width cap, animated GIFs, reuse of cached files
+# ============================================
+
+import io
+import os
+import random
+import functools
+
+import pytest
+from PIL import Image
+
+import media
+
+STILL_URL = 'https://example.com/still.png'
+GIF_URL = 'https://example.com/demo.gif'
+COPY_URL = 'https://example.com/copy-of-still.png'
+
+def noisy_image(size, seed):
+    """An RGB image that does not compress to almost nothing"""
+    rng = random.Random(seed)
+    return Image.frombytes('RGB', size, rng.randbytes(size[0] * size[1] * 3))
+
+def png_bytes(size):
+    output = io.BytesIO()
+    noisy_image(size, 0).save(output, format='PNG')
+    return output.getvalue()
+
+def gif_bytes(size, frames):
+    output = io.BytesIO()
+    images = [noisy_image(size, seed) for seed in range(frames)]
+    images[0].save(output, format='GIF', save_all=True, append_images=images[1:], duration=80, loop=0)
+    return output.getvalue()
+
+@pytest.fixture
+def media_dir(tmp_path, monkeypatch):
+    """An empty media cache in tmp_path"""
+    monkeypatch.setattr(media, 'MEDIA_DIR', str(tmp_path))
+    monkeypatch.setattr(media, 'INDEX_FILE', str(tmp_path / 'index.json'))
+    monkeypatch.setattr(media, '_index', None)
+    return tmp_path
+
+@functools.lru_cache(maxsize=None)
+def sources():
+    """URL -> image bytes (built once; encoding the GIF is slow)"""
+    still = png_bytes((800, 600))
+    return {STILL_URL: still, COPY_URL: still, GIF_URL: gif_bytes((480, 360), 4)}
+
+@pytest.fixture
+def fetcher():
+    """Serves the fixture images and records the URLs it was asked for"""
+    def fetch(url):
+        fetch.calls.append(url)
+        return sources()[url]
+    fetch.calls = []
+    return fetch
+
+def test_still_becomes_smaller_webp(media_dir, fetcher):
+    filename = media.prepare(STILL_URL, media.DEMO_WIDTH, fetcher)
+    
+    assert filename.endswith('.webp')
+    path = media_dir / filename
+    with Image.open(path) as image:
+        assert image.format == 'WEBP'
+        assert image.size == (media.DEMO_WIDTH, 270)
+    assert path.stat().st_size < len(sources()[STILL_URL])
+
+def test_narrow_images_are_not_upscaled(media_dir, fetcher):
+    with Image.open(media_dir / media.prepare(STILL_URL, 1600, fetcher)) as image:
+        assert image.size == (800, 600)
+
+def test_animated_gif_keeps_its_frames(media_dir, fetcher):
+    filename = media.prepare(GIF_URL, media.DEMO_WIDTH, fetcher)
+    
+    with Image.open(media_dir / filename) as image:
+        assert image.format == 'WEBP'
+        assert image.size == (media.DEMO_WIDTH, 270)
+        assert image.n_frames == 4
+    assert media._load_index()[GIF_URL]['animated']
+
+def test_cached_variant_is_reused(media_dir, fetcher, monkeypatch):
+    filename = media.prepare(STILL_URL, media.DEMO_WIDTH, fetcher)
+    mtime = os.stat(media_dir / filename).st_mtime_ns
+    
+    # Same process, then a fresh one reading index.json: no fetch, no re-encode
+    monkeypatch.setattr(media, 'make_variant', lambda content, width: pytest.fail('variant rebuilt'))
+    assert media.prepare(STILL_URL, media.DEMO_WIDTH, fetcher) == filename
+    monkeypatch.setattr(media, '_index', None)
+    assert media.prepare(STILL_URL, media.DEMO_WIDTH, fetcher) == filename
+    assert fetcher.calls == [STILL_URL]
+    assert os.stat(media_dir / filename).st_mtime_ns == mtime
+    assert media.media_url(STILL_URL, media.DEMO_WIDTH) == f"{media.MEDIA_URL}/{filename}"
+    
+    # Another URL with identical content shares the stored file
+    assert media.prepare(COPY_URL, media.DEMO_WIDTH, fetcher) == filename
@@ -0,0 +1,83 @@
+# ============================================
+# PROGRESS STATS: SQL AGGREGATION VS STREAK INDEX
+# PROGRESS_STATS_SQL / WEEKLY_COMPLETION_SQL must agree with _StreakIndex
+# ============================================
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import utils
+
+def seed_calendar(today, seed):
+    """Stored workouts over the last 60 days: complete, pending, mixed and empty days"""
+    rng = random.Random(seed)
+    entries = []
+    for offset in range(1, 61):
+        date_str = (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+        kind = rng.choice(['complete', 'complete', 'complete', 'pending', 'mixed', 'empty'])
+        count = 0 if kind == 'empty' else rng.randint(1, 3)
+        for i in range(count):
+            done = kind == 'complete' or (kind == 'mixed' and i == 0 and count > 1)
+            entries.append((date_str, {'name': f'Workout {i}', 'type': 'Cardio', 'duration': '30 min',
+                                       'notes': '', 'completed': done}))
+    utils.add_workouts_to_calendar_bulk(entries)
+
+def complete_planned(today, days):
+    """Mark the generated plan's workouts completed (as overrides) on its first `days` training days"""
+    date = today
+    while days:
+        workouts = [w for w in utils.get_workouts_for_date(date.strftime("%Y-%m-%d")) if utils._is_planned(w['id'])]
+        for workout in workouts:
+            utils.mark_workout_complete_by_id(workout['id'], True)
+        days -= bool(workouts)
+        date += timedelta(days=1)
+
+def index_stats(today, weeks):
+    """The figures get_progress_stats() reports, computed from the streak index"""
+    utils._reset_streak_index()
+    with utils._streak_index.lock:
+        index = utils._read_streak_index()
+        today_str = today.strftime("%Y-%m-%d")
+        weekly = []
+        for w in reversed(range(weeks)):
+            week_start = today - timedelta(days=today.weekday(), weeks=w)
+            week = [(week_start + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(7)]
+            counts = [index.days.get(date_str, (0, 0)) for date_str in week]
+            weekly.append({'week_start': week[0], 'completed': sum(done for total, done in counts),
+                           'total': sum(total for total, done in counts)})
+        current = index.current_streak(today)
+        return {
+            'current_streak': current,
+            'best_streak': max(max(index.run_lengths), current),
+            'total_completed': index.total_completed,
+            'last_completed': index.active_days[-1] if index.active_days else None,
+            'today_total': index.days.get(today_str, (0, 0))[0],
+            'today_completed': index.days.get(today_str, (0, 0))[1],
+            'scheduled_days': len(index.days),
+            'weekly': weekly
+        }
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+@pytest.mark.parametrize('with_plan', [False, True])
+def test_sql_matches_streak_index(local_db, seed, with_plan):
+    today = datetime.now().date()
+    if with_plan:
+        assert utils.populate_sample_workouts()
+    seed_calendar(today, seed)
+    if with_plan:
+        # A stored workout done today next to the plan, and planned days completed through overrides
+        utils.add_workout_to_calendar(today.strftime("%Y-%m-%d"), {'name': 'Extra', 'completed': True})
+        complete_planned(today, 3)
+    
+    sql_stats = utils._query_progress_stats(today, utils.PROGRESS_WEEKS)
+    assert sql_stats == index_stats(today, utils.PROGRESS_WEEKS)
+    assert utils.count_scheduled_days() == sql_stats['scheduled_days']
+
+def test_empty_calendar(local_db):
+    today = datetime.now().date()
+    stats = utils._query_progress_stats(today, 2)
+    assert stats == index_stats(today, 2)
+    assert stats['current_streak'] == stats['best_streak'] == stats['scheduled_days'] == 0
+    assert stats['last_completed'] is None
@@ -0,0 +1,63 @@
+# ============================================
+# BATCH VIDEO FETCH
+# fetch_video_infos(): streaming results, per-URL timeout, failed extractions
+# ============================================
+
+import threading
+import time
+
+import utils
+
+FAST_URL = 'https://www.youtube.com/watch?v=aaaaaaaaaaa'
+SLOW_URL = 'https://www.youtube.com/watch?v=bbbbbbbbbbb'
+BROKEN_URL = 'https://www.youtube.com/watch?v=ccccccccccc'
+
+class StubExtractor:
+    """yt-dlp stand-in: the slow URL blocks until released, the broken one raises"""
+    
+    def __init__(self):
+        self.release = threading.Event()
+        self.slow_done = threading.Event()
+        self.calls = []
+    
+    def __call__(self, url):
+        self.calls.append(url)
+        if url == BROKEN_URL:
+            raise RuntimeError('extraction failed')
+        if url == SLOW_URL:
+            self.release.wait(10)
+            self.slow_done.set()
+        return {'title': f'Title of {url[-11:]}', 'uploader': 'Channel', 'thumbnail': 'thumb.jpg'}
+
+def cached_ids(conn):
+    return {row['video_id'] for row in conn.execute("SELECT video_id FROM video_info_cache")}
+
+def test_streams_results_and_times_out_slow_urls(local_db):
+    extractor = StubExtractor()
+    results = utils.fetch_video_infos([SLOW_URL, FAST_URL, BROKEN_URL], extractor, timeout=0.5)
+    
+    # The fast and broken URLs arrive while the slow extraction is still blocked
+    first_two = dict([next(results), next(results)])
+    assert first_two[FAST_URL]['title'] == 'Title of aaaaaaaaaaa'
+    assert first_two[BROKEN_URL] is None
+    assert not extractor.slow_done.is_set()
+    
+    start = time.monotonic()
+    assert next(results) == (SLOW_URL, None)
+    assert time.monotonic() - start < 5
+    assert list(results) == []
+    
+    # The late result of the timed-out extraction is discarded, not cached
+    extractor.release.set()
+    assert extractor.slow_done.wait(5)
+    time.sleep(0.2)
+    assert cached_ids(local_db) == {'aaaaaaaaaaa'}
+    assert utils.get_cached_video_info(SLOW_URL) is None
+
+def test_cached_urls_skip_the_extractor(local_db):
+    list(utils.fetch_video_infos([FAST_URL], StubExtractor()))
+    extractor = StubExtractor()
+    assert list(utils.fetch_video_infos([FAST_URL, FAST_URL], extractor)) == [
+        (FAST_URL, {'title': 'Title of aaaaaaaaaaa', 'channel': 'Channel', 'thumbnail': 'thumb.jpg', 'url': FAST_URL})
+    ]
+    assert extractor.calls == []
@@ -1,32 +1,490 @@
 import pandas as pd
 import yt_dlp
 import os
+import re
 import json
+import time
+import sqlite3
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import bisect
+import collections
 from datetime import datetime, timedelta
+import workout_plan
+from exercise_library import EXERCISE_LIBRARY, EXERCISE_DEMO_GIFS, EXERCISE_DEMO_MUSCLES, WORKOUT_TYPE_GIFS
 
 # Try to import Supabase
 try:
     from supabase import create_client, Client
-    from config import SUPABASE_URL, SUPABASE_KEY, WORKOUTS_TABLE, CALENDAR_TABLE
+    from config import SUPABASE_URL, SUPABASE_KEY, WORKOUTS_TABLE, CALENDAR_TABLE, PLANS_TABLE, PLAN_OVERRIDES_TABLE
     SUPABASE_ENABLED = SUPABASE_KEY != "YOUR_ANON_KEY_HERE" and SUPABASE_KEY != ""
 except ImportError:
     SUPABASE_ENABLED = False
 
-# Local file storage (fallback)
+# Local SQLite storage (fallback)
+SQLITE_FILE = 'jade_fitness.db'
+PROGRAMS_FILE = 'workout_programs.json'
+
+# Files written by older versions of the local backend (imported into SQLite once)
 DB_FILE = 'workouts.csv'
 CALENDAR_FILE = 'workout_calendar.json'
-PROGRAMS_FILE = 'workout_programs.json'
+CALENDAR_JOURNAL_FILE = 'workout_calendar.journal'
+
+# Calendar columns a workout update may change
+CALENDAR_COLUMNS = ('name', 'type', 'duration', 'notes', 'completed')
+
+# Rows per Supabase insert request for bulk calendar writes
+CALENDAR_BULK_CHUNK = 200
+
+# Supabase reads are cached per process; writes from other sessions show up
+# after at most this many seconds
+SUPABASE_CACHE_TTL = 30
+
+# Weeks of completion counts returned by get_progress_stats()
+PROGRESS_WEEKS = 8
+
+# Months loaded either side of the month the calendar page shows
+CALENDAR_EVENT_BUFFER_MONTHS = 1
+
+# Videos per page in the collection grid, and the sizes the page offers
+COLLECTION_PAGE_SIZE = 12
+COLLECTION_PAGE_SIZES = (12, 24, 48)
+
+# Batch video imports: parallel yt-dlp extractions and seconds allowed per URL
+VIDEO_FETCH_WORKERS = 4
+VIDEO_FETCH_TIMEOUT = 20
+
+# Seconds a cached yt-dlp result stays valid
+VIDEO_INFO_TTL = 7 * 24 * 3600
+
+# Title of a quick-added video until yt-dlp fills in its details, seconds
+# before a failed background fetch of those details is tried again, and
+# fetches made for one URL before only page loads and re-adds retry it
+QUICK_ADD_TITLE = 'YouTube video {video_id}'
+VIDEO_DETAILS_RETRY = 300
+VIDEO_DETAILS_ATTEMPTS = 3
+
+# Shared yt-dlp configuration (each worker thread keeps one YoutubeDL built from it)
+YTDL_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'socket_timeout': VIDEO_FETCH_TIMEOUT
+}
+
+# Backend calls (SQLite statements or Supabase requests) made by each thread
+_backend_calls = threading.local()
+
+def _count_backend_call(*args):
+    """Count one backend call for the current thread"""
+    _backend_calls.count = getattr(_backend_calls, 'count', 0) + 1
+
+def get_backend_call_count():
+    """Backend calls made so far by the current thread (one Streamlit session's rerun)"""
+    return getattr(_backend_calls, 'count', 0)
 
 # Initialize Supabase client
-supabase: Client = None
+supabase: "Client" = None
 if SUPABASE_ENABLED:
     try:
         supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+        supabase.postgrest.session.event_hooks['request'].append(_count_backend_call)
         print("✅ Connected to Supabase!")
     except Exception as e:
         print(f"⚠️ Supabase connection failed: {e}")
         SUPABASE_ENABLED = False
 
+# ============================================
+# LOCAL SQLITE BACKEND
+# ============================================
+# Without Supabase, videos and the calendar live in SQLITE_FILE. The schema
+# mirrors supabase_setup.sql. The database runs in WAL mode so Streamlit
+# sessions can keep reading while another one writes, and each thread gets
+# its own connection. Every query is parameterised, so sqlite3 reuses the
+# compiled statements from its per-connection cache.
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workouts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    channel TEXT,
+    url TEXT NOT NULL,
+    thumbnail TEXT,
+    category TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    video_id TEXT
+);
+
+CREATE TABLE IF NOT EXISTS workout_calendar (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    duration TEXT,
+    notes TEXT,
+    completed INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_workouts_category ON workouts(category);
+CREATE INDEX IF NOT EXISTS idx_workouts_created_at ON workouts(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_calendar_date ON workout_calendar(date);
+CREATE INDEX IF NOT EXISTS idx_calendar_completed ON workout_calendar(completed);
+
+-- Per-day workout and completion counts, kept in step by the triggers below
+CREATE TABLE IF NOT EXISTS calendar_days (
+    date TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS calendar_days_insert AFTER INSERT ON workout_calendar BEGIN
+    INSERT INTO calendar_days (date, total, completed) VALUES (NEW.date, 1, IFNULL(NEW.completed, 0) != 0)
+    ON CONFLICT(date) DO UPDATE SET total = total + 1, completed = completed + (IFNULL(NEW.completed, 0) != 0);
+END;
+
+CREATE TRIGGER IF NOT EXISTS calendar_days_delete AFTER DELETE ON workout_calendar BEGIN
+    UPDATE calendar_days SET total = total - 1, completed = completed - (IFNULL(OLD.completed, 0) != 0)
+    WHERE date = OLD.date;
+    DELETE FROM calendar_days WHERE date = OLD.date AND total <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS calendar_days_update AFTER UPDATE OF date, completed ON workout_calendar BEGIN
+    UPDATE calendar_days SET total = total - 1, completed = completed - (IFNULL(OLD.completed, 0) != 0)
+    WHERE date = OLD.date;
+    DELETE FROM calendar_days WHERE date = OLD.date AND total <= 0;
+    INSERT INTO calendar_days (date, total, completed) VALUES (NEW.date, 1, IFNULL(NEW.completed, 0) != 0)
+    ON CONFLICT(date) DO UPDATE SET total = total + 1, completed = completed + (IFNULL(NEW.completed, 0) != 0);
+END;
+
+-- Generated plans: a spec per plan, expanded on read, plus per-workout overrides
+CREATE TABLE IF NOT EXISTS workout_plans (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start_date TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS workout_plan_overrides (
+    plan_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    name TEXT,
+    type TEXT,
+    duration TEXT,
+    notes TEXT,
+    completed INTEGER,
+    removed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (plan_id, date, slot)
+);
+
+-- A generated plan's per-day counts, filled in before the progress queries
+-- run (per connection; see _query_progress_stats)
+CREATE TEMP TABLE IF NOT EXISTS plan_days (
+    date TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    completed INTEGER NOT NULL
+);
+
+-- yt-dlp results by YouTube video id. This cache always lives in SQLITE_FILE:
+-- with Supabase it is the only table of the file the app uses
+CREATE TABLE IF NOT EXISTS video_info_cache (
+    video_id TEXT PRIMARY KEY,
+    title TEXT,
+    channel TEXT,
+    thumbnail TEXT,
+    fetched_at REAL NOT NULL
+);
+"""
+
+_db_local = threading.local()
+_db_init_lock = threading.Lock()
+
+def _dict_row(cursor, row):
+    """sqlite3 row factory returning plain dicts, like Supabase rows"""
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+def _trace_statement(statement):
+    """sqlite3 trace callback: count queries, not trigger bodies or transaction control"""
+    if not statement.startswith(('--', 'BEGIN', 'COMMIT', 'ROLLBACK')):
+        _count_backend_call()
+
+def _get_db():
+    """Return this thread's SQLite connection, creating the schema on first use"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        with _db_init_lock:
+            is_new = not os.path.exists(SQLITE_FILE)
+            conn = sqlite3.connect(SQLITE_FILE, timeout=5.0)
+            conn.row_factory = _dict_row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SQLITE_SCHEMA)
+            _upgrade_schema(conn)
+            if is_new:
+                _import_legacy_files(conn)
+            conn.set_trace_callback(_trace_statement)
+        _db_local.conn = conn
+    return conn
+
+def _upgrade_schema(conn):
+    """Bring databases created by older versions up to SQLITE_SCHEMA"""
+    with conn:
+        if conn.execute("SELECT 1 FROM calendar_days LIMIT 1").fetchone() is None:
+            conn.execute(
+                "INSERT INTO calendar_days (date, total, completed) "
+                "SELECT date, COUNT(*), SUM(IFNULL(completed, 0) != 0) FROM workout_calendar GROUP BY date"
+            )
+        
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(workouts)")}
+        if 'video_id' not in columns:
+            conn.execute("ALTER TABLE workouts ADD COLUMN video_id TEXT")
+            # Backfill; later copies of an already saved video keep a NULL id
+            seen = set()
+            for row in conn.execute("SELECT id, url FROM workouts ORDER BY id").fetchall():
+                video_id = get_video_id(row['url'])
+                if video_id and video_id not in seen:
+                    seen.add(video_id)
+                    conn.execute("UPDATE workouts SET video_id = ? WHERE id = ?", (video_id, row['id']))
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_workouts_video_id ON workouts(video_id)")
+
+def _import_legacy_files(conn):
+    """Copy videos and calendar from the old CSV/JSON files into a new database"""
+    videos = []
+    if os.path.exists(DB_FILE):
+        df = pd.read_csv(DB_FILE).fillna('')
+        videos = [
+            (row['title'], row['channel'], row['url'], row['thumbnail'], row['category'], get_video_id(row['url']))
+            for row in df.to_dict('records')
+        ]
+    
+    try:
+        with open(CALENDAR_FILE, 'r') as f:
+            calendar_data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        calendar_data = {}
+    calendar_data = _replay_calendar_journal(calendar_data)
+    workouts = [
+        (date_str, w.get('name', ''), w.get('type', ''), w.get('duration', ''),
+         w.get('notes', ''), bool(w.get('completed', False)))
+        for date_str in sorted(calendar_data)
+        for w in calendar_data[date_str]
+    ]
+    
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO workouts (title, channel, url, thumbnail, category, video_id) VALUES (?, ?, ?, ?, ?, ?)",
+            videos
+        )
+        conn.executemany(
+            "INSERT INTO workout_calendar (date, name, type, duration, notes, completed) VALUES (?, ?, ?, ?, ?, ?)",
+            workouts
+        )
+
+def _replay_calendar_journal(calendar_data):
+    """Apply a leftover calendar journal from the file backend to its snapshot"""
+    try:
+        with open(CALENDAR_JOURNAL_FILE, 'r') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return calendar_data
+    
+    dates_by_id = {
+        w['id']: date_str
+        for date_str, workouts in calendar_data.items()
+        for w in workouts if 'id' in w
+    }
+    for line in lines:
+        try:
+            op = json.loads(line)
+        except json.JSONDecodeError:
+            # Blank or torn line from an interrupted write
+            continue
+        
+        if op.get('op') == 'add':
+            calendar_data.setdefault(op['date'], []).append(op['workout'])
+            if 'id' in op['workout']:
+                dates_by_id[op['workout']['id']] = op['date']
+            continue
+        
+        if 'id' in op:
+            date_str = dates_by_id.get(op['id'])
+            workouts = calendar_data.get(date_str) or []
+            index = next((i for i, w in enumerate(workouts) if w.get('id') == op['id']), -1)
+        else:
+            date_str = op.get('date')
+            workouts = calendar_data.get(date_str) or []
+            index = op.get('index', -1)
+        if not 0 <= index < len(workouts):
+            continue
+        
+        if op['op'] == 'update':
+            workouts[index] = dict(op['workout'], id=workouts[index].get('id'))
+        elif op['op'] == 'complete':
+            workouts[index]['completed'] = op['completed']
+        elif op['op'] == 'remove':
+            workouts.pop(index)
+            if not workouts:
+                del calendar_data[date_str]
+    return calendar_data
+
+def _row_to_workout(row):
+    """Convert a workout_calendar row (Supabase or SQLite) to a workout dict"""
+    return {
+        'id': row['id'],
+        'name': row['name'],
+        'type': row['type'],
+        'duration': row['duration'],
+        'notes': row.get('notes', ''),
+        'completed': bool(row.get('completed', False))
+    }
+
+# ============================================
+# READ CACHE
+# ============================================
+# Read functions are decorated with @_reads(name) and cached in-process per
+# argument tuple. Each entry is stamped with the data version it was read at:
+# the mtime/size of the SQLite files, or a TTL bucket on Supabase, so writes
+# from other processes are picked up. Write functions are decorated with
+# @_writes(name) and report what they changed through _calendar_changed();
+# afterwards only the entries covering those dates are dropped and the rest
+# are re-stamped, so e.g. ticking off today's workout keeps next month's
+# calendar range cached. Cached values are shared between callers and must
+# be treated as read-only.
+
+_read_cache = {}
+_cache_lock = threading.RLock()
+_cache_stats = {'hits': 0, 'misses': 0}
+_write_scope = threading.local()
+
+def _data_version():
+    """Current version of the stored data, used to validate cached reads
+    
+    Locally this is the mtime and size of the database files. Supabase exposes
+    no cheap change marker, so there it is a SUPABASE_CACHE_TTL time bucket:
+    writes from other sessions show up within that many seconds, while this
+    process's own writes invalidate their entries at once through @_writes.
+    """
+    if SUPABASE_ENABLED:
+        return int(time.time() // SUPABASE_CACHE_TTL)
+    
+    stamps = []
+    for path in (SQLITE_FILE, SQLITE_FILE + '-wal'):
+        try:
+            stat = os.stat(path)
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+def _cached_read(name, key, loader, span=None):
+    """Return loader() from the cache while the data version is unchanged
+    
+    span is the (first, last) date string the value depends on, or None if it
+    depends on the whole data set.
+    """
+    version = _data_version()
+    entry = _read_cache.get((name, key))
+    if entry is not None and entry[0] == version:
+        _cache_stats['hits'] += 1
+        return entry[2]
+    _cache_stats['misses'] += 1
+    value = loader()
+    with _cache_lock:
+        _read_cache[(name, key)] = (version, span, value)
+    return value
+
+def _reads(name, span=None):
+    """Decorator for read functions: cache results per arguments in data set `name`
+    
+    span(*args) returns the (first, last) date the result covers; without it
+    any change to the data set invalidates the result.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            return _cached_read(name, (func.__name__,) + args, lambda: func(*args),
+                                span(*args) if span else None)
+        return wrapper
+    return decorator
+
+def _calendar_changed(date_strs):
+    """Record the calendar dates a write changed (None if it may have changed any)"""
+    date_strs = None if date_strs is None else set(date_strs)
+    changes = getattr(_write_scope, 'changes', None)
+    if changes is not None and 'calendar' in changes:
+        if date_strs is None or changes['calendar'] is None:
+            changes['calendar'] = None
+        else:
+            changes['calendar'] |= date_strs
+    
+    if date_strs is None:
+        _reset_streak_index()
+    else:
+        _sync_streak_days(date_strs)
+
+def invalidate_cache(name=None):
+    """Drop cached reads for one data set ('calendar' or 'workouts') or all"""
+    with _cache_lock:
+        for cache_key in list(_read_cache):
+            if name is None or cache_key[0] == name:
+                del _read_cache[cache_key]
+
+def _writes(*names):
+    """Decorator for write functions: drop the cached reads they affect afterwards
+    
+    Calendar writes report the dates they touched via _calendar_changed(); a
+    data set with nothing reported is treated as entirely changed.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(_write_scope, 'changes', None) is not None:
+                # Nested write: the outermost one invalidates
+                return func(*args, **kwargs)
+            version_before = _data_version()
+            _write_scope.changes = {'calendar': set()} if 'calendar' in names else {}
+            reported = set(_write_scope.changes)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                changes = _write_scope.changes
+                _write_scope.changes = None
+                for name in names:
+                    if name not in reported:
+                        changes[name] = None
+                _invalidate_changes(changes, version_before)
+        return wrapper
+    return decorator
+
+def _invalidate_changes(changes, version_before):
+    """Drop cache entries a write affected and re-stamp the ones it did not"""
+    version_after = _data_version()
+    with _cache_lock:
+        for cache_key, (version, span, value) in list(_read_cache.items()):
+            name = cache_key[0]
+            if name in changes:
+                dates = changes[name]
+                if dates is None or (dates and (span is None or any(span[0] <= d <= span[1] for d in dates))):
+                    del _read_cache[cache_key]
+                    continue
+            if version == version_before:
+                _read_cache[cache_key] = (version_after, span, value)
+    
+    if 'calendar' not in changes:
+        # The calendar is untouched, so an index that was current still is
+        with _streak_index.lock:
+            if _streak_index.version == version_before:
+                _streak_index.version = version_after
+
+def get_cache_stats():
+    """Hit/miss counters and hit rate of the read cache"""
+    lookups = _cache_stats['hits'] + _cache_stats['misses']
+    return dict(_cache_stats, hit_rate=_cache_stats['hits'] / lookups if lookups else 0.0,
+                entries=len(_read_cache))
+
 # ============================================
 # DATABASE FUNCTIONS (with Supabase support)
 # ============================================
@@ -37,51 +495,310 @@ def init_db():
         # Supabase tables should be created via dashboard
         pass
     else:
-        if not os.path.exists(DB_FILE):
-            df = pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
-            df.to_csv(DB_FILE, index=False)
-
-def get_video_info(url):
-    """Get Video Details from YouTube"""
-    ydl_opts = {'quiet': True}
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        _get_db()
+
+# Canonical 11-character id in watch, youtu.be, shorts, embed and live URLs
+YOUTUBE_ID_PATTERN = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/|live/|v/)|youtu\.be/)([A-Za-z0-9_-]{11})'
+)
+
+def get_video_id(url):
+    """Extract the canonical YouTube video id from a URL (None if not YouTube)"""
+    match = YOUTUBE_ID_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+def has_video(url):
+    """Check whether the video behind a URL is already in the collection"""
+    video_id = get_video_id(url)
+    if not video_id:
+        return False
+    
+    if SUPABASE_ENABLED:
         try:
-            info = ydl.extract_info(url, download=False)
-            return {
-                'title': info.get('title', 'Unknown'),
-                'channel': info.get('uploader', 'Unknown'),
-                'thumbnail': info.get('thumbnail', ''),
-                'url': url
-            }
-        except Exception:
-            return None
+            response = supabase.table(WORKOUTS_TABLE).select("id").eq('video_id', video_id).limit(1).execute()
+            return bool(response.data)
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        row = _get_db().execute("SELECT 1 FROM workouts WHERE video_id = ?", (video_id,)).fetchone()
+        return row is not None
+
+_ytdl_local = threading.local()
+
+def _extract_info(url):
+    """Run yt-dlp on a URL with this thread's reusable YoutubeDL"""
+    ydl = getattr(_ytdl_local, 'ydl', None)
+    if ydl is None:
+        ydl = _ytdl_local.ydl = yt_dlp.YoutubeDL(YTDL_OPTIONS)
+    return ydl.extract_info(url, download=False)
 
+def get_video_info(url, extractor=None, refresh=False, store=True):
+    """Get Video Details from YouTube
+    
+    Results are cached on disk by video id for VIDEO_INFO_TTL seconds, in
+    the local SQLITE_FILE even when Supabase is enabled; refresh=True skips
+    the cache; store=False does not save the result. extractor(url) must
+    return a yt-dlp style info dict; it defaults to yt-dlp.
+    """
+    video_id = get_video_id(url)
+    if video_id and not refresh:
+        cached = get_cached_video_info(url)
+        if cached:
+            return cached
+    
+    try:
+        info = (extractor or _extract_info)(url)
+        video_data = {
+            'title': info.get('title', 'Unknown'),
+            'channel': info.get('uploader', 'Unknown'),
+            'thumbnail': info.get('thumbnail', ''),
+            'url': url
+        }
+    except Exception:
+        return None
+    
+    if video_id and store:
+        _store_video_info(video_id, video_data)
+    return video_data
+
+@_writes()
+def _store_video_info(video_id, video_data):
+    """Save yt-dlp results to the on-disk cache (no cached reads depend on it)"""
+    conn = _get_db()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO video_info_cache (video_id, title, channel, thumbnail, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (video_id, video_data['title'], video_data['channel'], video_data['thumbnail'], time.time())
+        )
+
+def get_cached_video_info(url):
+    """Video details from the on-disk cache, or None if missing or expired"""
+    video_id = get_video_id(url)
+    if not video_id:
+        return None
+    row = _get_db().execute(
+        "SELECT title, channel, thumbnail FROM video_info_cache WHERE video_id = ? AND fetched_at > ?",
+        (video_id, time.time() - VIDEO_INFO_TTL)
+    ).fetchone()
+    return dict(row, url=url) if row else None
+
+def get_quick_video_info(url):
+    """Placeholder video details built from the URL alone, without any network call"""
+    video_id = get_video_id(url)
+    if not video_id:
+        return None
+    return {
+        'title': QUICK_ADD_TITLE.format(video_id=video_id),
+        'channel': '',
+        'thumbnail': f'https://i.ytimg.com/vi/{video_id}/hqdefault.jpg',
+        'url': url
+    }
+
+def fetch_video_infos(urls, extractor=None, max_workers=VIDEO_FETCH_WORKERS, timeout=VIDEO_FETCH_TIMEOUT):
+    """Fetch video details for many URLs in parallel, yielding as each finishes
+    
+    Yields (url, video_data) in completion order. video_data is None when the
+    extraction failed or ran longer than `timeout` seconds. A timed-out
+    extraction cannot be interrupted: it keeps its worker thread until yt-dlp
+    returns, and its late result is discarded rather than cached.
+    """
+    started = {}
+    abandoned = set()
+    
+    def fetch(url):
+        started[url] = time.monotonic()
+        cached = get_cached_video_info(url)
+        if cached:
+            return cached
+        video_data = get_video_info(url, extractor, refresh=True, store=False)
+        video_id = get_video_id(url)
+        if video_data and video_id and url not in abandoned:
+            _store_video_info(video_id, video_data)
+        return video_data
+    
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='video-info')
+    try:
+        pending = {pool.submit(fetch, url): url for url in dict.fromkeys(urls)}
+        while pending:
+            deadlines = [started[url] + timeout for url in pending.values() if url in started]
+            wait_for = min(deadlines) - time.monotonic() if deadlines else timeout
+            done, _ = wait(pending, timeout=max(wait_for, 0.01), return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+            
+            now = time.monotonic()
+            for future, url in list(pending.items()):
+                if url in started and now - started[url] > timeout:
+                    del pending[future]
+                    abandoned.add(url)
+                    yield url, None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+@_writes('workouts')
+def _insert_video(video_data):
+    """Store one video dict (title, channel, url, thumbnail, category)"""
+    video_data['video_id'] = get_video_id(video_data['url'])
+    
+    if SUPABASE_ENABLED:
+        try:
+            # Add created_at timestamp for Supabase
+            video_data['created_at'] = datetime.now().isoformat()
+            supabase.table(WORKOUTS_TABLE).insert(video_data).execute()
+            return True
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        conn = _get_db()
+        with conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO workouts (title, channel, url, thumbnail, category, video_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (video_data['title'], video_data['channel'], video_data['url'],
+                 video_data['thumbnail'], video_data['category'], video_data['video_id'])
+            )
+        return cursor.rowcount == 1
+
+@_writes('workouts')
 def add_workout(url, category):
-    """Add a workout video to the database"""
-    video_data = get_video_info(url)
+    """Add a workout video to the database (False if missing or already saved)
+    
+    A YouTube URL whose details are not cached is saved straight away with a
+    placeholder title and the i.ytimg.com thumbnail; yt-dlp then fills in
+    the real details in the background. A failed fetch is retried
+    VIDEO_DETAILS_RETRY seconds later (VIDEO_DETAILS_ATTEMPTS fetches in
+    all), and again when the URL is added or its collection page loads.
+    """
+    if has_video(url):
+        if url in _details_failed:
+            _schedule_details(url)
+        return False
+    
+    cached = get_cached_video_info(url)
+    video_data = cached or get_quick_video_info(url)
+    needs_details = cached is None and video_data is not None
+    if video_data is None:
+        video_data = get_video_info(url)
     if video_data:
         video_data['category'] = category
+        added = _insert_video(video_data)
+        if added and needs_details:
+            _schedule_details(url)
+        return added
+    return False
+
+_details_pool = None
+_details_pool_lock = threading.Lock()
+# URLs with a detail fetch queued or running, the time each URL's last fetch
+# failed, and the fetches each has failed so far
+_details_pending = set()
+_details_failed = {}
+_details_attempts = {}
+
+def _get_details_pool():
+    """Thread pool for filling in video details after a quick add"""
+    global _details_pool
+    with _details_pool_lock:
+        if _details_pool is None:
+            _details_pool = ThreadPoolExecutor(max_workers=VIDEO_FETCH_WORKERS, thread_name_prefix='video-details')
+    return _details_pool
+
+def _schedule_details(url, due=False):
+    """Queue a background detail fetch unless one is queued or (unless due) failed under VIDEO_DETAILS_RETRY ago"""
+    with _details_pool_lock:
+        if url in _details_pending or (not due and time.time() - _details_failed.get(url, 0) < VIDEO_DETAILS_RETRY):
+            return
+        _details_pending.add(url)
+    _get_details_pool().submit(_fill_video_details, url)
+
+def _details_fetch_failed(url):
+    """Record a failed detail fetch and retry it after VIDEO_DETAILS_RETRY seconds"""
+    with _details_pool_lock:
+        _details_failed[url] = time.time()
+        attempts = _details_attempts[url] = _details_attempts.get(url, 0) + 1
+    if attempts < VIDEO_DETAILS_ATTEMPTS:
+        timer = threading.Timer(VIDEO_DETAILS_RETRY, _schedule_details, (url, True))
+        timer.daemon = True
+        timer.start()
+
+def _retry_placeholders(frame):
+    """Queue detail fetches for quick-added videos still showing their placeholder"""
+    if frame.empty or 'video_id' not in frame:
+        return
+    placeholders = frame['title'] == frame['video_id'].map(
+        lambda video_id: QUICK_ADD_TITLE.format(video_id=video_id) if video_id else None)
+    for url in frame.loc[placeholders, 'url']:
+        _schedule_details(url)
+
+@_writes('workouts')
+def _fill_video_details(url):
+    """Replace a quick-add placeholder with the details from yt-dlp"""
+    try:
+        video_data = get_video_info(url)
+        if not video_data:
+            _details_fetch_failed(url)
+            return False
+        fields = {column: video_data[column] for column in ('title', 'channel', 'thumbnail')}
         
         if SUPABASE_ENABLED:
             try:
-                # Add created_at timestamp for Supabase
-                video_data['created_at'] = datetime.now().isoformat()
-                supabase.table(WORKOUTS_TABLE).insert(video_data).execute()
-                return True
+                supabase.table(WORKOUTS_TABLE).update(fields).eq('video_id', get_video_id(url)).execute()
             except Exception as e:
                 print(f"Supabase error: {e}")
+                _details_fetch_failed(url)
                 return False
         else:
-            init_db()
-            df = pd.read_csv(DB_FILE)
-            new_row = pd.DataFrame([video_data])
-            df = pd.concat([df, new_row], ignore_index=True)
-            df.to_csv(DB_FILE, index=False)
-            return True
-    return False
+            conn = _get_db()
+            with conn:
+                conn.execute(
+                    "UPDATE workouts SET title = ?, channel = ?, thumbnail = ? WHERE video_id = ?",
+                    (*fields.values(), get_video_id(url))
+                )
+        with _details_pool_lock:
+            _details_failed.pop(url, None)
+            _details_attempts.pop(url, None)
+        return True
+    finally:
+        with _details_pool_lock:
+            _details_pending.discard(url)
 
+def add_workouts_batch(urls, category, extractor=None, max_workers=VIDEO_FETCH_WORKERS, timeout=VIDEO_FETCH_TIMEOUT):
+    """Add many workout videos, yielding one result per URL as soon as it is known
+    
+    Results are {'url', 'status', 'title'} dicts with status 'added',
+    'duplicate' or 'failed'. Duplicates (already saved or repeated in `urls`)
+    are reported first; the rest arrive in the order their extraction finishes.
+    """
+    to_fetch = []
+    seen = set()
+    for url in (url.strip() for url in urls):
+        if not url:
+            continue
+        key = get_video_id(url) or url
+        if key in seen or has_video(url):
+            yield {'url': url, 'status': 'duplicate', 'title': None}
+            continue
+        seen.add(key)
+        to_fetch.append(url)
+    
+    for url, video_data in fetch_video_infos(to_fetch, extractor, max_workers, timeout):
+        if video_data is None:
+            yield {'url': url, 'status': 'failed', 'title': None}
+            continue
+        video_data['category'] = category
+        added = _insert_video(video_data)
+        yield {'url': url, 'status': 'added' if added else 'failed', 'title': video_data['title']}
+
+@_reads('workouts')
 def get_workouts():
-    """Load all workouts from database"""
+    """Load all workouts from database (cached until the collection changes)
+    
+    Like get_workouts_page(), each load also retries the details of
+    quick-added videos whose background fetch failed.
+    """
     if SUPABASE_ENABLED:
         try:
             # Try ordering by created_at, fallback to no ordering if column doesn't exist
@@ -89,16 +806,86 @@ def get_workouts():
                 response = supabase.table(WORKOUTS_TABLE).select("*").order('created_at', desc=True).execute()
             except:
                 response = supabase.table(WORKOUTS_TABLE).select("*").execute()
-            if response.data:
-                return pd.DataFrame(response.data)
+            if not response.data:
+                return pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
+            frame = pd.DataFrame(response.data)
+        except Exception as e:
+            print(f"Supabase error: {e}")
             return pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
+    else:
+        frame = _query_frame("SELECT * FROM workouts ORDER BY id")
+    _retry_placeholders(frame)
+    return frame
+
+def _query_frame(sql, params=()):
+    """Run a workouts query and build the frame column by column from plain tuples"""
+    cursor = _get_db().cursor()
+    cursor.row_factory = None
+    rows = cursor.execute(sql, params).fetchall()
+    if rows:
+        columns = [column[0] for column in cursor.description]
+        return pd.DataFrame(dict(zip(columns, map(list, zip(*rows)))))
+    return pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
+
+@_reads('workouts')
+def get_workouts_page(page, page_size=COLLECTION_PAGE_SIZE, category=None):
+    """One page (0-based) of saved videos, newest first, optionally from a single category
+    
+    Quick-added videos on the page that still show their placeholder get
+    their details fetched again (see add_workout).
+    """
+    offset = page * page_size
+    if SUPABASE_ENABLED:
+        try:
+            query = supabase.table(WORKOUTS_TABLE).select("*")
+            if category:
+                query = query.eq('category', category)
+            # id breaks created_at ties (seeded videos share one), so pages never overlap
+            response = query.order('created_at', desc=True).order('id', desc=True) \
+                .range(offset, offset + page_size - 1).execute()
+            if not response.data:
+                return pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
+            frame = pd.DataFrame(response.data)
         except Exception as e:
             print(f"Supabase error: {e}")
             return pd.DataFrame(columns=['title', 'channel', 'url', 'thumbnail', 'category'])
+    elif category:
+        frame = _query_frame("SELECT * FROM workouts WHERE category = ? ORDER BY id DESC LIMIT ? OFFSET ?",
+                             (category, page_size, offset))
     else:
-        init_db()
-        return pd.read_csv(DB_FILE)
+        frame = _query_frame("SELECT * FROM workouts ORDER BY id DESC LIMIT ? OFFSET ?", (page_size, offset))
+    _retry_placeholders(frame)
+    return frame
 
+@_reads('workouts')
+def get_category_counts():
+    """Number of saved videos per category, largest first"""
+    if SUPABASE_ENABLED:
+        try:
+            # Grouped by the get_category_counts() function in supabase_setup.sql
+            rows = supabase.rpc('get_category_counts', {}).execute().data
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            # Databases set up before the function existed: count every row here
+            try:
+                response = supabase.table(WORKOUTS_TABLE).select("category").execute()
+                return dict(collections.Counter(row['category'] for row in response.data).most_common())
+            except Exception as e:
+                print(f"Supabase error: {e}")
+                return {}
+    else:
+        rows = _get_db().execute(
+            "SELECT category, COUNT(*) AS videos FROM workouts GROUP BY category ORDER BY videos DESC, category"
+        ).fetchall()
+    return {row['category']: row['videos'] for row in rows}
+
+def get_thumbnail_url(video_id, fallback=None, size='mqdefault'):
+    """A YouTube thumbnail at a smaller size (mqdefault is 320x180) than the stored one"""
+    if isinstance(video_id, str) and video_id:
+        return f"https://i.ytimg.com/vi/{video_id}/{size}.jpg"
+    return fallback
+
+@_writes('workouts')
 def delete_workout(workout_id):
     """Delete a workout from database"""
     if SUPABASE_ENABLED:
@@ -108,7 +895,11 @@ def delete_workout(workout_id):
         except Exception as e:
             print(f"Supabase error: {e}")
             return False
-    return False
+    else:
+        conn = _get_db()
+        with conn:
+            conn.execute("DELETE FROM workouts WHERE id = ?", (int(workout_id),))
+        return True
 
 # ============================================
 # PRE-POPULATED WORKOUT VIDEOS
@@ -206,43 +997,236 @@ def get_starter_videos():
     """Get the curated starter workout videos"""
     return CURATED_WORKOUT_VIDEOS
 
+@_writes('workouts')
 def seed_starter_videos():
     """Seed the database with starter videos if empty"""
     df = get_workouts()
     if df.empty:
-        for video in CURATED_WORKOUT_VIDEOS:
-            if SUPABASE_ENABLED:
-                try:
-                    video_data = video.copy()
-                    video_data['created_at'] = datetime.now().isoformat()
-                    supabase.table(WORKOUTS_TABLE).insert(video_data).execute()
-                except Exception as e:
-                    print(f"Error seeding video: {e}")
-            else:
-                init_db()
-                df = pd.read_csv(DB_FILE)
-                new_row = pd.DataFrame([video])
-                df = pd.concat([df, new_row], ignore_index=True)
-                df.to_csv(DB_FILE, index=False)
+        if SUPABASE_ENABLED:
+            try:
+                created_at = datetime.now().isoformat()
+                supabase.table(WORKOUTS_TABLE).upsert(
+                    [dict(video, video_id=get_video_id(video['url']), created_at=created_at)
+                     for video in CURATED_WORKOUT_VIDEOS],
+                    on_conflict='video_id', ignore_duplicates=True
+                ).execute()
+            except Exception as e:
+                print(f"Error seeding videos: {e}")
+        else:
+            conn = _get_db()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO workouts (title, channel, url, thumbnail, category, video_id) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(v['title'], v['channel'], v['url'], v['thumbnail'], v['category'], get_video_id(v['url']))
+                     for v in CURATED_WORKOUT_VIDEOS]
+                )
         return True
     return False
 
+# ============================================
+# GENERATED PLANS
+# ============================================
+# "Generate New Year" stores a plan spec (start date, days, seed) instead of a
+# row per workout. Reads expand the spec with workout_plan.generate_plan() for
+# the dates they cover and apply the plan's overrides: completion, edited
+# fields or removal of one planned workout, keyed by (date, slot). Planned
+# workouts come before stored ones on the same date and carry ids of the form
+# 'plan:<plan id>:<date>:<slot>', which the by-id mutations below route to the
+# overrides table.
+
+PLAN_ID_PREFIX = 'plan:'
+
+def _fetch_plan(date_strs=None):
+    """The latest stored plan with its overrides (only those on date_strs if given)"""
+    if SUPABASE_ENABLED:
+        try:
+            response = supabase.table(PLANS_TABLE).select("*").order('id', desc=True).limit(1).execute()
+            if not response.data:
+                return None
+            plan = response.data[0]
+            query = supabase.table(PLAN_OVERRIDES_TABLE).select("*").eq('plan_id', plan['id'])
+            if date_strs is not None:
+                query = query.in_('date', list(date_strs))
+            overrides = query.execute().data
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return None
+    else:
+        conn = _get_db()
+        plan = conn.execute("SELECT * FROM workout_plans ORDER BY id DESC LIMIT 1").fetchone()
+        if plan is None:
+            return None
+        if date_strs is None:
+            overrides = conn.execute(
+                "SELECT * FROM workout_plan_overrides WHERE plan_id = ?", (plan['id'],)
+            ).fetchall()
+        else:
+            date_strs = list(date_strs)
+            placeholders = ", ".join("?" for _ in date_strs)
+            overrides = conn.execute(
+                f"SELECT * FROM workout_plan_overrides WHERE plan_id = ? AND date IN ({placeholders})",
+                (plan['id'], *date_strs)
+            ).fetchall()
+    
+    return {
+        'id': plan['id'],
+        'start_date': str(plan['start_date'])[:10],
+        'days': plan['days'],
+        'seed': plan['seed'],
+        'overrides': {(str(row['date'])[:10], row['slot']): row for row in overrides}
+    }
+
+@_reads('calendar')
+def _load_plan():
+    """The latest plan and all its overrides (cached until the calendar changes)"""
+    return _fetch_plan()
+
+@functools.lru_cache(maxsize=4)
+def _expand_plan(start_str, days, seed):
+    """A plan spec's workouts as ({date_str: [workout, ...]}, sorted dates)"""
+    planned = {}
+    for date_str, workout in workout_plan.plan_entries(workout_plan.generate_plan(start_str, days=days, seed=seed)):
+        planned.setdefault(date_str, []).append(workout)
+    return planned, sorted(planned)
+
+def _plan_dates(plan, start_str=None, end_str=None):
+    """Dates the plan schedules workouts on, optionally only those in [start_str, end_str]"""
+    dates = _expand_plan(plan['start_date'], plan['days'], plan['seed'])[1]
+    lo = bisect.bisect_left(dates, start_str) if start_str else 0
+    hi = bisect.bisect_right(dates, end_str) if end_str else len(dates)
+    return dates[lo:hi]
+
+def _plan_workouts(plan, date_str):
+    """The plan's workouts on one date with their overrides applied"""
+    planned = _expand_plan(plan['start_date'], plan['days'], plan['seed'])[0].get(date_str, ())
+    workouts = []
+    for slot, workout in enumerate(planned):
+        workout = dict(workout, id=f"{PLAN_ID_PREFIX}{plan['id']}:{date_str}:{slot}")
+        override = plan['overrides'].get((date_str, slot))
+        if override is not None:
+            if override['removed']:
+                continue
+            workout.update({column: override[column] for column in CALENDAR_COLUMNS if override.get(column) is not None})
+            workout['completed'] = bool(workout['completed'])
+        workouts.append(workout)
+    return workouts
+
+def _merge_plan(calendar_data, plan, start_str=None, end_str=None):
+    """Stored workouts keyed by date plus the plan's workouts in [start_str, end_str]"""
+    if plan is None:
+        return calendar_data
+    merged = {}
+    for date_str in _plan_dates(plan, start_str, end_str):
+        workouts = _plan_workouts(plan, date_str)
+        if workouts:
+            merged[date_str] = workouts
+    for date_str, workouts in calendar_data.items():
+        merged[date_str] = merged.get(date_str, []) + workouts
+    return dict(sorted(merged.items()))
+
+def _plan_day_counts(plan, date_strs=None):
+    """Per-day (total, completed) counts of the plan's workouts"""
+    planned = _expand_plan(plan['start_date'], plan['days'], plan['seed'])[0]
+    overridden = {date_str for date_str, _ in plan['overrides']}
+    counts = {}
+    for date_str in _plan_dates(plan) if date_strs is None else date_strs:
+        if date_str in overridden:
+            workouts = _plan_workouts(plan, date_str)
+            if workouts:
+                counts[date_str] = (len(workouts), sum(1 for w in workouts if w['completed']))
+        elif date_str in planned:
+            # Planned workouts start out pending
+            counts[date_str] = (len(planned[date_str]), 0)
+    return counts
+
+def _add_day_counts(counts, more):
+    """Add the per-day counts in `more` to `counts` (in place)"""
+    for date_str, (total, done) in more.items():
+        old_total, old_done = counts.get(date_str, (0, 0))
+        counts[date_str] = (old_total + total, old_done + done)
+    return counts
+
+def _is_planned(workout_id):
+    """Whether a workout id belongs to a generated plan rather than a stored row"""
+    return isinstance(workout_id, str) and workout_id.startswith(PLAN_ID_PREFIX)
+
+def _parse_plan_id(workout_id):
+    """(plan id, date_str, slot) from a planned workout's id"""
+    plan_id, date_str, slot = workout_id[len(PLAN_ID_PREFIX):].split(':')
+    return int(plan_id), date_str, int(slot)
+
+@_writes('calendar')
+def _store_plan(start_str, days, seed):
+    """Save a plan spec; its workouts show up on the calendar from then on"""
+    if SUPABASE_ENABLED:
+        try:
+            supabase.table(PLANS_TABLE).insert({'start_date': start_str, 'days': days, 'seed': seed}).execute()
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        conn = _get_db()
+        with conn:
+            conn.execute("INSERT INTO workout_plans (start_date, days, seed) VALUES (?, ?, ?)", (start_str, days, seed))
+    _calendar_changed(None)
+    return True
+
+@_writes('calendar')
+def _override_planned_workouts(workout_ids, fields):
+    """Upsert override `fields` (CALENDAR_COLUMNS or 'removed') for planned workouts"""
+    keys = [_parse_plan_id(workout_id) for workout_id in workout_ids]
+    if not keys or not fields:
+        return False
+    
+    if SUPABASE_ENABLED:
+        try:
+            supabase.table(PLAN_OVERRIDES_TABLE).upsert(
+                [dict(fields, plan_id=plan_id, date=date_str, slot=slot) for plan_id, date_str, slot in keys],
+                on_conflict='plan_id,date,slot'
+            ).execute()
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        columns = ", ".join(fields)
+        placeholders = ", ".join("?" for _ in fields)
+        assignments = ", ".join(f"{column} = excluded.{column}" for column in fields)
+        conn = _get_db()
+        with conn:
+            conn.executemany(
+                f"INSERT INTO workout_plan_overrides (plan_id, date, slot, {columns}) VALUES (?, ?, ?, {placeholders}) "
+                f"ON CONFLICT (plan_id, date, slot) DO UPDATE SET {assignments}",
+                [(*key, *fields.values()) for key in keys]
+            )
+    _calendar_changed(date_str for _, date_str, _ in keys)
+    return True
+
 # ============================================
 # CALENDAR FUNCTIONS (with Supabase support)
 # ============================================
 
+@_writes('calendar')
 def clear_calendar():
     """Clear all workouts from the calendar"""
     if SUPABASE_ENABLED:
         try:
             # Delete all records from calendar table
             supabase.table(CALENDAR_TABLE).delete().neq('id', 0).execute()
+            _calendar_changed(None)
+            # Overrides go with their plan (ON DELETE CASCADE)
+            supabase.table(PLANS_TABLE).delete().neq('id', 0).execute()
             return True
         except Exception as e:
             print(f"Supabase error clearing calendar: {e}")
             return False
     else:
-        save_calendar({})
+        conn = _get_db()
+        with conn:
+            conn.execute("DELETE FROM workout_calendar")
+            conn.execute("DELETE FROM workout_plan_overrides")
+            conn.execute("DELETE FROM workout_plans")
+        _calendar_changed(None)
         return True
 
 def init_calendar():
@@ -250,322 +1234,63 @@ def init_calendar():
     if SUPABASE_ENABLED:
         pass  # Tables created via Supabase dashboard
     else:
-        if not os.path.exists(CALENDAR_FILE):
-            save_calendar({})
+        _get_db()
     return load_calendar()
 
-def populate_sample_workouts():
-    """Create a comprehensive ONE-YEAR workout calendar with progressive training"""
-    from datetime import datetime, timedelta
-    import random
-    
-    calendar = load_calendar()
+def populate_sample_workouts(seed=workout_plan.DEFAULT_PLAN_SEED):
+    """Create a comprehensive ONE-YEAR workout calendar with progressive training
     
+    Only the plan spec is stored; its workouts are expanded when read. Without
+    the plan tables (an older Supabase setup) the workouts are stored as rows.
+    """
     # Only populate if calendar is empty
-    if calendar:
+    if count_scheduled_days():
         return False
     
     today = datetime.now().date()
-    
-    # ===== COMPREHENSIVE WORKOUT LIBRARY =====
-    
-    # Lower Body Workouts (Progressive)
-    lower_body_beginner = [
-        {"name": "Bodyweight Squats & Lunges", "type": "Lower Body", "duration": "25 min", "notes": "3x12 squats, 3x10 lunges each leg"},
-        {"name": "Glute Bridges & Kickbacks", "type": "Lower Body", "duration": "20 min", "notes": "3x15 bridges, 3x12 kickbacks"},
-        {"name": "Wall Sits & Calf Raises", "type": "Lower Body", "duration": "20 min", "notes": "3x30sec wall sit, 3x20 calf raises"},
-    ]
-    
-    lower_body_intermediate = [
-        {"name": "Sumo Squats & Romanian Deadlifts", "type": "Lower Body", "duration": "35 min", "notes": "4x12 sumo squats, 4x10 RDL with weights"},
-        {"name": "Bulgarian Split Squats", "type": "Lower Body", "duration": "30 min", "notes": "4x10 each leg, add weights"},
-        {"name": "Hip Thrusts & Step Ups", "type": "Lower Body", "duration": "35 min", "notes": "4x15 hip thrusts, 3x12 step ups"},
-        {"name": "Goblet Squats & Leg Press", "type": "Lower Body", "duration": "40 min", "notes": "4x12 goblet, 4x15 leg press"},
-    ]
-    
-    lower_body_advanced = [
-        {"name": "Barbell Squats & Deadlifts", "type": "Lower Body", "duration": "50 min", "notes": "5x5 squats, 5x5 deadlifts - heavy"},
-        {"name": "Power Leg Day", "type": "Lower Body", "duration": "55 min", "notes": "Jump squats, box jumps, weighted lunges"},
-        {"name": "Glute Destroyer", "type": "Lower Body", "duration": "45 min", "notes": "Heavy hip thrusts, sumo deads, cable kickbacks"},
-        {"name": "Quad & Ham Focus", "type": "Lower Body", "duration": "50 min", "notes": "Front squats, leg curls, leg extensions"},
-    ]
-    
-    # Upper Body Workouts (Progressive)
-    upper_body_beginner = [
-        {"name": "Push-ups & Arm Circles", "type": "Upper Body", "duration": "20 min", "notes": "Modified push-ups 3x8, arm mobility"},
-        {"name": "Tricep Dips & Wall Push-ups", "type": "Upper Body", "duration": "20 min", "notes": "Chair dips 3x10, wall push 3x12"},
-        {"name": "Resistance Band Arms", "type": "Upper Body", "duration": "25 min", "notes": "Band curls, band rows, band presses"},
-    ]
-    
-    upper_body_intermediate = [
-        {"name": "Dumbbell Chest & Back", "type": "Upper Body", "duration": "35 min", "notes": "DB press 4x10, rows 4x12, flyes 3x12"},
-        {"name": "Shoulder Sculpt", "type": "Upper Body", "duration": "30 min", "notes": "OHP 4x10, lateral raises 4x12, rear delts"},
-        {"name": "Biceps & Triceps Tone", "type": "Upper Body", "duration": "30 min", "notes": "Curls 4x12, tricep extensions 4x12"},
-        {"name": "Push-Pull Combo", "type": "Upper Body", "duration": "40 min", "notes": "Push-ups, rows, shoulder press circuit"},
-    ]
-    
-    upper_body_advanced = [
-        {"name": "Heavy Push Day", "type": "Upper Body", "duration": "50 min", "notes": "Bench 5x5, incline DB, dips, tricep work"},
-        {"name": "Heavy Pull Day", "type": "Upper Body", "duration": "50 min", "notes": "Pull-ups, barbell rows, face pulls, curls"},
-        {"name": "Shoulder Power", "type": "Upper Body", "duration": "45 min", "notes": "Military press 5x5, Arnold press, raises"},
-        {"name": "Arm Blast", "type": "Upper Body", "duration": "40 min", "notes": "Supersets: curls + triceps, 21s, drop sets"},
-    ]
-    
-    # Core Workouts (Progressive)
-    core_beginner = [
-        {"name": "Basic Core Work", "type": "Core", "duration": "15 min", "notes": "Crunches, dead bugs, bird dogs"},
-        {"name": "Plank Challenge", "type": "Core", "duration": "15 min", "notes": "Plank holds, side planks, knee tucks"},
-    ]
-    
-    core_intermediate = [
-        {"name": "Ab Burner", "type": "Core", "duration": "20 min", "notes": "Bicycle crunches, leg raises, Russian twists"},
-        {"name": "Core Stability", "type": "Core", "duration": "25 min", "notes": "Plank variations, hollow holds, mountain climbers"},
-        {"name": "Pilates Core", "type": "Core", "duration": "30 min", "notes": "Hundred, scissors, roll-ups, teaser"},
-    ]
-    
-    core_advanced = [
-        {"name": "Intense Ab Circuit", "type": "Core", "duration": "25 min", "notes": "Hanging leg raises, ab wheel, weighted crunches"},
-        {"name": "Functional Core", "type": "Core", "duration": "30 min", "notes": "Turkish get-ups, windmills, loaded carries"},
-    ]
-    
-    # HIIT Workouts (Progressive)
-    hiit_beginner = [
-        {"name": "Beginner HIIT", "type": "HIIT", "duration": "20 min", "notes": "30s work/30s rest - squats, jacks, marching"},
-        {"name": "Low Impact HIIT", "type": "HIIT", "duration": "25 min", "notes": "Step touches, modified burpees, knee lifts"},
-    ]
-    
-    hiit_intermediate = [
-        {"name": "Tabata Burn", "type": "HIIT", "duration": "30 min", "notes": "20s on/10s off x 8 rounds, multiple exercises"},
-        {"name": "EMOM Challenge", "type": "HIIT", "duration": "30 min", "notes": "Every minute: 10 burpees, 15 squats"},
-        {"name": "Cardio HIIT", "type": "HIIT", "duration": "35 min", "notes": "High knees, burpees, jump lunges, mountain climbers"},
-    ]
-    
-    hiit_advanced = [
-        {"name": "Extreme HIIT", "type": "HIIT", "duration": "40 min", "notes": "45s work/15s rest - plyometrics, burpees, sprints"},
-        {"name": "MetCon Madness", "type": "HIIT", "duration": "45 min", "notes": "Metabolic conditioning: AMRAPs and EMOMs"},
-        {"name": "Warrior HIIT", "type": "HIIT", "duration": "40 min", "notes": "Battle ropes, box jumps, kettlebell swings"},
-    ]
-    
-    # Full Body Workouts (Progressive)
-    full_body_beginner = [
-        {"name": "Full Body Basics", "type": "Full Body", "duration": "30 min", "notes": "Squats, push-ups, lunges, planks"},
-        {"name": "Total Body Tone", "type": "Full Body", "duration": "30 min", "notes": "Light weights, 3 rounds full body circuit"},
-    ]
-    
-    full_body_intermediate = [
-        {"name": "Full Body Strength", "type": "Full Body", "duration": "45 min", "notes": "Compound movements: squat, press, row, lunge"},
-        {"name": "Circuit Training", "type": "Full Body", "duration": "40 min", "notes": "5 exercises, 4 rounds, 45s each"},
-        {"name": "Dumbbell Full Body", "type": "Full Body", "duration": "45 min", "notes": "Complete workout with dumbbells only"},
-    ]
-    
-    full_body_advanced = [
-        {"name": "Power Full Body", "type": "Full Body", "duration": "55 min", "notes": "Olympic lifts, compound movements, plyometrics"},
-        {"name": "Athlete Training", "type": "Full Body", "duration": "60 min", "notes": "Sport-specific movements, agility, power"},
-        {"name": "CrossFit Style WOD", "type": "Full Body", "duration": "50 min", "notes": "AMRAP: thrusters, pull-ups, box jumps, row"},
-    ]
-    
-    # Cardio Workouts
-    cardio_workouts = [
-        {"name": "Dance Cardio Party", "type": "Cardio", "duration": "30 min", "notes": "Fun dance moves, choreo combos"},
-        {"name": "Walking Workout", "type": "Cardio", "duration": "40 min", "notes": "Power walking with intervals"},
-        {"name": "Stair Master", "type": "Cardio", "duration": "30 min", "notes": "Stair climbing intervals"},
-        {"name": "Jump Rope Session", "type": "Cardio", "duration": "25 min", "notes": "Intervals: singles, high knees, criss-cross"},
-        {"name": "Cycling Sprint", "type": "Cardio", "duration": "35 min", "notes": "Indoor cycling with sprint intervals"},
-        {"name": "Rowing Endurance", "type": "Cardio", "duration": "30 min", "notes": "500m intervals, technique focus"},
-    ]
-    
-    # Yoga & Flexibility
-    yoga_workouts = [
-        {"name": "Morning Sun Salutations", "type": "Yoga", "duration": "20 min", "notes": "5-10 sun salutation flows"},
-        {"name": "Vinyasa Flow", "type": "Yoga", "duration": "45 min", "notes": "Dynamic flow with breath"},
-        {"name": "Power Yoga", "type": "Yoga", "duration": "50 min", "notes": "Strength-building yoga poses"},
-        {"name": "Yin Yoga", "type": "Yoga", "duration": "45 min", "notes": "Deep stretches, 3-5 min holds"},
-        {"name": "Hip Opening Yoga", "type": "Yoga", "duration": "35 min", "notes": "Focus on hip flexibility"},
-        {"name": "Yoga for Athletes", "type": "Yoga", "duration": "40 min", "notes": "Recovery-focused stretches"},
-    ]
-    
-    # Pilates
-    pilates_workouts = [
-        {"name": "Mat Pilates Basics", "type": "Pilates", "duration": "30 min", "notes": "Classic mat exercises"},
-        {"name": "Pilates Abs Focus", "type": "Pilates", "duration": "25 min", "notes": "Core-intensive Pilates"},
-        {"name": "Pilates Sculpt", "type": "Pilates", "duration": "40 min", "notes": "Full body Pilates with weights"},
-        {"name": "Barre Pilates", "type": "Pilates", "duration": "45 min", "notes": "Ballet-inspired movements"},
-    ]
-    
-    # Recovery & Stretching
-    recovery_workouts = [
-        {"name": "Active Recovery", "type": "Stretching", "duration": "20 min", "notes": "Light movement, foam rolling"},
-        {"name": "Deep Stretch", "type": "Stretching", "duration": "30 min", "notes": "Full body stretch sequence"},
-        {"name": "Foam Rolling", "type": "Stretching", "duration": "20 min", "notes": "Self-myofascial release"},
-        {"name": "Mobility Flow", "type": "Stretching", "duration": "25 min", "notes": "Joint mobility exercises"},
-    ]
-    
-    # ===== GENERATE ONE YEAR OF WORKOUTS =====
-    
-    def get_phase(week_num):
-        """Determine training phase based on week number"""
-        if week_num <= 4:
-            return "foundation"  # Weeks 1-4: Build habits
-        elif week_num <= 12:
-            return "beginner"    # Weeks 5-12: Beginner progression
-        elif week_num <= 26:
-            return "intermediate" # Weeks 13-26: Intermediate
-        elif week_num <= 40:
-            return "advanced"    # Weeks 27-40: Advanced
-        else:
-            return "peak"        # Weeks 41-52: Peak performance
-    
-    def get_workout_for_day(day_of_week, week_num, day_count):
-        """Get appropriate workout based on day, week, and training phase"""
-        phase = get_phase(week_num)
-        
-        # Sunday is REST day
-        if day_of_week == 6:
-            return None
-        
-        # Workout split based on day of week
-        # Monday: Lower Body
-        # Tuesday: HIIT/Cardio
-        # Wednesday: Upper Body
-        # Thursday: Yoga/Pilates (Active Recovery)
-        # Friday: Full Body
-        # Saturday: Cardio/Fun workout
-        
-        random.seed(day_count)  # Consistent randomization
-        
-        if day_of_week == 0:  # Monday - Lower Body
-            if phase == "foundation":
-                return random.choice(lower_body_beginner)
-            elif phase == "beginner":
-                return random.choice(lower_body_beginner + lower_body_intermediate[:1])
-            elif phase == "intermediate":
-                return random.choice(lower_body_intermediate)
-            else:
-                return random.choice(lower_body_intermediate + lower_body_advanced)
-        
-        elif day_of_week == 1:  # Tuesday - HIIT
-            if phase == "foundation":
-                return random.choice(hiit_beginner)
-            elif phase == "beginner":
-                return random.choice(hiit_beginner + hiit_intermediate[:1])
-            elif phase == "intermediate":
-                return random.choice(hiit_intermediate)
-            else:
-                return random.choice(hiit_intermediate + hiit_advanced)
-        
-        elif day_of_week == 2:  # Wednesday - Upper Body
-            if phase == "foundation":
-                return random.choice(upper_body_beginner)
-            elif phase == "beginner":
-                return random.choice(upper_body_beginner + upper_body_intermediate[:1])
-            elif phase == "intermediate":
-                return random.choice(upper_body_intermediate)
-            else:
-                return random.choice(upper_body_intermediate + upper_body_advanced)
-        
-        elif day_of_week == 3:  # Thursday - Yoga/Recovery
-            if week_num % 4 == 0:  # Every 4th week: recovery focus
-                return random.choice(recovery_workouts)
-            elif week_num % 2 == 0:
-                return random.choice(yoga_workouts)
-            else:
-                return random.choice(pilates_workouts)
-        
-        elif day_of_week == 4:  # Friday - Full Body
-            if phase == "foundation":
-                return random.choice(full_body_beginner)
-            elif phase == "beginner":
-                return random.choice(full_body_beginner + full_body_intermediate[:1])
-            elif phase == "intermediate":
-                return random.choice(full_body_intermediate)
-            else:
-                return random.choice(full_body_intermediate + full_body_advanced)
-        
-        elif day_of_week == 5:  # Saturday - Cardio/Fun
-            if week_num % 3 == 0:  # Every 3rd week: just stretching/recovery
-                return random.choice(recovery_workouts)
-            else:
-                return random.choice(cardio_workouts)
-        
-        # Add occasional core work as secondary workout (1 in 3 non-rest days)
-        return None
-    
-    # Generate 365 days of workouts
-    start_date = today
-    day_count = 0
-    
-    for i in range(365):
-        workout_date = start_date + timedelta(days=i)
-        date_str = workout_date.strftime("%Y-%m-%d")
-        day_of_week = workout_date.weekday()
-        week_num = i // 7 + 1
-        
-        # Get main workout for the day
-        workout = get_workout_for_day(day_of_week, week_num, day_count)
-        
-        if workout:
-            workout_copy = workout.copy()
-            workout_copy['completed'] = False
-            
-            # Mark past workouts as completed (for demo)
-            if workout_date < today:
-                workout_copy['completed'] = True
-            
-            add_workout_to_calendar(date_str, workout_copy)
-            
-            # Add core workout on Monday/Friday (intermediate+)
-            phase = get_phase(week_num)
-            if phase in ["intermediate", "advanced", "peak"] and day_of_week in [0, 4]:
-                if week_num % 2 == 0:  # Every other week
-                    if phase == "intermediate":
-                        core = random.choice(core_beginner + core_intermediate)
-                    else:
-                        core = random.choice(core_intermediate + core_advanced)
-                    core_copy = core.copy()
-                    core_copy['completed'] = False
-                    if workout_date < today:
-                        core_copy['completed'] = True
-                    add_workout_to_calendar(date_str, core_copy)
-        
-        day_count += 1
-    
+    if _store_plan(today.strftime("%Y-%m-%d"), workout_plan.DEFAULT_PLAN_DAYS, seed):
+        return True
+    plan = workout_plan.generate_plan(today, days=workout_plan.DEFAULT_PLAN_DAYS, seed=seed)
+    add_workouts_to_calendar_bulk(workout_plan.plan_entries(plan, completed_before=today.strftime("%Y-%m-%d")))
     return True
 
+@_reads('calendar')
 def load_calendar():
-    """Load calendar data"""
+    """Load calendar data (cached until the calendar changes; treat as read-only)"""
     if SUPABASE_ENABLED:
         try:
             response = supabase.table(CALENDAR_TABLE).select("*").execute()
-            calendar_data = {}
-            for row in response.data:
-                date_str = row['date']
-                if date_str not in calendar_data:
-                    calendar_data[date_str] = []
-                calendar_data[date_str].append({
-                    'id': row['id'],
-                    'name': row['name'],
-                    'type': row['type'],
-                    'duration': row['duration'],
-                    'notes': row.get('notes', ''),
-                    'completed': row.get('completed', False)
-                })
-            return calendar_data
+            rows = response.data
         except Exception as e:
             print(f"Supabase error: {e}")
             return {}
     else:
-        try:
-            with open(CALENDAR_FILE, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+        rows = _get_db().execute("SELECT * FROM workout_calendar ORDER BY date, id").fetchall()
+    
+    calendar_data = {}
+    for row in rows:
+        calendar_data.setdefault(row['date'], []).append(_row_to_workout(row))
+    return _merge_plan(calendar_data, _load_plan())
 
+@_writes('calendar')
 def save_calendar(calendar_data):
-    """Save calendar data (local only)"""
+    """Replace the whole calendar with calendar_data (local only)"""
     if not SUPABASE_ENABLED:
-        with open(CALENDAR_FILE, 'w') as f:
-            json.dump(calendar_data, f, indent=2)
+        conn = _get_db()
+        with conn:
+            conn.execute("DELETE FROM workout_calendar")
+            conn.execute("DELETE FROM workout_plan_overrides")
+            conn.execute("DELETE FROM workout_plans")
+            conn.executemany(
+                "INSERT INTO workout_calendar (date, name, type, duration, notes, completed) VALUES (?, ?, ?, ?, ?, ?)",
+                [(date_str, w.get('name', ''), w.get('type', ''), w.get('duration', ''),
+                  w.get('notes', ''), bool(w.get('completed', False)))
+                 for date_str in sorted(calendar_data)
+                 for w in calendar_data[date_str]]
+            )
+        _calendar_changed(None)
 
+@_writes('calendar')
 def add_workout_to_calendar(date_str, workout_data):
     """Add a workout to a specific date"""
     if SUPABASE_ENABLED:
@@ -579,193 +1304,452 @@ def add_workout_to_calendar(date_str, workout_data):
                 'completed': workout_data.get('completed', False)
             }
             supabase.table(CALENDAR_TABLE).insert(data).execute()
+            _calendar_changed([date_str])
             return True
         except Exception as e:
             print(f"Supabase error: {e}")
             return False
     else:
-        calendar = load_calendar()
-        if date_str not in calendar:
-            calendar[date_str] = []
-        calendar[date_str].append(workout_data)
-        save_calendar(calendar)
+        conn = _get_db()
+        with conn:
+            conn.execute(
+                "INSERT INTO workout_calendar (date, name, type, duration, notes, completed) VALUES (?, ?, ?, ?, ?, ?)",
+                (date_str, workout_data.get('name', ''), workout_data.get('type', ''),
+                 workout_data.get('duration', ''), workout_data.get('notes', ''),
+                 bool(workout_data.get('completed', False)))
+            )
+        _calendar_changed([date_str])
         return True
 
-def update_workout_in_calendar(date_str, workout_index, workout_data):
-    """Update a specific workout on a date"""
+@_writes('calendar')
+def add_workouts_to_calendar_bulk(entries, skip_existing_dates=False):
+    """Add many (date_str, workout_data) pairs to the calendar at once
+    
+    Locally this is a single SQLite transaction. On Supabase the rows are sent as
+    multi-row inserts of about CALENDAR_BULK_CHUNK rows, never splitting a
+    date across two requests. Returns the number of workouts stored. With
+    skip_existing_dates=True, dates that already have workouts are left
+    alone, so an interrupted run can be resumed by calling it again.
+    """
+    entries = sorted(entries, key=lambda entry: entry[0])
+    if not entries:
+        return 0
+    
     if SUPABASE_ENABLED:
         try:
-            calendar = load_calendar()
-            if date_str in calendar and workout_index < len(calendar[date_str]):
-                workout_id = calendar[date_str][workout_index].get('id')
-                if workout_id:
-                    supabase.table(CALENDAR_TABLE).update(workout_data).eq('id', workout_id).execute()
+            existing_dates = set()
+            if skip_existing_dates:
+                response = supabase.table(CALENDAR_TABLE).select("date") \
+                    .gte('date', entries[0][0]).lte('date', entries[-1][0]).execute()
+                existing_dates = {row['date'] for row in response.data}
+            
+            chunks = []
+            chunk = []
+            for date_str, workout_data in entries:
+                if date_str in existing_dates:
+                    continue
+                if len(chunk) >= CALENDAR_BULK_CHUNK and chunk[-1]['date'] != date_str:
+                    chunks.append(chunk)
+                    chunk = []
+                chunk.append({
+                    'date': date_str,
+                    'name': workout_data.get('name', ''),
+                    'type': workout_data.get('type', ''),
+                    'duration': workout_data.get('duration', ''),
+                    'notes': workout_data.get('notes', ''),
+                    'completed': workout_data.get('completed', False)
+                })
+            if chunk:
+                chunks.append(chunk)
         except Exception as e:
             print(f"Supabase error: {e}")
+            return 0
+        
+        stored = 0
+        for chunk in chunks:
+            try:
+                supabase.table(CALENDAR_TABLE).insert(chunk).execute()
+                stored += len(chunk)
+            except Exception as e:
+                print(f"Supabase error after {stored} workouts: {e}")
+                break
+        _calendar_changed(None)
+        return stored
     else:
-        calendar = load_calendar()
-        if date_str in calendar and workout_index < len(calendar[date_str]):
-            calendar[date_str][workout_index] = workout_data
-            save_calendar(calendar)
+        conn = _get_db()
+        with conn:
+            existing_dates = set()
+            if skip_existing_dates:
+                existing_dates = {row['date'] for row in conn.execute(
+                    "SELECT DISTINCT date FROM workout_calendar WHERE date BETWEEN ? AND ?",
+                    (entries[0][0], entries[-1][0])
+                )}
+            rows = [
+                (date_str, w.get('name', ''), w.get('type', ''), w.get('duration', ''),
+                 w.get('notes', ''), bool(w.get('completed', False)))
+                for date_str, w in entries if date_str not in existing_dates
+            ]
+            conn.executemany(
+                "INSERT INTO workout_calendar (date, name, type, duration, notes, completed) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        _calendar_changed(None)
+        return len(rows)
 
+@_writes('calendar')
+def update_workout_in_calendar(date_str, workout_index, workout_data):
+    """Update a specific workout on a date"""
+    workout_id = _workout_id_at(date_str, workout_index)
+    if workout_id:
+        update_workout_by_id(workout_id, workout_data)
+
+@_writes('calendar')
 def remove_workout_from_calendar(date_str, workout_index):
     """Remove a workout from a specific date"""
+    workout_id = _workout_id_at(date_str, workout_index)
+    if workout_id:
+        remove_workout_by_id(workout_id)
+
+@_reads('calendar', span=lambda date_str: (date_str, date_str))
+def get_workouts_for_date(date_str):
+    """Get all workouts for a specific date"""
     if SUPABASE_ENABLED:
         try:
-            calendar = load_calendar()
-            if date_str in calendar and workout_index < len(calendar[date_str]):
-                workout_id = calendar[date_str][workout_index].get('id')
-                if workout_id:
-                    supabase.table(CALENDAR_TABLE).delete().eq('id', workout_id).execute()
+            response = supabase.table(CALENDAR_TABLE).select("*").eq('date', date_str).execute()
+            rows = response.data
         except Exception as e:
             print(f"Supabase error: {e}")
+            return []
     else:
-        calendar = load_calendar()
-        if date_str in calendar and workout_index < len(calendar[date_str]):
-            calendar[date_str].pop(workout_index)
-            if not calendar[date_str]:
-                del calendar[date_str]
-            save_calendar(calendar)
+        rows = _get_db().execute(
+            "SELECT * FROM workout_calendar WHERE date = ? ORDER BY id", (date_str,)
+        ).fetchall()
+    plan = _load_plan()
+    planned = _plan_workouts(plan, date_str) if plan is not None else []
+    return planned + [_row_to_workout(row) for row in rows]
 
-def get_workouts_for_date(date_str):
-    """Get all workouts for a specific date"""
+def get_workouts_for_range(start, end):
+    """Get workouts between two dates (inclusive), keyed by date string
+    
+    start and end may be date/datetime objects or "YYYY-MM-DD" strings.
+    """
+    return _fetch_workouts_for_range(_to_date_str(start), _to_date_str(end))
+
+@_reads('calendar', span=lambda start_str, end_str: (start_str, end_str))
+def _fetch_workouts_for_range(start_str, end_str):
+    """Query the backend for the workouts between two date strings"""
     if SUPABASE_ENABLED:
         try:
-            response = supabase.table(CALENDAR_TABLE).select("*").eq('date', date_str).execute()
-            return [{
-                'id': row['id'],
-                'name': row['name'],
-                'type': row['type'],
-                'duration': row['duration'],
-                'notes': row.get('notes', ''),
-                'completed': row.get('completed', False)
-            } for row in response.data]
+            response = supabase.table(CALENDAR_TABLE).select("*") \
+                .gte('date', start_str).lte('date', end_str).order('date').execute()
+            rows = response.data
         except Exception as e:
             print(f"Supabase error: {e}")
-            return []
+            return {}
     else:
-        calendar = load_calendar()
-        return calendar.get(date_str, [])
+        rows = _get_db().execute(
+            "SELECT * FROM workout_calendar WHERE date BETWEEN ? AND ? ORDER BY date, id",
+            (start_str, end_str)
+        ).fetchall()
+    
+    calendar_data = {}
+    for row in rows:
+        calendar_data.setdefault(row['date'], []).append(_row_to_workout(row))
+    return _merge_plan(calendar_data, _load_plan(), start_str, end_str)
 
+def _to_date_str(value):
+    """Normalise a date, datetime or date string to YYYY-MM-DD"""
+    if isinstance(value, str):
+        return value[:10]
+    return value.strftime("%Y-%m-%d")
+
+@_writes('calendar')
 def mark_workout_complete(date_str, workout_index, completed=True):
     """Mark a workout as complete/incomplete"""
+    workout_id = _workout_id_at(date_str, workout_index)
+    if workout_id:
+        mark_workout_complete_by_id(workout_id, completed)
+
+def _workout_id_at(date_str, workout_index):
+    """Resolve a positional workout index on a date to its id"""
+    workouts = get_workouts_for_date(date_str)
+    if 0 <= workout_index < len(workouts):
+        return workouts[workout_index].get('id')
+    return None
+
+# ============================================
+# ID-ADDRESSED CALENDAR MUTATIONS
+# ============================================
+# Workouts returned by load_calendar() and get_workouts_for_date() carry a
+# stable 'id'. These functions change a single workout by that id with one
+# UPDATE/DELETE ... WHERE id= on Supabase or SQLite; planned workouts get an
+# override row instead.
+
+@_writes('calendar')
+def mark_workout_complete_by_id(workout_id, completed=True):
+    """Mark a workout as complete/incomplete by its id"""
+    if _is_planned(workout_id):
+        return _override_planned_workouts([workout_id], {'completed': bool(completed)})
     if SUPABASE_ENABLED:
         try:
-            calendar = load_calendar()
-            if date_str in calendar and workout_index < len(calendar[date_str]):
-                workout_id = calendar[date_str][workout_index].get('id')
-                if workout_id:
-                    supabase.table(CALENDAR_TABLE).update({'completed': completed}).eq('id', workout_id).execute()
+            response = supabase.table(CALENDAR_TABLE).update({'completed': completed}).eq('id', workout_id).execute()
+            _calendar_changed(row['date'] for row in response.data)
+            return True
         except Exception as e:
             print(f"Supabase error: {e}")
+            return False
     else:
-        calendar = load_calendar()
-        if date_str in calendar and workout_index < len(calendar[date_str]):
-            calendar[date_str][workout_index]['completed'] = completed
-            save_calendar(calendar)
+        conn = _get_db()
+        with conn:
+            rows = conn.execute(
+                "UPDATE workout_calendar SET completed = ? WHERE id = ? RETURNING date",
+                (bool(completed), workout_id)
+            ).fetchall()
+        _calendar_changed(row['date'] for row in rows)
+        return True
+
+@_writes('calendar')
+def update_workout_by_id(workout_id, workout_data):
+    """Update a workout by its id"""
+    fields = {column: workout_data[column] for column in CALENDAR_COLUMNS if column in workout_data}
+    if not fields:
+        return False
+    if _is_planned(workout_id):
+        return _override_planned_workouts([workout_id], fields)
+    
+    if SUPABASE_ENABLED:
+        try:
+            response = supabase.table(CALENDAR_TABLE).update(fields).eq('id', workout_id).execute()
+            _calendar_changed(row['date'] for row in response.data)
+            return True
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        conn = _get_db()
+        with conn:
+            rows = conn.execute(
+                f"UPDATE workout_calendar SET {assignments} WHERE id = ? RETURNING date",
+                (*fields.values(), workout_id)
+            ).fetchall()
+        _calendar_changed(row['date'] for row in rows)
+        return True
+
+@_writes('calendar')
+def remove_workout_by_id(workout_id):
+    """Remove a workout by its id"""
+    if _is_planned(workout_id):
+        return _override_planned_workouts([workout_id], {'removed': True})
+    if SUPABASE_ENABLED:
+        try:
+            response = supabase.table(CALENDAR_TABLE).delete().eq('id', workout_id).execute()
+            _calendar_changed(row['date'] for row in response.data)
+            return True
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        conn = _get_db()
+        with conn:
+            rows = conn.execute("DELETE FROM workout_calendar WHERE id = ? RETURNING date", (workout_id,)).fetchall()
+        _calendar_changed(row['date'] for row in rows)
+        return True
 
 # ============================================
 # STREAK SYSTEM
 # ============================================
+# Streaks are read from per-day (total, completed) counts rather than by
+# walking the calendar. Locally those counts are persisted in calendar_days,
+# which SQLite triggers keep in step with workout_calendar, and a generated
+# plan's counts are added when the index is built. _StreakIndex keeps
+# them in memory as sorted day lists, so each streak figure is a few bisects.
+# Calendar mutations in this process patch only the days they touched; a
+# change from another process rebuilds the index from the per-day counts on
+# the next read. On Supabase the database aggregates instead (see
+# get_progress_stats); the index is only the fallback when the SQL function
+# from supabase_setup.sql is missing.
 
-def calculate_streak():
-    """Calculate current workout streak based on consecutive completed days"""
-    from datetime import datetime, timedelta
-    
-    calendar = load_calendar()
-    if not calendar:
-        return 0
+class _StreakIndex:
+    """Per-day completion counts and the sorted views streak figures are read from"""
     
-    today = datetime.now().date()
-    streak = 0
-    check_date = today
+    _END = '~'  # sorts after every YYYY-MM-DD string
     
-    # Check today first
-    today_str = today.strftime("%Y-%m-%d")
-    today_workouts = calendar.get(today_str, [])
-    today_completed = any(w.get('completed', False) for w in today_workouts) if today_workouts else False
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.rebuild({}, None)
     
-    # If today not completed, start checking from yesterday
-    if not today_completed:
-        check_date = today - timedelta(days=1)
+    def rebuild(self, day_counts, version):
+        """Replace the index with {date_str: (total, completed)}"""
+        self.days = {d: counts for d, counts in day_counts.items() if counts[0] > 0}
+        # A day is complete when all its workouts are done, pending otherwise
+        self.complete_days = sorted(d for d, (total, done) in self.days.items() if done >= total)
+        self.pending_days = sorted(d for d, (total, done) in self.days.items() if done < total)
+        self.active_days = sorted(d for d, (total, done) in self.days.items() if done > 0)
+        self.total_completed = sum(done for total, done in self.days.values())
+        # Lengths of the runs of complete days between consecutive pending days
+        bounds = zip([''] + self.pending_days, self.pending_days + [self._END])
+        self.run_lengths = collections.Counter(self._run_length(lo, hi) for lo, hi in bounds)
+        self.version = version
     
-    # Count consecutive completed days
-    while True:
-        date_str = check_date.strftime("%Y-%m-%d")
-        workouts = calendar.get(date_str, [])
+    def set_day(self, date_str, total, done):
+        """Apply new counts for one day, re-measuring only the runs around it"""
+        old_total, old_done = self.days.get(date_str, (0, 0))
+        if (old_total, old_done) == (total, done):
+            return
         
-        if not workouts:
-            break
-            
-        # Check if all workouts for this day are completed
-        all_completed = all(w.get('completed', False) for w in workouts)
-        if all_completed and workouts:
-            streak += 1
-            check_date -= timedelta(days=1)
+        was_pending = old_done < old_total
+        i = bisect.bisect_left(self.pending_days, date_str)
+        lo = self.pending_days[i - 1] if i else ''
+        j = i + 1 if was_pending else i
+        hi = self.pending_days[j] if j < len(self.pending_days) else self._END
+        
+        for bounds in ([(lo, date_str), (date_str, hi)] if was_pending else [(lo, hi)]):
+            length = self._run_length(*bounds)
+            self.run_lengths[length] -= 1
+            if not self.run_lengths[length]:
+                del self.run_lengths[length]
+        
+        self._place(self.complete_days, date_str, 0 < total <= done)
+        self._place(self.pending_days, date_str, done < total)
+        self._place(self.active_days, date_str, done > 0)
+        self.total_completed += done - old_done
+        if total > 0:
+            self.days[date_str] = (total, done)
         else:
-            break
+            self.days.pop(date_str, None)
+        
+        for bounds in ([(lo, date_str), (date_str, hi)] if done < total else [(lo, hi)]):
+            self.run_lengths[self._run_length(*bounds)] += 1
     
-    return streak
-
-def get_streak_data():
-    """Get comprehensive streak information"""
-    from datetime import datetime, timedelta
+    def current_streak(self, today):
+        """Consecutive complete days ending today (or yesterday if today has nothing done)"""
+        if self.days.get(today.strftime("%Y-%m-%d"), (0, 0))[1] > 0:
+            anchor = today
+        else:
+            anchor = today - timedelta(days=1)
+        
+        days = self.complete_days
+        i = bisect.bisect_left(days, anchor.strftime("%Y-%m-%d"))
+        if i == len(days) or days[i] != anchor.strftime("%Y-%m-%d"):
+            return 0
+        # The list is strictly increasing, so days[i - k] == anchor - k days holds
+        # for every k inside the streak and for none past it: binary search it
+        lo, hi = 0, i
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if days[i - mid] == (anchor - timedelta(days=mid)).strftime("%Y-%m-%d"):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo + 1
     
-    calendar = load_calendar()
-    current_streak = calculate_streak()
-    
-    # Calculate best streak
-    if not calendar:
-        return {
-            'current_streak': 0,
-            'best_streak': 0,
-            'total_completed': 0,
-            'last_completed': None,
-            'streak_status': 'none'
-        }
+    def summary(self, today):
+        """The get_streak_data() dict"""
+        today_total, today_done = self.days.get(today.strftime("%Y-%m-%d"), (0, 0))
+        return _streak_data(
+            self.current_streak(today), max(self.run_lengths), self.total_completed,
+            self.active_days[-1] if self.active_days else None, today_total, today_done
+        )
     
-    # Get all dates and sort them
-    all_dates = sorted(calendar.keys())
-    
-    # Count total completed workouts
-    total_completed = sum(
-        1 for date_str in calendar 
-        for w in calendar[date_str] 
-        if w.get('completed', False)
-    )
-    
-    # Find last completed date
-    last_completed = None
-    for date_str in reversed(all_dates):
-        if any(w.get('completed', False) for w in calendar[date_str]):
-            last_completed = date_str
-            break
-    
-    # Calculate best streak
-    best_streak = 0
-    temp_streak = 0
-    
-    for i, date_str in enumerate(all_dates):
-        workouts = calendar[date_str]
-        all_completed = all(w.get('completed', False) for w in workouts) if workouts else False
-        
-        if all_completed and workouts:
-            temp_streak += 1
-            best_streak = max(best_streak, temp_streak)
-        else:
-            temp_streak = 0
+    def _run_length(self, lo, hi):
+        """Number of complete days strictly between two date strings"""
+        return bisect.bisect_left(self.complete_days, hi) - bisect.bisect_right(self.complete_days, lo)
     
-    # Determine streak status
-    today = datetime.now().date()
-    today_str = today.strftime("%Y-%m-%d")
-    yesterday_str = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+    @staticmethod
+    def _place(days, date_str, present):
+        """Insert or remove date_str in a sorted list"""
+        i = bisect.bisect_left(days, date_str)
+        found = i < len(days) and days[i] == date_str
+        if present and not found:
+            days.insert(i, date_str)
+        elif not present and found:
+            del days[i]
+
+_streak_index = _StreakIndex()
+
+def _streak_version():
+    """Data version the streak index is stamped with
     
-    today_workouts = calendar.get(today_str, [])
-    today_completed = any(w.get('completed', False) for w in today_workouts) if today_workouts else False
+    Writes in this process keep the stamp current: calendar writes patch the
+    index, other writes only re-stamp it (see _invalidate_changes).
+    """
+    return _data_version()
+
+def _load_day_counts():
+    """Per-day (total, completed) counts for the whole calendar"""
+    if SUPABASE_ENABLED:
+        # Only the fallback for a database without get_progress_stats()
+        counts = {}
+        try:
+            response = supabase.table(CALENDAR_TABLE).select("date, completed").execute()
+        except Exception as e:
+            print(f"Supabase error: {e}")
+        else:
+            for row in response.data:
+                total, done = counts.get(row['date'], (0, 0))
+                counts[row['date']] = (total + 1, done + bool(row['completed']))
+    else:
+        rows = _get_db().execute("SELECT date, total, completed FROM calendar_days").fetchall()
+        counts = {row['date']: (row['total'], row['completed']) for row in rows}
+    plan = _load_plan()
+    return _add_day_counts(counts, _plan_day_counts(plan)) if plan is not None else counts
+
+def _fetch_day_counts(date_strs):
+    """Per-day (total, completed) counts for a few dates
     
-    if today_completed:
+    Runs inside calendar writes, so the plan is fetched rather than read from
+    the cache.
+    """
+    date_strs = list(date_strs)
+    if SUPABASE_ENABLED:
+        response = supabase.table(CALENDAR_TABLE).select("date, completed").in_('date', date_strs).execute()
+        counts = {}
+        for row in response.data:
+            total, done = counts.get(row['date'], (0, 0))
+            counts[row['date']] = (total + 1, done + bool(row['completed']))
+    else:
+        placeholders = ", ".join("?" for _ in date_strs)
+        rows = _get_db().execute(
+            f"SELECT date, total, completed FROM calendar_days WHERE date IN ({placeholders})", date_strs
+        ).fetchall()
+        counts = {row['date']: (row['total'], row['completed']) for row in rows}
+    plan = _fetch_plan(date_strs)
+    return _add_day_counts(counts, _plan_day_counts(plan, date_strs)) if plan is not None else counts
+
+def _sync_streak_days(date_strs):
+    """Patch the streak index after this process changed the given dates"""
+    date_strs = set(date_strs)
+    with _streak_index.lock:
+        if _streak_index.version is None:
+            return  # not built yet, or already due for a rebuild
+        try:
+            counts = _fetch_day_counts(date_strs) if date_strs else {}
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            _streak_index.version = None
+            return
+        for date_str in date_strs:
+            _streak_index.set_day(date_str, *counts.get(date_str, (0, 0)))
+        _streak_index.version = _streak_version()
+
+def _reset_streak_index():
+    """Rebuild the streak index on its next read (after bulk calendar changes)"""
+    with _streak_index.lock:
+        _streak_index.version = None
+
+def _read_streak_index():
+    """The streak index, rebuilt first if the calendar changed elsewhere"""
+    version = _streak_version()
+    if _streak_index.version != version:
+        _streak_index.rebuild(_load_day_counts(), version)
+    return _streak_index
+
+def _streak_data(current_streak, best_streak, total_completed, last_completed, today_total, today_done):
+    """Build the get_streak_data() dict"""
+    if today_done:
         streak_status = 'completed_today'
-    elif today_workouts:
+    elif today_total:
         streak_status = 'pending_today'
     elif current_streak > 0:
         streak_status = 'at_risk'
@@ -780,24 +1764,184 @@ def get_streak_data():
         'streak_status': streak_status
     }
 
+def calculate_streak():
+    """Calculate current workout streak based on consecutive completed days"""
+    return get_streak_data()['current_streak']
+
+def get_streak_data():
+    """Get comprehensive streak information"""
+    if SUPABASE_ENABLED:
+        stats = get_progress_stats()
+        if stats is not None:
+            return _streak_data(
+                stats['current_streak'], stats['best_streak'], stats['total_completed'],
+                stats['last_completed'], stats['today_total'], stats['today_completed']
+            )
+    with _streak_index.lock:
+        return _read_streak_index().summary(datetime.now().date())
+
+# Local counterpart of get_progress_stats() in supabase_setup.sql, run on the
+# per-day counts in calendar_days plus those of a generated plan (plan_days)
+CALENDAR_DAYS_SQL = """
+days AS (
+    SELECT date, SUM(total) AS total, SUM(completed) AS completed
+    FROM (SELECT date, total, completed FROM calendar_days
+          UNION ALL
+          SELECT date, total, completed FROM temp.plan_days)
+    GROUP BY date
+)"""
+
+PROGRESS_STATS_SQL = f"""
+WITH {CALENDAR_DAYS_SQL},
+flagged AS (
+    SELECT date, total, completed, completed >= total AS complete,
+           -- complete days between two pending days share a run_id
+           SUM(completed < total) OVER (ORDER BY date) AS run_id,
+           -- calendar-consecutive complete days share an island
+           julianday(date) - ROW_NUMBER() OVER (PARTITION BY completed >= total ORDER BY date) AS island
+    FROM days
+),
+anchor AS (
+    SELECT CASE WHEN EXISTS (SELECT 1 FROM days WHERE date = :today AND completed > 0)
+                THEN :today ELSE date(:today, '-1 day') END AS day
+),
+runs AS (
+    SELECT run_id, SUM(complete) AS length
+    FROM flagged
+    GROUP BY run_id
+)
+SELECT
+    (SELECT COUNT(*) FROM flagged f, anchor a
+     WHERE f.complete AND f.date <= a.day
+       AND f.island = (SELECT island FROM flagged WHERE complete AND date = a.day)) AS current_streak,
+    (SELECT IFNULL(MAX(length), 0) FROM runs) AS best_streak,
+    (SELECT IFNULL(SUM(completed), 0) FROM days) AS total_completed,
+    (SELECT MAX(date) FROM days WHERE completed > 0) AS last_completed,
+    (SELECT IFNULL(SUM(total), 0) FROM days WHERE date = :today) AS today_total,
+    (SELECT IFNULL(SUM(completed), 0) FROM days WHERE date = :today) AS today_completed,
+    (SELECT COUNT(*) FROM days) AS scheduled_days
+"""
+
+WEEKLY_COMPLETION_SQL = f"""
+WITH {CALENDAR_DAYS_SQL}
+SELECT date(date, 'weekday 0', '-6 days') AS week_start, SUM(completed) AS completed, SUM(total) AS total
+FROM days
+WHERE date >= :first_week
+GROUP BY week_start
+"""
+
+def get_progress_stats(weeks=PROGRESS_WEEKS):
+    """Streak figures and weekly completion counts, aggregated by the database
+    
+    Returns current_streak, best_streak, total_completed, last_completed,
+    today_total, today_completed, scheduled_days and 'weekly': a list of
+    {'week_start', 'completed', 'total'} for the last `weeks` weeks (Monday
+    starts, oldest first). Returns None if the Supabase function is missing.
+    """
+    return _query_progress_stats(datetime.now().date(), weeks)
+
+@_reads('calendar')
+def _query_progress_stats(today, weeks):
+    """Run the progress aggregation on the backend"""
+    week_starts = [
+        (today - timedelta(days=today.weekday(), weeks=w)).strftime("%Y-%m-%d")
+        for w in reversed(range(weeks))
+    ]
+    # Planned workouts are not stored as rows: their per-day counts (from the
+    # spec and its overrides) are passed in alongside the stored ones
+    plan = _load_plan()
+    plan_days = _plan_day_counts(plan) if plan is not None else {}
+    
+    if SUPABASE_ENABLED:
+        params = {'p_today': today.strftime("%Y-%m-%d"), 'p_weeks': weeks}
+        if plan_days:
+            params['p_plan_days'] = [
+                {'date': date_str, 'total': total, 'completed': done}
+                for date_str, (total, done) in plan_days.items()
+            ]
+        try:
+            response = supabase.rpc('get_progress_stats', params).execute()
+            stats = dict(response.data[0])
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return None
+        weekly_rows = stats.pop('weekly') or []
+    else:
+        conn = _get_db()
+        with conn:
+            conn.execute("DELETE FROM temp.plan_days")
+            if plan_days:
+                # One statement for the whole plan rather than one per day
+                conn.execute(
+                    "INSERT INTO temp.plan_days (date, total, completed) "
+                    "SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]') FROM json_each(?)",
+                    (json.dumps([[date_str, total, done] for date_str, (total, done) in plan_days.items()]),)
+                )
+        params = {'today': today.strftime("%Y-%m-%d"), 'first_week': week_starts[0] if week_starts else '~'}
+        stats = conn.execute(PROGRESS_STATS_SQL, params).fetchone()
+        weekly_rows = conn.execute(WEEKLY_COMPLETION_SQL, params).fetchall()
+    
+    weekly = {str(row['week_start'])[:10]: row for row in weekly_rows}
+    stats['weekly'] = [
+        {
+            'week_start': week_start,
+            'completed': int(weekly.get(week_start, {}).get('completed', 0)),
+            'total': int(weekly.get(week_start, {}).get('total', 0))
+        }
+        for week_start in week_starts
+    ]
+    if stats['last_completed'] is not None:
+        stats['last_completed'] = str(stats['last_completed'])[:10]
+    stats['best_streak'] = max(stats['best_streak'], stats['current_streak'])
+    return stats
+
+@_writes('calendar')
 def confirm_workout_completed(date_str):
     """Mark all workouts for a date as completed"""
-    calendar = load_calendar()
+    workouts = get_workouts_for_date(date_str)
     
-    if date_str not in calendar:
+    if not workouts:
         return False
     
-    workouts = calendar[date_str]
-    for i, workout in enumerate(workouts):
-        mark_workout_complete(date_str, i, completed=True)
+    planned = [w['id'] for w in workouts if _is_planned(w['id'])]
+    if planned and not _override_planned_workouts(planned, {'completed': True}):
+        return False
+    if len(planned) == len(workouts):
+        return True
+    
+    if SUPABASE_ENABLED:
+        try:
+            supabase.table(CALENDAR_TABLE).update({'completed': True}).eq('date', date_str).execute()
+        except Exception as e:
+            print(f"Supabase error: {e}")
+            return False
+    else:
+        conn = _get_db()
+        with conn:
+            conn.execute("UPDATE workout_calendar SET completed = 1 WHERE date = ?", (date_str,))
     
+    _calendar_changed([date_str])
     return True
 
+def count_scheduled_days():
+    """Number of dates with at least one workout scheduled"""
+    if SUPABASE_ENABLED or _load_plan() is not None:
+        stats = get_progress_stats()
+        if stats is not None and 'scheduled_days' in stats:
+            return stats['scheduled_days']
+        with _streak_index.lock:
+            return len(_read_streak_index().days)
+    return _count_calendar_days()
+
+@_reads('calendar')
+def _count_calendar_days():
+    """Number of rows in the local calendar_days table"""
+    return _get_db().execute("SELECT COUNT(*) AS days FROM calendar_days").fetchone()['days']
+
 def get_completion_calendar():
     """Get calendar data formatted for streak visualization"""
     from datetime import datetime, timedelta
     
-    calendar = load_calendar()
     today = datetime.now().date()
     
     # Get dates for the current month
@@ -809,6 +1953,8 @@ def get_completion_calendar():
     else:
         last_day = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
     
+    calendar = get_workouts_for_range(first_day, last_day)
+    
     completion_data = {}
     current_date = first_day
     
@@ -835,6 +1981,170 @@ def get_completion_calendar():
     
     return completion_data
 
+# ============================================
+# REQUEST SNAPSHOT
+# ============================================
+# The app creates one DataSnapshot per rerun and every section (sidebar and
+# pages) reads from it, so each piece of data is fetched at most once per
+# rerun and derived views are only computed by the sections that use them.
+
+# Calendar event colours by workout type
+WORKOUT_TYPE_COLORS = {
+    "Lower Body": "#ff6b6b",
+    "Upper Body": "#4ecdc4",
+    "HIIT": "#ff9f43",
+    "Cardio": "#ee5a24",
+    "Full Body": "#00d4ff",
+    "Yoga": "#a29bfe",
+    "Pilates": "#fd79a8",
+    "Stretching": "#55efc4",
+    "Core": "#ffeaa7",
+    "Strength": "#74b9ff",
+    "Dance": "#e056fd",
+}
+
+def build_calendar_events(calendar_data):
+    """Convert {date: [workouts]} to streamlit-calendar (FullCalendar) events"""
+    events = []
+    for date_str, workouts in calendar_data.items():
+        for idx, workout in enumerate(workouts):
+            workout_type = workout.get('type', 'Workout')
+            is_completed = workout.get('completed', False)
+            
+            # Green for completed, otherwise the workout type's colour
+            color = "#00ff88" if is_completed else WORKOUT_TYPE_COLORS.get(workout_type, "#00d4ff")
+            
+            events.append({
+                "title": f"{'✅' if is_completed else '💪'} {workout.get('name', 'Workout')}",
+                "start": date_str,
+                "end": date_str,
+                "backgroundColor": color,
+                "borderColor": color,
+                "textColor": "#ffffff" if not is_completed else "#000000",
+                "extendedProps": {
+                    "type": workout_type,
+                    "duration": workout.get('duration', ''),
+                    "notes": workout.get('notes', ''),
+                    "completed": is_completed,
+                    "index": idx,
+                    "id": workout.get('id')
+                }
+            })
+    return events
+
+@_reads('calendar', span=lambda start_str, end_str: (start_str, end_str))
+def get_calendar_events(start_str, end_str):
+    """Calendar events between two date strings, memoised until a date in the range changes"""
+    return build_calendar_events(get_workouts_for_range(start_str, end_str))
+
+def shift_month(day, months):
+    """First day of the month `months` away from day's month"""
+    index = day.year * 12 + day.month - 1 + months
+    return day.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+def month_window(month, buffer=CALENDAR_EVENT_BUFFER_MONTHS):
+    """First and last date of `month` widened by `buffer` months on each side"""
+    return shift_month(month, -buffer), shift_month(month, buffer + 1) - timedelta(days=1)
+
+class DataSnapshot:
+    """The data one app rerun reads, fetched once and derived on first use
+    
+    Views are kept for the rest of the rerun; call forget() after a write
+    whose result should show up later in the same rerun.
+    """
+    
+    def __init__(self, today=None):
+        self.today = today or datetime.now().date()
+        self.start_of_week = self.today - timedelta(days=self.today.weekday())
+        self._views = {}
+        self._calls_at_start = get_backend_call_count()
+    
+    def _view(self, name, loader):
+        if name not in self._views:
+            self._views[name] = loader()
+        return self._views[name]
+    
+    def forget(self, *names):
+        """Drop the named views ('workouts', 'streak', 'range', ...), or all of them"""
+        for key in list(self._views):
+            if not names or key in names or (isinstance(key, tuple) and key[0] in names):
+                del self._views[key]
+    
+    @property
+    def backend_calls(self):
+        """Backend calls made by this rerun so far"""
+        return get_backend_call_count() - self._calls_at_start
+    
+    @property
+    def workouts(self):
+        """The saved video collection (DataFrame)"""
+        return self._view('workouts', get_workouts)
+    
+    @property
+    def video_counts(self):
+        """Saved videos per category"""
+        return self._view(('workouts', 'counts'), get_category_counts)
+    
+    def workouts_page(self, page, page_size, category=None):
+        """One page of the collection, newest first"""
+        return self._view(('workouts', page, page_size, category),
+                          lambda: get_workouts_page(page, page_size, category))
+    
+    @property
+    def streak(self):
+        """get_streak_data()"""
+        return self._view('streak', get_streak_data)
+    
+    @property
+    def scheduled_days(self):
+        """Number of dates with workouts scheduled"""
+        return self._view('scheduled_days', count_scheduled_days)
+    
+    @property
+    def week(self):
+        """This week's (Monday to Sunday) workouts keyed by date"""
+        return self.calendar_range(self.start_of_week, self.start_of_week + timedelta(days=6))
+    
+    @property
+    def today_workouts(self):
+        """Today's workouts"""
+        return self.week.get(self.today.strftime("%Y-%m-%d"), [])
+    
+    @property
+    def weekly_summary(self):
+        """Per-day {'date', 'completed', 'total'} for this week, Monday first"""
+        def summarise():
+            days = [self.start_of_week + timedelta(days=i) for i in range(7)]
+            return [
+                {
+                    'date': day,
+                    'completed': sum(1 for w in self.week.get(day.strftime("%Y-%m-%d"), []) if w.get('completed', False)),
+                    'total': len(self.week.get(day.strftime("%Y-%m-%d"), []))
+                }
+                for day in days
+            ]
+        return self._view('weekly_summary', summarise)
+    
+    def calendar_range(self, start, end):
+        """Workouts between two dates (inclusive) keyed by date"""
+        start_str, end_str = _to_date_str(start), _to_date_str(end)
+        return self._view(('range', start_str, end_str), lambda: get_workouts_for_range(start_str, end_str))
+    
+    def events(self, start, end):
+        """Calendar events for the workouts between two dates"""
+        start_str, end_str = _to_date_str(start), _to_date_str(end)
+        # Load the range too so workouts_on() can answer from it
+        self.calendar_range(start_str, end_str)
+        return self._view(('events', start_str, end_str), lambda: get_calendar_events(start_str, end_str))
+    
+    def workouts_on(self, date_str):
+        """Workouts on one date, reusing any range this rerun already loaded"""
+        date_str = _to_date_str(date_str)
+        for key, value in self._views.items():
+            if isinstance(key, tuple) and key[0] == 'range' and key[1] <= date_str <= key[2]:
+                return value.get(date_str, [])
+        return self._view(('date', date_str), lambda: get_workouts_for_date(date_str))
+
 # ============================================
 # WORKOUT PROGRAMS FOR WOMEN
 # ============================================
@@ -847,6 +2157,10 @@ GIRLS_WORKOUT_PROGRAMS = {
         "level": "Beginner",
         "goal": "Tone & Build Foundation",
         "days_per_week": 3,
+        "videos": [
+            ("Full Body Beginner Workout", "https://www.youtube.com/watch?v=UItWltVZZmE"),
+            ("20 Min Full Body Stretch", "https://www.youtube.com/watch?v=g_tea8ZNk5A"),
+        ],
         "schedule": {
             "Week 1-2": {
                 "Day 1": {
@@ -921,6 +2235,10 @@ GIRLS_WORKOUT_PROGRAMS = {
         "level": "Intermediate",
         "goal": "Build Glutes & Slim Waist",
         "days_per_week": 4,
+        "videos": [
+            ("Booty Workout - Grow Glutes", "https://www.youtube.com/watch?v=ZYxAHoOweGk"),
+            ("15 Min Leg Workout", "https://www.youtube.com/watch?v=XF5clnw4QOM"),
+        ],
         "schedule": {
             "Week 1-3": {
                 "Day 1": {
@@ -1016,6 +2334,10 @@ GIRLS_WORKOUT_PROGRAMS = {
         "level": "All Levels",
         "goal": "Flexibility & Mindfulness",
         "days_per_week": 5,
+        "videos": [
+            ("30 Min Yoga Flow", "https://www.youtube.com/watch?v=oBu-pQG6sTY"),
+            ("Morning Yoga Stretch", "https://www.youtube.com/watch?v=4pKly2JojMw"),
+        ],
         "schedule": {
             "Week 1-4": {
                 "Day 1": {
@@ -1081,6 +2403,10 @@ GIRLS_WORKOUT_PROGRAMS = {
         "level": "Intermediate-Advanced",
         "goal": "Fat Loss & Endurance",
         "days_per_week": 4,
+        "videos": [
+            ("15 Min Fat Burning HIIT", "https://www.youtube.com/watch?v=ml6cT4AZdqI"),
+            ("Dance Party Workout", "https://www.youtube.com/watch?v=YO0E9J-LlEE"),
+        ],
         "schedule": {
             "Week 1-2": {
                 "Day 1": {
@@ -1171,6 +2497,10 @@ GIRLS_WORKOUT_PROGRAMS = {
         "level": "All Levels",
         "goal": "Glute Growth & Shape",
         "days_per_week": 6,
+        "videos": [
+            ("25 Min Booty Workout", "https://www.youtube.com/watch?v=ZYxAHoOweGk"),
+            ("30 Min Walking Workout", "https://www.youtube.com/watch?v=5WzKKrFwUGQ"),
+        ],
         "schedule": {
             "Week 1": {
                 "Day 1": {
@@ -1619,4 +2949,270 @@ def get_workout_programs():
 
 def get_program_by_id(program_id):
     """Get a specific program by its ID"""
-    return GIRLS_WORKOUT_PROGRAMS.get(program_id)
\ No newline at end of file
+    return GIRLS_WORKOUT_PROGRAMS.get(program_id)
+
+# ============================================
+# EXERCISE MEDIA INDEX
+# ============================================
+# Built once at import: every exercise name used by the library, the extra
+# demo GIFs and the programs is normalised and mapped to one canonical
+# exercise id, so demo cards, programs and the library resolve names the
+# same way with a dict lookup.
+
+def _normalize_exercise_name(name):
+    """Lowercase words without notes in brackets or plural 's' ("Lunges (each leg)" -> "lunge")"""
+    name = re.sub(r"\([^)]*\)", " ", str(name or "").lower().replace("_", " "))
+    words = []
+    for word in re.findall(r"[a-z0-9]+", name):
+        if len(word) > 2 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return " ".join(words)
+
+def _program_exercise_names():
+    """Every exercise name written in GIRLS_WORKOUT_PROGRAMS"""
+    names = set()
+    for program in GIRLS_WORKOUT_PROGRAMS.values():
+        for week in program.get('schedule', {}).values():
+            for day in week.values():
+                names.update(exercise['name'] for exercise in day['exercises'])
+        for phase in program.get('phases', {}).values():
+            for week in phase['weeks'].values():
+                for exercises in week.values():
+                    names.update(exercise['name'] for exercise in exercises)
+    return names
+
+def _build_exercise_media_index():
+    """(alias -> exercise id, exercise id -> media entry, workout type -> GIF)"""
+    media, aliases = {}, {}
+    for key, exercise in EXERCISE_LIBRARY.items():
+        media[key] = {'id': key, 'name': exercise['name'], 'gif_url': exercise['gif_url'], 'in_library': True}
+        aliases[_normalize_exercise_name(key)] = key
+        aliases[_normalize_exercise_name(exercise['name'])] = key
+    for key, gif_url in EXERCISE_DEMO_GIFS.items():
+        alias = _normalize_exercise_name(key)
+        if alias not in aliases:
+            media[key] = {'id': key, 'name': key.replace('_', ' ').title(), 'gif_url': gif_url, 'in_library': False}
+            aliases[alias] = key
+    types = {_normalize_exercise_name(key): gif_url for key, gif_url in WORKOUT_TYPE_GIFS.items()}
+    return aliases, media, types
+
+def _find_phrase(words, table):
+    """Value for the longest run of words found in table (leftmost first), or None"""
+    for length in range(len(words), 0, -1):
+        for start in range(len(words) - length + 1):
+            value = table.get(" ".join(words[start:start + length]))
+            if value is not None:
+                return value
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_alias(alias):
+    """Fallback for names not in the index: the longest known exercise inside it"""
+    return _find_phrase(alias.split(), _EXERCISE_ALIASES)
+
+def resolve_exercise(name):
+    """Canonical exercise id for a name ("Bodyweight Squats" -> "squats"), or None"""
+    alias = _normalize_exercise_name(name)
+    exercise_id = _EXERCISE_ALIASES.get(alias)
+    return exercise_id if exercise_id is not None else _resolve_alias(alias)
+
+@functools.lru_cache(maxsize=1024)
+def get_exercise_media(name, exercise_type=None):
+    """Media entry {'id', 'name', 'gif_url', 'in_library'} for an exercise name
+    
+    Unknown names fall back to their workout type's GIF, then to a default.
+    """
+    exercise_id = resolve_exercise(name)
+    if exercise_id is not None:
+        return _EXERCISE_MEDIA[exercise_id]
+    gif_url = _find_phrase(_normalize_exercise_name(exercise_type).split(), _WORKOUT_TYPE_MEDIA)
+    return {'id': None, 'name': name, 'gif_url': gif_url or WORKOUT_TYPE_GIFS['default'], 'in_library': False}
+
+_EXERCISE_ALIASES, _EXERCISE_MEDIA, _WORKOUT_TYPE_MEDIA = _build_exercise_media_index()
+# Program names are resolved now so rendering a program only does dict lookups
+_EXERCISE_ALIASES.update({
+    alias: exercise_id
+    for alias, exercise_id in ((_normalize_exercise_name(name), _resolve_alias(_normalize_exercise_name(name)))
+                               for name in _program_exercise_names())
+    if exercise_id is not None
+})
+_resolve_alias.cache_clear()
+
+# ============================================
+# PROGRAM COMPILER
+# ============================================
+# Each program is flattened once into a sessions frame (one row per workout
+# day) and an exercises frame (one row per prescribed exercise, with its
+# canonical id). Muscle coverage, weekly volume, intensity and session time
+# are column aggregations over those frames, so a program written as a plain
+# dict (built-in or user-defined) needs no per-program tables on the page.
+
+# EXERCISE_LIBRARY muscle groups -> the areas shown on the programs page
+MUSCLE_AREAS = {
+    'Quadriceps': ('Legs',), 'Hamstrings': ('Legs',), 'Inner Thighs': ('Legs',), 'Calves': ('Legs',),
+    'Hip Flexors': ('Legs',), 'Legs': ('Legs',),
+    'Glutes': ('Glutes',), 'Hip Abductors': ('Glutes',), 'Hips': ('Glutes',),
+    'Core': ('Core',), 'Abs': ('Core',), 'Obliques': ('Core',),
+    'Back': ('Back',), 'Lower Back': ('Back',), 'Spine': ('Back',),
+    'Chest': ('Chest',),
+    'Shoulders': ('Arms',), 'Triceps': ('Arms',), 'Biceps': ('Arms',), 'Arms': ('Arms',),
+    'Full Body': ('Legs', 'Glutes', 'Core', 'Back', 'Chest', 'Arms'),
+}
+# Session load (1-5) by the workout type named in a day's focus
+SESSION_TYPE_LOAD = {
+    'hiit': 5, 'cardio': 4, 'full body': 3, 'lower body': 3, 'upper body': 3,
+    'core': 2, 'pilates': 2, 'yoga': 1, 'stretching': 1,
+}
+# Words in a day's focus that name a type without using its key
+SESSION_TYPE_WORDS = {
+    'leg': 'lower body', 'lower': 'lower body', 'glute': 'lower body', 'booty': 'lower body',
+    'squat': 'lower body', 'lunge': 'lower body', 'thrust': 'lower body', 'kickback': 'lower body',
+    'upper': 'upper body', 'push': 'upper body', 'arm': 'upper body', 'total': 'full body',
+    'circuit': 'full body', 'metcon': 'hiit', 'emom': 'hiit', 'tabata': 'hiit', 'sprint': 'hiit',
+    'burnout': 'hiit', 'interval': 'hiit', 'endurance': 'cardio', 'flow': 'yoga', 'salutation': 'yoga',
+    'flexibility': 'stretching', 'mobility': 'stretching', 'recovery': 'stretching',
+    'restore': 'stretching', 'relaxation': 'stretching', 'reflection': 'stretching',
+}
+# Muscle groups credited to exercises the library does not know, by session type
+SESSION_TYPE_MUSCLES = {
+    'lower body': ['Quadriceps', 'Glutes', 'Hamstrings'],
+    'upper body': ['Chest', 'Shoulders', 'Triceps', 'Back'],
+    'core': ['Core'], 'pilates': ['Core', 'Glutes'],
+    'hiit': ['Full Body'], 'cardio': ['Full Body'], 'full body': ['Full Body'],
+    'yoga': ['Core', 'Back', 'Hips', 'Hamstrings'], 'stretching': ['Back', 'Hips', 'Hamstrings'],
+}
+DIFFICULTY_LOAD = {'Beginner': 0, 'Intermediate': 0.5, 'Advanced': 1}
+# Working sets a week per intensity step
+WEEKLY_SETS_PER_LEVEL = 20
+# Seconds per rep, per breath, and for prescriptions that give no time at all
+REP_SECONDS = 3
+BREATH_SECONDS = 5
+DEFAULT_WORK_SECONDS = 45
+PROGRAM_FRAME_COLUMNS = ('session', 'name', 'exercise_id', 'sets', 'reps', 'rest')
+
+def _week_span(label):
+    """Number of weeks a schedule block covers ("Week 1-2" -> 2, "Weeks 9-13: ..." -> 5)"""
+    match = re.search(r"(\d+)\s*-\s*(\d+)", label)
+    return int(match.group(2)) - int(match.group(1)) + 1 if match else 1
+
+def _session_type(focus):
+    """Workout type of a day's focus, the most demanding one named ("Legs & Glutes" -> "lower body")"""
+    text = _normalize_exercise_name(focus)
+    named = [key for key in SESSION_TYPE_LOAD if re.search(rf"\b{key}\b", text)]
+    named += [SESSION_TYPE_WORDS[word] for word in text.split() if word in SESSION_TYPE_WORDS]
+    return max(named, key=SESSION_TYPE_LOAD.get, default='full body')
+
+def _seconds(text, default=0):
+    """Seconds in a prescription like "45s", "1 min", "30s on/30s off" or "5 breaths" """
+    text = str(text or '').lower()
+    if 'min' in text and re.search(r"\d", text):
+        return int(re.search(r"(\d+)", text).group(1)) * 60
+    intervals = re.findall(r"(\d+)\s*s\b", text)
+    if intervals:
+        return sum(int(seconds) for seconds in intervals)
+    breaths = re.search(r"(\d+)\s*breath", text)
+    if breaths:
+        return int(breaths.group(1)) * BREATH_SECONDS
+    return default
+
+def _work_seconds(reps):
+    """Estimated seconds of work in one set"""
+    seconds = _seconds(reps)
+    if seconds:
+        return seconds * (2 if 'each' in str(reps) and 'direction' not in str(reps) else 1)
+    count = re.match(r"\s*(\d+)", str(reps))
+    if count:
+        return int(count.group(1)) * REP_SECONDS * (2 if 'each' in str(reps) else 1)
+    return DEFAULT_WORK_SECONDS
+
+def _flatten_program(program):
+    """(sessions, exercises) row lists for a program written with 'schedule' or 'phases'"""
+    blocks = []
+    for week, days in program.get('schedule', {}).items():
+        blocks.extend(('', week, day, data['focus'], data['exercises']) for day, data in days.items())
+    for phase, phase_data in program.get('phases', {}).items():
+        for week, days in phase_data['weeks'].items():
+            blocks.extend((phase, week, day, day.split(' - ', 1)[-1], exercises) for day, exercises in days.items())
+    
+    sessions, exercises = [], []
+    for session, (phase, week, day, focus, day_exercises) in enumerate(blocks):
+        kind = _session_type(focus)
+        sessions.append({'session': session, 'phase': phase, 'week': week, 'weeks': _week_span(week),
+                         'day': day, 'focus': focus, 'type': kind, 'load': SESSION_TYPE_LOAD[kind]})
+        exercises.extend({'session': session, 'name': exercise['name'], 'exercise_id': resolve_exercise(exercise['name']),
+                          'sets': exercise['sets'], 'reps': exercise['reps'], 'rest': exercise['rest']}
+                         for exercise in day_exercises)
+    return sessions, exercises
+
+def compile_program(program):
+    """Flatten a program and derive its profile
+    
+    Returns {'sessions', 'exercises' (DataFrames), 'muscles' {area: % of
+    working sets}, 'weekly_sets', 'session_minutes', 'intensity' (1-5),
+    'library_share'}.
+    """
+    sessions, exercises = _flatten_program(program)
+    sessions = pd.DataFrame(sessions, columns=['session', 'phase', 'week', 'weeks', 'day', 'focus', 'type', 'load'])
+    exercises = pd.DataFrame(exercises, columns=list(PROGRAM_FRAME_COLUMNS))
+    
+    # Sub-items (sets == 0) describe the circuit above them and add no volume
+    exercises['weeks'] = exercises['session'].map(sessions.set_index('session')['weeks'])
+    exercises['volume'] = exercises['sets'] * exercises['weeks']
+    exercises['seconds'] = exercises['sets'] * (exercises['reps'].map(_work_seconds)
+                                                + exercises['rest'].map(_seconds))
+    program_weeks = sessions.drop_duplicates('week')['weeks'].sum() or 1
+    
+    # exercise x area incidence joined to the volume of each prescribed exercise;
+    # exercises the library does not know count for their session's type
+    areas = _exercise_areas()
+    worked = exercises[exercises['volume'] > 0]
+    area_keys = worked['exercise_id'].fillna('type:' + worked['session'].map(sessions.set_index('session')['type']))
+    area_volume = areas.reindex(area_keys).fillna(0).mul(worked['volume'].values, axis=0).sum()
+    total_volume = worked['volume'].sum()
+    known_volume = worked.loc[worked['exercise_id'].notna(), 'volume'].sum()
+    muscles = {area: round(100 * volume / total_volume) for area, volume in area_volume.items() if volume} \
+        if total_volume else {}
+    
+    difficulty = _exercise_difficulty().reindex(area_keys).fillna(0)
+    minutes = exercises.groupby('session')['seconds'].sum().reindex(sessions['session'], fill_value=0) / 60
+    session_weight = sessions['weeks'].values
+    load = (sessions['load'] * session_weight).sum() / session_weight.sum() if len(sessions) else 3
+    effort = (difficulty.values * worked['volume'].values).sum() / total_volume if total_volume else 0
+    weekly_sets = total_volume / program_weeks
+    # Intensity mixes what the days are (HIIT vs yoga), how much is done and how hard the moves are
+    intensity = 0.6 * load + 0.4 * min(5, max(1, weekly_sets / WEEKLY_SETS_PER_LEVEL)) + effort
+    
+    return {
+        'sessions': sessions.assign(minutes=minutes.round().astype(int).values),
+        'exercises': exercises,
+        'muscles': muscles,
+        'weekly_sets': int(round(weekly_sets)),
+        'session_minutes': int(round((minutes.values * session_weight).sum() / session_weight.sum())) if len(sessions) else 0,
+        'intensity': int(min(5, max(1, round(intensity)))),
+        'library_share': known_volume / total_volume if total_volume else 0.0,
+    }
+
+@functools.lru_cache(maxsize=None)
+def _exercise_areas():
+    """Exercise id (or "type:<session type>") x area incidence (0/1)"""
+    muscle_groups = {key: exercise['muscle_groups'] for key, exercise in EXERCISE_LIBRARY.items()}
+    muscle_groups.update(EXERCISE_DEMO_MUSCLES)
+    muscle_groups.update({f"type:{kind}": groups for kind, groups in SESSION_TYPE_MUSCLES.items()})
+    area_names = list(dict.fromkeys(area for areas in MUSCLE_AREAS.values() for area in areas))
+    frame = pd.DataFrame(0.0, index=list(muscle_groups), columns=area_names)
+    for exercise_id, groups in muscle_groups.items():
+        for group in groups:
+            frame.loc[exercise_id, list(MUSCLE_AREAS.get(group, ()))] = 1.0
+    return frame
+
+@functools.lru_cache(maxsize=None)
+def _exercise_difficulty():
+    """Difficulty load (DIFFICULTY_LOAD) by library exercise id"""
+    return pd.Series({key: DIFFICULTY_LOAD.get(exercise.get('difficulty'), 0)
+                      for key, exercise in EXERCISE_LIBRARY.items()})
+
+@functools.lru_cache(maxsize=None)
+def get_program_profile(program_id):
+    """Compiled profile of a built-in program (compiled on first use, then cached)"""
+    return compile_program(GIRLS_WORKOUT_PROGRAMS[program_id])
@@ -0,0 +1,247 @@
+# ============================================
+# YEAR PLAN GENERATOR
+# Builds a training plan (N days x phase / workout type / template) as
+# arrays in one pass, with its own seeded generator: the same start date,
+# length and seed always give the same plan, and the global `random`
+# module is never touched
+# ============================================
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PLAN_SEED = 0
+DEFAULT_PLAN_DAYS = 365
+
+# ============================================
+# WORKOUT TEMPLATES
+# ============================================
+
+WORKOUT_TEMPLATES = {
+    # Lower Body Workouts (Progressive)
+    'lower_body_beginner': [
+        {"name": "Bodyweight Squats & Lunges", "type": "Lower Body", "duration": "25 min", "notes": "3x12 squats, 3x10 lunges each leg"},
+        {"name": "Glute Bridges & Kickbacks", "type": "Lower Body", "duration": "20 min", "notes": "3x15 bridges, 3x12 kickbacks"},
+        {"name": "Wall Sits & Calf Raises", "type": "Lower Body", "duration": "20 min", "notes": "3x30sec wall sit, 3x20 calf raises"},
+    ],
+    'lower_body_intermediate': [
+        {"name": "Sumo Squats & Romanian Deadlifts", "type": "Lower Body", "duration": "35 min", "notes": "4x12 sumo squats, 4x10 RDL with weights"},
+        {"name": "Bulgarian Split Squats", "type": "Lower Body", "duration": "30 min", "notes": "4x10 each leg, add weights"},
+        {"name": "Hip Thrusts & Step Ups", "type": "Lower Body", "duration": "35 min", "notes": "4x15 hip thrusts, 3x12 step ups"},
+        {"name": "Goblet Squats & Leg Press", "type": "Lower Body", "duration": "40 min", "notes": "4x12 goblet, 4x15 leg press"},
+    ],
+    'lower_body_advanced': [
+        {"name": "Barbell Squats & Deadlifts", "type": "Lower Body", "duration": "50 min", "notes": "5x5 squats, 5x5 deadlifts - heavy"},
+        {"name": "Power Leg Day", "type": "Lower Body", "duration": "55 min", "notes": "Jump squats, box jumps, weighted lunges"},
+        {"name": "Glute Destroyer", "type": "Lower Body", "duration": "45 min", "notes": "Heavy hip thrusts, sumo deads, cable kickbacks"},
+        {"name": "Quad & Ham Focus", "type": "Lower Body", "duration": "50 min", "notes": "Front squats, leg curls, leg extensions"},
+    ],
+    # Upper Body Workouts (Progressive)
+    'upper_body_beginner': [
+        {"name": "Push-ups & Arm Circles", "type": "Upper Body", "duration": "20 min", "notes": "Modified push-ups 3x8, arm mobility"},
+        {"name": "Tricep Dips & Wall Push-ups", "type": "Upper Body", "duration": "20 min", "notes": "Chair dips 3x10, wall push 3x12"},
+        {"name": "Resistance Band Arms", "type": "Upper Body", "duration": "25 min", "notes": "Band curls, band rows, band presses"},
+    ],
+    'upper_body_intermediate': [
+        {"name": "Dumbbell Chest & Back", "type": "Upper Body", "duration": "35 min", "notes": "DB press 4x10, rows 4x12, flyes 3x12"},
+        {"name": "Shoulder Sculpt", "type": "Upper Body", "duration": "30 min", "notes": "OHP 4x10, lateral raises 4x12, rear delts"},
+        {"name": "Biceps & Triceps Tone", "type": "Upper Body", "duration": "30 min", "notes": "Curls 4x12, tricep extensions 4x12"},
+        {"name": "Push-Pull Combo", "type": "Upper Body", "duration": "40 min", "notes": "Push-ups, rows, shoulder press circuit"},
+    ],
+    'upper_body_advanced': [
+        {"name": "Heavy Push Day", "type": "Upper Body", "duration": "50 min", "notes": "Bench 5x5, incline DB, dips, tricep work"},
+        {"name": "Heavy Pull Day", "type": "Upper Body", "duration": "50 min", "notes": "Pull-ups, barbell rows, face pulls, curls"},
+        {"name": "Shoulder Power", "type": "Upper Body", "duration": "45 min", "notes": "Military press 5x5, Arnold press, raises"},
+        {"name": "Arm Blast", "type": "Upper Body", "duration": "40 min", "notes": "Supersets: curls + triceps, 21s, drop sets"},
+    ],
+    # Core Workouts (Progressive)
+    'core_beginner': [
+        {"name": "Basic Core Work", "type": "Core", "duration": "15 min", "notes": "Crunches, dead bugs, bird dogs"},
+        {"name": "Plank Challenge", "type": "Core", "duration": "15 min", "notes": "Plank holds, side planks, knee tucks"},
+    ],
+    'core_intermediate': [
+        {"name": "Ab Burner", "type": "Core", "duration": "20 min", "notes": "Bicycle crunches, leg raises, Russian twists"},
+        {"name": "Core Stability", "type": "Core", "duration": "25 min", "notes": "Plank variations, hollow holds, mountain climbers"},
+        {"name": "Pilates Core", "type": "Core", "duration": "30 min", "notes": "Hundred, scissors, roll-ups, teaser"},
+    ],
+    'core_advanced': [
+        {"name": "Intense Ab Circuit", "type": "Core", "duration": "25 min", "notes": "Hanging leg raises, ab wheel, weighted crunches"},
+        {"name": "Functional Core", "type": "Core", "duration": "30 min", "notes": "Turkish get-ups, windmills, loaded carries"},
+    ],
+    # HIIT Workouts (Progressive)
+    'hiit_beginner': [
+        {"name": "Beginner HIIT", "type": "HIIT", "duration": "20 min", "notes": "30s work/30s rest - squats, jacks, marching"},
+        {"name": "Low Impact HIIT", "type": "HIIT", "duration": "25 min", "notes": "Step touches, modified burpees, knee lifts"},
+    ],
+    'hiit_intermediate': [
+        {"name": "Tabata Burn", "type": "HIIT", "duration": "30 min", "notes": "20s on/10s off x 8 rounds, multiple exercises"},
+        {"name": "EMOM Challenge", "type": "HIIT", "duration": "30 min", "notes": "Every minute: 10 burpees, 15 squats"},
+        {"name": "Cardio HIIT", "type": "HIIT", "duration": "35 min", "notes": "High knees, burpees, jump lunges, mountain climbers"},
+    ],
+    'hiit_advanced': [
+        {"name": "Extreme HIIT", "type": "HIIT", "duration": "40 min", "notes": "45s work/15s rest - plyometrics, burpees, sprints"},
+        {"name": "MetCon Madness", "type": "HIIT", "duration": "45 min", "notes": "Metabolic conditioning: AMRAPs and EMOMs"},
+        {"name": "Warrior HIIT", "type": "HIIT", "duration": "40 min", "notes": "Battle ropes, box jumps, kettlebell swings"},
+    ],
+    # Full Body Workouts (Progressive)
+    'full_body_beginner': [
+        {"name": "Full Body Basics", "type": "Full Body", "duration": "30 min", "notes": "Squats, push-ups, lunges, planks"},
+        {"name": "Total Body Tone", "type": "Full Body", "duration": "30 min", "notes": "Light weights, 3 rounds full body circuit"},
+    ],
+    'full_body_intermediate': [
+        {"name": "Full Body Strength", "type": "Full Body", "duration": "45 min", "notes": "Compound movements: squat, press, row, lunge"},
+        {"name": "Circuit Training", "type": "Full Body", "duration": "40 min", "notes": "5 exercises, 4 rounds, 45s each"},
+        {"name": "Dumbbell Full Body", "type": "Full Body", "duration": "45 min", "notes": "Complete workout with dumbbells only"},
+    ],
+    'full_body_advanced': [
+        {"name": "Power Full Body", "type": "Full Body", "duration": "55 min", "notes": "Olympic lifts, compound movements, plyometrics"},
+        {"name": "Athlete Training", "type": "Full Body", "duration": "60 min", "notes": "Sport-specific movements, agility, power"},
+        {"name": "CrossFit Style WOD", "type": "Full Body", "duration": "50 min", "notes": "AMRAP: thrusters, pull-ups, box jumps, row"},
+    ],
+    # Cardio Workouts
+    'cardio': [
+        {"name": "Dance Cardio Party", "type": "Cardio", "duration": "30 min", "notes": "Fun dance moves, choreo combos"},
+        {"name": "Walking Workout", "type": "Cardio", "duration": "40 min", "notes": "Power walking with intervals"},
+        {"name": "Stair Master", "type": "Cardio", "duration": "30 min", "notes": "Stair climbing intervals"},
+        {"name": "Jump Rope Session", "type": "Cardio", "duration": "25 min", "notes": "Intervals: singles, high knees, criss-cross"},
+        {"name": "Cycling Sprint", "type": "Cardio", "duration": "35 min", "notes": "Indoor cycling with sprint intervals"},
+        {"name": "Rowing Endurance", "type": "Cardio", "duration": "30 min", "notes": "500m intervals, technique focus"},
+    ],
+    # Yoga & Flexibility
+    'yoga': [
+        {"name": "Morning Sun Salutations", "type": "Yoga", "duration": "20 min", "notes": "5-10 sun salutation flows"},
+        {"name": "Vinyasa Flow", "type": "Yoga", "duration": "45 min", "notes": "Dynamic flow with breath"},
+        {"name": "Power Yoga", "type": "Yoga", "duration": "50 min", "notes": "Strength-building yoga poses"},
+        {"name": "Yin Yoga", "type": "Yoga", "duration": "45 min", "notes": "Deep stretches, 3-5 min holds"},
+        {"name": "Hip Opening Yoga", "type": "Yoga", "duration": "35 min", "notes": "Focus on hip flexibility"},
+        {"name": "Yoga for Athletes", "type": "Yoga", "duration": "40 min", "notes": "Recovery-focused stretches"},
+    ],
+    # Pilates
+    'pilates': [
+        {"name": "Mat Pilates Basics", "type": "Pilates", "duration": "30 min", "notes": "Classic mat exercises"},
+        {"name": "Pilates Abs Focus", "type": "Pilates", "duration": "25 min", "notes": "Core-intensive Pilates"},
+        {"name": "Pilates Sculpt", "type": "Pilates", "duration": "40 min", "notes": "Full body Pilates with weights"},
+        {"name": "Barre Pilates", "type": "Pilates", "duration": "45 min", "notes": "Ballet-inspired movements"},
+    ],
+    # Recovery & Stretching
+    'recovery': [
+        {"name": "Active Recovery", "type": "Stretching", "duration": "20 min", "notes": "Light movement, foam rolling"},
+        {"name": "Deep Stretch", "type": "Stretching", "duration": "30 min", "notes": "Full body stretch sequence"},
+        {"name": "Foam Rolling", "type": "Stretching", "duration": "20 min", "notes": "Self-myofascial release"},
+        {"name": "Mobility Flow", "type": "Stretching", "duration": "25 min", "notes": "Joint mobility exercises"},
+    ],
+}
+
+# Every template gets a stable integer id: its position in this list
+TEMPLATES = [template for pool in WORKOUT_TEMPLATES.values() for template in pool]
+TEMPLATE_FRAME = pd.DataFrame(TEMPLATES)
+WORKOUT_FIELDS = ('name', 'type', 'duration', 'notes')
+
+def _pool_ids():
+    """Pool name -> ids of its templates"""
+    ids, start = {}, 0
+    for pool, templates in WORKOUT_TEMPLATES.items():
+        ids[pool] = list(range(start, start + len(templates)))
+        start += len(templates)
+    return ids
+
+POOL_IDS = _pool_ids()
+
+# ============================================
+# PHASES + WEEKLY SPLIT
+# ============================================
+
+PHASES = ('foundation', 'beginner', 'intermediate', 'advanced', 'peak')
+# Last week of each phase; everything after week 40 is 'peak'
+PHASE_LAST_WEEKS = (4, 12, 26, 40)
+INTERMEDIATE = PHASES.index('intermediate')
+
+# Monday lower body, Tuesday HIIT, Wednesday upper body, Friday full body;
+# Thursday (yoga/Pilates) and Saturday (cardio) rotate by week, Sunday is rest
+WEEKDAY_FAMILIES = {0: 'lower_body', 1: 'hiit', 2: 'upper_body', 4: 'full_body'}
+CORE_WEEKDAYS = (0, 4)
+
+def _progression(family):
+    """Candidate template ids for each phase of a progressive family"""
+    beginner, intermediate, advanced = (POOL_IDS[f"{family}_{level}"] for level in ('beginner', 'intermediate', 'advanced'))
+    return [beginner, beginner + intermediate[:1], intermediate, intermediate + advanced, intermediate + advanced]
+
+def _build_slots():
+    """(candidates table, candidates per slot, weekday x phase -> slot, named slots)
+
+    A slot is one list of candidate templates; a day's workout is a uniform
+    draw from its slot.
+    """
+    slots, by_day = [], np.full((7, len(PHASES)), -1)
+    for weekday, family in WEEKDAY_FAMILIES.items():
+        for phase, ids in enumerate(_progression(family)):
+            by_day[weekday, phase] = len(slots)
+            slots.append(ids)
+    named = {}
+    for name, ids in (('recovery', POOL_IDS['recovery']), ('yoga', POOL_IDS['yoga']),
+                      ('pilates', POOL_IDS['pilates']), ('cardio', POOL_IDS['cardio']),
+                      ('core_intermediate', POOL_IDS['core_beginner'] + POOL_IDS['core_intermediate']),
+                      ('core_advanced', POOL_IDS['core_intermediate'] + POOL_IDS['core_advanced'])):
+        named[name] = len(slots)
+        slots.append(ids)
+    
+    sizes = np.array([len(ids) for ids in slots])
+    table = np.zeros((len(slots), sizes.max()), dtype=np.int64)
+    for slot, ids in enumerate(slots):
+        table[slot, :len(ids)] = ids
+    return table, sizes, by_day, named
+
+SLOT_CANDIDATES, SLOT_SIZES, SLOTS_BY_DAY, NAMED_SLOTS = _build_slots()
+
+# ============================================
+# GENERATOR
+# ============================================
+
+def generate_plan(start_date, days=DEFAULT_PLAN_DAYS, seed=DEFAULT_PLAN_SEED):
+    """Plan for `days` days from start_date, one row per workout
+
+    Columns: date ('%Y-%m-%d'), day (offset from start), week, phase,
+    template (id into TEMPLATES), name, type, duration, notes.
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(start_date).normalize()
+    day = np.arange(days)
+    weekday = (start.weekday() + day) % 7
+    week = day // 7 + 1
+    phase = np.searchsorted(PHASE_LAST_WEEKS, week)
+    
+    slot = SLOTS_BY_DAY[weekday, phase]
+    slot = np.where(weekday == 3, np.select([week % 4 == 0, week % 2 == 0],
+                                            [NAMED_SLOTS['recovery'], NAMED_SLOTS['yoga']], NAMED_SLOTS['pilates']), slot)
+    slot = np.where(weekday == 5, np.where(week % 3 == 0, NAMED_SLOTS['recovery'], NAMED_SLOTS['cardio']), slot)
+    # Core finisher on Monday/Friday of even weeks, from the intermediate phase on
+    core = np.where((phase >= INTERMEDIATE) & np.isin(weekday, CORE_WEEKDAYS) & (week % 2 == 0),
+                    np.where(phase == INTERMEDIATE, NAMED_SLOTS['core_intermediate'], NAMED_SLOTS['core_advanced']), -1)
+    
+    # One draw per day for the main workout and one for the core finisher
+    rows = np.concatenate([day, day])
+    slots = np.concatenate([slot, core])
+    draws = rng.random(2 * days)
+    keep = slots >= 0
+    rows, slots, draws = rows[keep], slots[keep], draws[keep]
+    order = np.argsort(rows, kind='stable')
+    rows, slots, draws = rows[order], slots[order], draws[order]
+    template = SLOT_CANDIDATES[slots, (draws * SLOT_SIZES[slots]).astype(np.int64)]
+    
+    plan = pd.DataFrame({
+        'date': (start + pd.to_timedelta(rows, unit='D')).strftime('%Y-%m-%d'),
+        'day': rows,
+        'week': week[rows],
+        'phase': pd.Categorical.from_codes(phase[rows], PHASES),
+        'template': template,
+    })
+    return plan.join(TEMPLATE_FRAME, on='template')
+
+def plan_entries(plan, completed_before=None):
+    """(date_str, workout) pairs for utils.add_workouts_to_calendar_bulk()
+
+    Workouts dated before completed_before ('%Y-%m-%d') are marked completed.
+    """
+    dates = plan['date'].tolist()
+    columns = [plan[field].tolist() for field in WORKOUT_FIELDS]
+    return [(date_str, dict(zip(WORKOUT_FIELDS, values), completed=bool(completed_before) and date_str < completed_before))
+            for date_str, *values in zip(dates, *columns)]